@@ -0,0 +1,113 @@
+"""
+fingerprint 계산 마이크로벤치마크
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.fingerprints
+    python -m benchmarks.fingerprints --ips 20000 --calls 200000
+
+- legacy 모드 결과가 예전 구현(datetime.now().strftime + SHA-256 + 단어 1개)과 같은지 확인
+- 호출당 시간: 예전 구현(reference) / legacy / keyed-<단어 수>, 캐시 적중과 미스(처음 보는 IP)
+- 같은 분에 서로 다른 IP N개가 다른 사용자와 같은 fingerprint를 받는 비율
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import override_settings  # noqa: E402
+
+from boards import fingerprints  # noqa: E402
+from boards.fingerprints import WORDLIST, get_user_fingerprint  # noqa: E402
+
+
+def reference_fingerprint(ip_address, timestamp=None):
+    """예전 boards.utils.get_user_fingerprint (mnemonic 패키지 대신 같은 단어 목록 사용)"""
+    if timestamp is None:
+        timestamp = datetime.now()
+    time_key = timestamp.strftime('%Y%m%d%H%M')
+    hash_digest = hashlib.sha256(f"{ip_address}:{time_key}".encode()).digest()
+    return WORDLIST[int.from_bytes(hash_digest[:2], byteorder='big') % 2048]
+
+
+def random_ips(rng, count):
+    return [
+        f'{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}'
+        for _ in range(count)
+    ]
+
+
+def clear_caches():
+    fingerprints._keyed_fingerprint.cache_clear()
+    fingerprints._legacy_fingerprint.cache_clear()
+
+
+def per_call_us(func, ips, calls, cold):
+    """cold면 처음 보는 IP만 호출해 분이 바뀐 직후(모두 캐시 미스)를 흉내냄"""
+    if cold:
+        sample = random_ips(random.Random(calls), calls)
+    else:
+        sample = [ips[i % len(ips)] for i in range(calls)]
+    clear_caches()
+    if not cold:
+        for ip in ips:
+            func(ip)
+    started = time.perf_counter()
+    for ip in sample:
+        func(ip)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def check_legacy(ips):
+    with override_settings(FINGERPRINT_MODE='legacy'):
+        now = datetime.now()
+        for ip in ips:
+            for timestamp in (None, now, now - timedelta(minutes=1), datetime(2024, 2, 29, 23, 59)):
+                if get_user_fingerprint(ip, timestamp) != reference_fingerprint(ip, timestamp):
+                    raise SystemExit(f'legacy 결과 불일치: {ip} {timestamp}')
+    print(f'legacy 모드 결과 일치: IP {len(ips):,}개 x 시각 4개')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='fingerprint 마이크로벤치마크')
+    parser.add_argument('--ips', type=int, default=5000, help='서로 다른 IP 수')
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    ips = random_ips(random.Random(args.seed), args.ips)
+    check_legacy(ips[:1000])
+
+    modes = [('reference', None, None)]
+    modes.append(('legacy', 'legacy', 1))
+    modes += [(f'keyed-{words}', 'keyed', words) for words in (1, 2, 3)]
+
+    print(f"\n{'mode':12} {'hit us':>8} {'miss us':>8} {'collide %':>10}")
+    for name, mode, words in modes:
+        if mode is None:
+            func = reference_fingerprint
+            hit = miss = per_call_us(func, ips, args.calls, cold=False)
+            collide_mode = ('legacy', 1)
+        else:
+            with override_settings(FINGERPRINT_MODE=mode, FINGERPRINT_WORDS=words):
+                hit = per_call_us(get_user_fingerprint, ips, args.calls, cold=False)
+                miss = per_call_us(get_user_fingerprint, ips, args.calls, cold=True)
+            collide_mode = (mode, words)
+        with override_settings(FINGERPRINT_MODE=collide_mode[0], FINGERPRINT_WORDS=collide_mode[1]):
+            counts = Counter(get_user_fingerprint(ip) for ip in ips)
+        collide = sum(n for n in counts.values() if n > 1) / len(ips) * 100
+        print(f'{name:12} {hit:>8.2f} {miss:>8.2f} {collide:>10.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
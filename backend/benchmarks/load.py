@@ -0,0 +1,227 @@
+"""
+실행 중인 서버에 HTTP 부하를 걸어 처리량(req/s)과 지연시간을 측정
+
+    python -m benchmarks.load --url http://localhost:8000
+    python -m benchmarks.load --url http://localhost:8000 --concurrency 64 --duration 30 \\
+        --scenario post_list --scenario post_detail
+    python -m benchmarks.load --subscribers 2000 --scenario board_list   # SSE 유휴 구독자를 붙인 채로
+
+Django를 import하지 않는 독립 스크립트라 서버와 다른 머신에서도 실행할 수 있다.
+스레드마다 keep-alive 연결 하나를 유지하며 요청을 반복한다.
+"""
+import argparse
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+@scenario('board_list')
+def board_list(rng, ctx):
+    return '/api/boards/'
+
+
+@scenario('post_list')
+def post_list(rng, ctx):
+    """앞쪽(캐시되는) 페이지와 뒤쪽 페이지를 섞어서 조회"""
+    page = rng.randint(1, 3) if rng.random() < 0.7 else rng.randint(4, ctx['pages'])
+    return f'/api/posts/?board_type=free&page={page}'
+
+
+@scenario('post_detail')
+def post_detail(rng, ctx):
+    return f"/api/posts/{rng.choice(ctx['post_ids'])}/"
+
+
+@scenario('post_search')
+def post_search(rng, ctx):
+    return '/api/posts/search/?q=' + rng.choice(['%EB%96%A1%EC%83%81', '%ED%9B%84%EA%B8%B0'])
+
+
+def fetch_json(base, path):
+    parts = urlsplit(base)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    conn.request('GET', path)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    if response.status != 200:
+        raise SystemExit(f'{path}: HTTP {response.status}')
+    return json.loads(body)
+
+
+def prepare(base, max_pages):
+    """상세 조회에 쓸 게시글 id와 목록 페이지 수 수집"""
+    first = fetch_json(base, '/api/posts/?board_type=free')
+    page_size = max(len(first['results']), 1)
+    pages = max(1, min(max_pages, (first.get('count') or page_size) // page_size))
+    post_ids = [post['id'] for post in first['results']]
+    for page in random.Random(0).sample(range(2, pages + 1), min(10, pages - 1)):
+        post_ids += [post['id'] for post in fetch_json(base, f'/api/posts/?board_type=free&page={page}')['results']]
+    if not post_ids:
+        raise SystemExit('게시글이 없습니다. generate_load_data로 데이터를 먼저 만드세요.')
+    return {'pages': pages, 'post_ids': post_ids}
+
+
+def worker(base, make_path, ctx, deadline, measure_from, seed, results):
+    parts = urlsplit(base)
+    rng = random.Random(seed)
+    conn = None
+    latencies, errors = [], 0
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        path = make_path(rng, ctx)
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            started = time.perf_counter()
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            elapsed = time.perf_counter() - started
+            ok = response.status < 400
+            if response.getheader('Connection', '').lower() == 'close':
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException):
+            ok, elapsed = False, 0.0
+            if conn is not None:
+                conn.close()
+            conn = None
+        if started < measure_from:
+            continue
+        if ok:
+            latencies.append(elapsed)
+        else:
+            errors += 1
+    if conn is not None:
+        conn.close()
+    results.append((latencies, errors))
+
+
+def open_subscribers(base, count, board_type='free'):
+    """
+    이벤트 스트림(SSE)을 count개 열어 둔다 (응답 헤더를 받을 때까지 대기)
+    반환값: (소켓 목록, 연결에 실패한 수)
+    """
+    parts = urlsplit(base)
+    request = (
+        f'GET /api/events/boards/{board_type}/ HTTP/1.1\r\n'
+        f'Host: {parts.netloc}\r\nAccept: text/event-stream\r\n\r\n'
+    ).encode()
+    sockets, failed = [], 0
+    for _ in range(count):
+        try:
+            sock = socket.create_connection((parts.hostname, parts.port or 80), timeout=30)
+            sock.sendall(request)
+            sockets.append(sock)
+        except OSError:
+            failed += 1
+    for sock in list(sockets):
+        try:
+            if not sock.recv(4096).startswith(b'HTTP/1.1 200'):
+                raise OSError
+        except OSError:
+            sockets.remove(sock)
+            sock.close()
+            failed += 1
+    return sockets, failed
+
+
+def run_scenario(base, name, ctx, concurrency, duration, warmup):
+    results = []
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(base, SCENARIOS[name], ctx, deadline, measure_from, i, results),
+        )
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies = sorted(l for thread_latencies, _ in results for l in thread_latencies)
+    errors = sum(e for _, e in results)
+
+    def pct(p):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / duration, 1),
+        'p50_ms': round(pct(50), 2),
+        'p95_ms': round(pct(95), 2),
+        'p99_ms': round(pct(99), 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HTTP 부하 테스트')
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='여러 번 지정 가능 (기본: post_list, post_detail)')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=20, help='측정 시간(초)')
+    parser.add_argument('--warmup', type=float, default=3, help='측정 전 예열 시간(초)')
+    parser.add_argument('--max-pages', type=int, default=100, help='post_list가 조회할 최대 페이지')
+    parser.add_argument('--subscribers', type=int, default=0,
+                        help='측정 동안 열어 둘 SSE 구독 연결 수 (ulimit -n 확인)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    base = args.url.rstrip('/')
+    ctx = prepare(base, args.max_pages)
+    subscribers = []
+    if args.subscribers:
+        started = time.perf_counter()
+        subscribers, failed = open_subscribers(base, args.subscribers)
+        print(
+            f'SSE 구독 {len(subscribers)}개 연결 ({time.perf_counter() - started:.1f}초), '
+            f'실패 {failed}개'
+        )
+    results = {}
+    print(f"{'scenario':16} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name in args.scenario or ['post_list', 'post_detail']:
+        r = results[name] = run_scenario(
+            base, name, ctx, args.concurrency, args.duration, args.warmup
+        )
+        print(
+            f"{name:16} {r['rps']:>9.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+            f"{r['p99_ms']:>8.2f} {r['errors']:>7}"
+        )
+    for sock in subscribers:
+        sock.close()
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'url': base,
+                'concurrency': args.concurrency,
+                'subscribers': len(subscribers),
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
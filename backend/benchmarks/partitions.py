@@ -0,0 +1,211 @@
+"""
+월별 파티션 벤치마크 (PostgreSQL 전용)
+
+backend 디렉토리에서 실행:
+    BENCH_BACKEND=postgres python -m benchmarks.partitions
+    BENCH_BACKEND=postgres python -m benchmarks.partitions --rows 2000000 --months 36
+
+별도 스키마(bench_partitions)에 boards_post와 같은 인덱스를 가진 일반 테이블과
+월별 파티션 테이블을 만들고 같은 데이터를 넣은 뒤 비교한다. (끝나면 스키마 삭제)
+- 인덱스 크기: 전체 / 최근 달 파티션 (최근 글 조회와 쓰기가 건드리는 부분)
+- 한 행 INSERT 지연시간 p50/p99 (커밋 포함)
+- id 조회: 일반 테이블 / 파티션에 id만 / 파티션에 id + created_at 범위 (boards.partitions 방식)
+- 최근 글 조회수 UPDATE 후 VACUUM 시간: 일반 테이블 전체 / 최근 달 파티션
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+SCHEMA = 'bench_partitions'
+
+COLUMNS = """
+    id bigint NOT NULL,
+    board_id integer NOT NULL,
+    title varchar(200) NOT NULL,
+    content text NOT NULL,
+    author_fingerprint varchar(32) NOT NULL,
+    upvote_count integer NOT NULL,
+    view_count integer NOT NULL,
+    hot_score double precision NOT NULL,
+    created_at timestamptz NOT NULL
+"""
+
+# boards.models.Post.Meta.indexes와 같은 구성
+INDEXES = [
+    '(created_at DESC, id DESC)',
+    '(board_id, created_at DESC, id DESC)',
+    '(upvote_count DESC, created_at DESC, id DESC)',
+    '(board_id, upvote_count DESC, created_at DESC, id DESC)',
+    '(hot_score DESC, id DESC)',
+    '(board_id, hot_score DESC, id DESC)',
+    '(author_fingerprint, created_at DESC, id DESC)',
+]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def month_range(value):
+    """value가 속한 달 (시작, 끝) - 계획 단계에서 파티션을 고르려면 상수여야 함 (now() + interval은 안 됨)"""
+    start = value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start, end
+
+
+def timed(cursor, sql, params=None):
+    started = time.perf_counter()
+    cursor.execute(sql, params)
+    if cursor.description:
+        cursor.fetchall()
+    return (time.perf_counter() - started) * 1000
+
+
+def create_tables(cursor, rows, months):
+    cursor.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+    cursor.execute(f'CREATE SCHEMA {SCHEMA}')
+    cursor.execute(f'CREATE TABLE {SCHEMA}.plain ({COLUMNS}, PRIMARY KEY (id))')
+    cursor.execute(
+        f'CREATE TABLE {SCHEMA}.parted ({COLUMNS}, PRIMARY KEY (id, created_at)) '
+        f'PARTITION BY RANGE (created_at)'
+    )
+    # 이번 달 포함 months달 + 다음 달 (INSERT 측정용)
+    cursor.execute("SELECT date_trunc('month', now())")
+    current = cursor.fetchone()[0]
+    for offset in range(-(months - 1), 2):
+        cursor.execute(
+            f"CREATE TABLE {SCHEMA}.parted_{offset + months:03d} PARTITION OF {SCHEMA}.parted "
+            f"FOR VALUES FROM (%s::timestamptz + %s * interval '1 month') "
+            f"TO (%s::timestamptz + %s * interval '1 month')",
+            [current, offset, current, offset + 1]
+        )
+
+    # months달에 고르게 퍼진 글 (id 순서 = 작성 순서)
+    cursor.execute(f"""
+        INSERT INTO {SCHEMA}.plain
+        SELECT g, g %% 2 + 1, md5(g::text), repeat(md5(g::text), 8), left(md5((g * 7)::text), 12),
+               (random() * 200)::int, (random() * 5000)::int, random() * 100,
+               %s::timestamptz - (%s - 1) * interval '1 month'
+                 + (g - 1) * ((now() - (%s::timestamptz - (%s - 1) * interval '1 month')) / %s)
+        FROM generate_series(1, %s) g
+    """, [current, months, current, months, rows, rows])
+    cursor.execute(f'INSERT INTO {SCHEMA}.parted SELECT * FROM {SCHEMA}.plain')
+    for table in ('plain', 'parted'):
+        for i, columns in enumerate(INDEXES):
+            cursor.execute(f'CREATE INDEX {table}_idx{i} ON {SCHEMA}.{table} {columns}')
+        cursor.execute(f'VACUUM ANALYZE {SCHEMA}.{table}')
+    # 이번 달 파티션
+    return f'parted_{months:03d}'
+
+
+def index_sizes(cursor, newest):
+    cursor.execute(f"""
+        SELECT
+            pg_indexes_size('{SCHEMA}.plain'),
+            (SELECT sum(pg_indexes_size(i.inhrelid)) FROM pg_inherits i
+             WHERE i.inhparent = '{SCHEMA}.parted'::regclass),
+            pg_indexes_size('{SCHEMA}.{newest}')
+    """)
+    return [int(size) / 2 ** 20 for size in cursor.fetchone()]
+
+
+def bench_inserts(cursor, rows, count):
+    """두 테이블에 번갈아 한 행씩 INSERT (autocommit이라 문장마다 커밋)"""
+    sql = f"""
+        INSERT INTO {SCHEMA}.{{table}} VALUES (
+            %s, 1, 'title', repeat('content ', 40), 'fingerprint',
+            0, 0, random() * 100, now()
+        )
+    """
+    results = {'plain': [], 'parted': []}
+    for i in range(count):
+        for table in results:
+            results[table].append(timed(cursor, sql.format(table=table), [rows + i + 1]))
+    return results
+
+
+def bench_lookups(cursor, rows, count, seed):
+    rng = random.Random(seed)
+    ids = [rng.randint(1, rows) for _ in range(count)]
+    cursor.execute(f'SELECT id, created_at FROM {SCHEMA}.plain WHERE id = ANY(%s)', [ids])
+    created = dict(cursor.fetchall())
+    queries = {
+        'plain': (f'SELECT * FROM {SCHEMA}.plain WHERE id = %s', lambda pk: [pk]),
+        'parted id': (f'SELECT * FROM {SCHEMA}.parted WHERE id = %s', lambda pk: [pk]),
+        'parted id+range': (
+            f'SELECT * FROM {SCHEMA}.parted WHERE id = %s AND created_at >= %s AND created_at < %s',
+            lambda pk: [pk, *month_range(created[pk])]
+        ),
+    }
+    return {
+        name: [timed(cursor, sql, params(pk)) for pk in ids]
+        for name, (sql, params) in queries.items()
+    }
+
+
+def bench_vacuum(cursor, newest):
+    """최근 글 조회수 반영(UPDATE)으로 생긴 죽은 튜플을 VACUUM하는 시간"""
+    results = {}
+    for name, target in (('plain', 'plain'), ('parted newest', newest)):
+        cursor.execute(f"""
+            UPDATE {SCHEMA}.{target} SET view_count = view_count + 1
+            WHERE created_at >= now() - interval '3 days'
+        """)
+        results[name] = timed(cursor, f'VACUUM {SCHEMA}.{target}')
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='월별 파티션 벤치마크')
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--inserts', type=int, default=1000)
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keep', action='store_true', help='끝난 뒤 스키마를 지우지 않음')
+    args = parser.parse_args(argv)
+
+    if connection.vendor != 'postgresql':
+        print('PostgreSQL에서만 실행할 수 있습니다. (BENCH_BACKEND=postgres)')
+        return 1
+
+    with connection.cursor() as cursor:
+        started = time.monotonic()
+        newest = create_tables(cursor, args.rows, args.months)
+        print(f'글 {args.rows:,}개 / {args.months}달 준비 ({time.monotonic() - started:.1f}초)')
+
+        plain, parted, recent = index_sizes(cursor, newest)
+        print(f"\n인덱스 크기 MB: 일반 {plain:.1f} / 파티션 전체 {parted:.1f} / 최근 달 {recent:.1f}")
+
+        print(f"\n{'INSERT':18} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, values in bench_inserts(cursor, args.rows, args.inserts).items():
+            print(f'{name:18} {percentile(values, 50):>8.3f} {percentile(values, 99):>8.3f}')
+
+        print(f"\n{'id 조회':18} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+        for name, values in bench_lookups(cursor, args.rows, args.lookups, args.seed).items():
+            print(f'{name:18} {percentile(values, 50):>8.3f} {percentile(values, 99):>8.3f} '
+                  f'{statistics.mean(values):>8.3f}')
+
+        print('\nVACUUM (최근 3일 글 UPDATE 후)')
+        for name, elapsed in bench_vacuum(cursor, newest).items():
+            print(f'{name:18} {elapsed:>8.1f} ms')
+
+        if not args.keep:
+            cursor.execute(f'DROP SCHEMA {SCHEMA} CASCADE')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+목록 응답 형식별 크기/CPU 벤치마크
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.payloads
+    python -m benchmarks.payloads --sizes 20 50 100 --repeat 200
+
+최신 글 목록 페이지(PostListSerializer)를 크기별로 한 번 읽어 두고 (DB 시간 제외)
+- 직렬화: serializer.data 시간
+- 형식별(DRF JSON / orjson JSON / MessagePack / columnar JSON / columnar MessagePack):
+  렌더링 시간, 본문 바이트, gzip/brotli 압축 후 바이트와 압축 시간 (settings의 수준 그대로)
+시간은 repeat회 중 중앙값(ms)
+"""
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import time
+
+import brotli
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.run import prepare_data  # noqa: E402
+from boards.models import Post  # noqa: E402
+from boards.renderers import (  # noqa: E402
+    ColumnarJSONRenderer, ColumnarMessagePackRenderer, FastJSONRenderer, MessagePackRenderer
+)
+from boards.serializers import PostListSerializer  # noqa: E402
+
+FORMATS = {
+    'json (DRF)': JSONRenderer(),
+    'json (orjson)': FastJSONRenderer(),
+    'msgpack': MessagePackRenderer(),
+    'columnar json': ColumnarJSONRenderer(),
+    'columnar msgpack': ColumnarMessagePackRenderer(),
+}
+
+
+def median_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def page_data(size):
+    """PostPagination 응답과 같은 모양 (next/previous는 실제와 비슷한 길이의 URL)"""
+    posts = list(Post.objects.select_related('board').order_by('-created_at', '-id')[:size])
+    return posts, {
+        'next': f'http://localhost:8000/api/posts/?page=2&page_size={size}',
+        'previous': None,
+        'results': PostListSerializer(posts, many=True).data,
+    }
+
+
+def compress_gzip(body):
+    return gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL, mtime=0)
+
+
+def compress_brotli(body):
+    return brotli.compress(body, quality=settings.RESPONSE_BROTLI_QUALITY)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='목록 응답 형식별 크기/CPU 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--posts', type=int, default=20000, help='필요한 최소 게시글 수')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    prepare_data(args.posts, 0, args.seed)
+    print(f"gzip {settings.RESPONSE_GZIP_LEVEL} / brotli {settings.RESPONSE_BROTLI_QUALITY}, "
+          f"중앙값 {args.repeat}회")
+    for size in args.sizes:
+        posts, data = page_data(size)
+        serialize = median_ms(lambda: PostListSerializer(posts, many=True).data, args.repeat)
+        print(f"\n{size}개 페이지 - 직렬화 {serialize:.3f} ms")
+        print(f"{'형식':18} {'렌더 ms':>8} {'bytes':>8} {'gzip':>7} {'gzip ms':>8} "
+              f"{'br':>7} {'br ms':>7}")
+        for name, renderer in FORMATS.items():
+            body = renderer.render(data)
+            render = median_ms(lambda: renderer.render(data), args.repeat)
+            gzip_ms = median_ms(lambda: compress_gzip(body), args.repeat)
+            brotli_ms = median_ms(lambda: compress_brotli(body), args.repeat)
+            print(f"{name:18} {render:>8.3f} {len(body):>8,} {len(compress_gzip(body)):>7,} "
+                  f"{gzip_ms:>8.3f} {len(compress_brotli(body)):>7,} {brotli_ms:>7.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""
+boards API 핫패스 벤치마크
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.run                         # SQLite + locmem (서버 불필요)
+    BENCH_BACKEND=postgres python -m benchmarks.run  # 로컬 PostgreSQL + Redis
+    python -m benchmarks.run --save-baseline         # 결과를 기준값으로 저장
+    python -m benchmarks.run --only post_list        # 이름에 post_list가 들어간 시나리오만
+
+시나리오마다 p50/p95/p99 지연시간, 요청당 쿼리 수, 요청당 메모리 할당 최대치를 측정하고
+benchmarks/baselines/<backend>.json과 비교해 기준보다 느려지면 종료 코드 1을 반환한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.cache import cache  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from boards.models import Board, Comment, Post  # noqa: E402
+
+BASELINE_DIR = Path(__file__).resolve().parent / 'baselines'
+SCENARIOS = []
+
+
+def scenario(name, iterations=None, threads=1):
+    """벤치마크 시나리오 등록 (함수는 context를 받아 요청 1회를 수행하는 callable을 반환)"""
+    def register(func):
+        SCENARIOS.append({
+            'name': name, 'setup': func, 'iterations': iterations, 'threads': threads,
+        })
+        return func
+    return register
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def client(ip='10.0.0.1'):
+    return Client(REMOTE_ADDR=ip)
+
+
+def expect_ok(response):
+    if response.status_code >= 400:
+        raise RuntimeError(f"{response.status_code}: {response.content[:200]!r}")
+    return response
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+@scenario('board_list')
+def board_list(ctx):
+    c = client()
+    return lambda: expect_ok(c.get('/api/boards/'))
+
+
+def _post_list(sort, page):
+    def setup(ctx):
+        c = client()
+        params = {'board_type': 'free', 'sort': sort, 'page': page}
+        return lambda: expect_ok(c.get('/api/posts/', params))
+    return setup
+
+
+def _post_list_cursor(sort, depth):
+    """keyset 커서로 depth 페이지까지 이동해 둔 뒤 그 페이지를 반복 조회"""
+    def setup(ctx):
+        c = client()
+        url = f'/api/posts/?board_type=free&sort={sort}&pagination=cursor'
+        for _ in range(depth - 1):
+            url = expect_ok(c.get(url)).json()['next'] or url
+        return lambda: expect_ok(c.get(url))
+    return setup
+
+
+for _sort in ('recent', 'popular'):
+    for _page in (1, 10, 100):
+        scenario(f'post_list_{_sort}_page{_page}')(_post_list(_sort, _page))
+    scenario(f'post_list_{_sort}_cursor100')(_post_list_cursor(_sort, 100))
+
+
+@scenario('post_search')
+def post_search(ctx):
+    c = client()
+    return lambda: expect_ok(c.get('/api/posts/search/', {'q': '비트코인 떡상'}))
+
+
+@scenario('post_search_with_comments')
+def post_search_with_comments(ctx):
+    c = client()
+    return lambda: expect_ok(c.get('/api/posts/search/', {'q': '존버', 'scope': 'all'}))
+
+
+@scenario('post_detail_many_comments')
+def post_detail_many_comments(ctx):
+    c = client()
+    post_id = ctx['big_post_id']
+    return lambda: expect_ok(c.get(f'/api/posts/{post_id}/'))
+
+
+@scenario('post_detail_not_modified')
+def post_detail_not_modified(ctx):
+    """ETag를 가진 클라이언트의 재검증 (304, 조회수 기록은 그대로)"""
+    c = client()
+    url = f"/api/posts/{ctx['big_post_id']}/"
+    etag = expect_ok(c.get(url))['ETag']
+    return lambda: expect_ok(c.get(url, HTTP_IF_NONE_MATCH=etag))
+
+
+@scenario('post_list_not_modified')
+def post_list_not_modified(ctx):
+    c = client()
+    params = {'board_type': 'free', 'sort': 'recent', 'page': 1}
+    etag = expect_ok(c.get('/api/posts/', params))['ETag']
+    return lambda: expect_ok(c.get('/api/posts/', params, HTTP_IF_NONE_MATCH=etag))
+
+
+@scenario('post_comments_page', iterations=200)
+def post_comments_page(ctx):
+    c = client()
+    post_id = ctx['big_post_id']
+    first = expect_ok(c.get(f'/api/posts/{post_id}/')).json()['comments_cursor']
+    url = f'/api/posts/{post_id}/comments/?cursor={first}'
+    return lambda: expect_ok(c.get(url))
+
+
+@scenario('vote_toggle_concurrent', threads=8)
+def vote_toggle(ctx):
+    post_id = ctx['hot_post_id']
+    local = threading.local()
+    counter = iter(range(10 ** 9))
+
+    def run():
+        if not hasattr(local, 'client'):
+            n = next(counter)
+            local.client = client(f'10.1.{n // 250}.{n % 250}')
+        return expect_ok(local.client.post(
+            f'/api/posts/{post_id}/vote/', {'vote_type': 1}, content_type='application/json'
+        ))
+    return run
+
+
+@scenario('comment_create', iterations=200)
+def comment_create(ctx):
+    c = client()
+    post_id = ctx['hot_post_id']
+    body = {'content': '벤치마크 댓글', 'author_name': 'bench', 'password': '1234'}
+    return lambda: expect_ok(c.post(
+        f'/api/posts/{post_id}/comment/', body, content_type='application/json'
+    ))
+
+
+@scenario('comment_create_concurrent', iterations=100, threads=8)
+def comment_create_concurrent(ctx):
+    """비밀번호 KDF가 동시 쓰기 처리량을 얼마나 깎는지 (PASSWORD_HASH_WORKERS로 동시 계산 수 제한)"""
+    post_id = ctx['hot_post_id']
+    local = threading.local()
+    body = {'content': '벤치마크 댓글', 'author_name': 'bench', 'password': '1234'}
+
+    def run():
+        if not hasattr(local, 'client'):
+            local.client = client()
+        return expect_ok(local.client.post(
+            f'/api/posts/{post_id}/comment/', body, content_type='application/json'
+        ))
+    return run
+
+
+# ---------------------------------------------------------------------------
+# 데이터 준비 / 측정
+# ---------------------------------------------------------------------------
+
+def prepare_data(posts, big_comments, seed):
+    """벤치마크용 데이터 (local은 매번 새로, postgres는 부족할 때만 생성)"""
+    if settings.BENCH_BACKEND == 'local':
+        connection.close()
+        Path(settings.DATABASES['default']['NAME']).unlink(missing_ok=True)
+    call_command('migrate', verbosity=0)
+    for board_type, name, order in (('free', '자유게시판', 1), ('news', '뉴스', 2)):
+        Board.objects.get_or_create(board_type=board_type, defaults={'name': name, 'order': order})
+
+    existing = Post.objects.count()
+    if existing < posts:
+        print(f"데이터 생성: 게시글 {posts - existing:,}개 ...")
+        call_command(
+            'generate_load_data', posts=posts - existing, seed=seed,
+            batch_size=2000, stdout=open(os.devnull, 'w'),
+        )
+
+    free = Board.objects.get(board_type='free')
+    big = Post.objects.filter(title='[bench] 댓글 많은 글').first()
+    if big is None:
+        big = Post.objects.create(
+            board=free, title='[bench] 댓글 많은 글', content='bench', author_name='bench',
+            password_hash='-', author_fingerprint='bench',
+        )
+        Comment.objects.bulk_create(
+            [Comment(post=big, content=f'댓글 {i}', author_name='bench', password_hash='-',
+                     author_fingerprint='bench') for i in range(big_comments)],
+            batch_size=1000,
+        )
+        Post.objects.filter(pk=big.pk).update(comment_count=big_comments)
+    hot, _ = Post.objects.get_or_create(
+        title='[bench] 투표 몰리는 글',
+        defaults={'board': free, 'content': 'bench', 'author_name': 'bench',
+                  'password_hash': '-', 'author_fingerprint': 'bench'},
+    )
+    cache.clear()
+    return {'big_post_id': big.pk, 'hot_post_id': hot.pk}
+
+
+def measure(spec, ctx, iterations, warmup):
+    run = spec['setup'](ctx)
+    for _ in range(warmup):
+        run()
+
+    threads = spec['threads']
+    if connection.vendor == 'sqlite':
+        # SQLite는 동시 쓰기를 지원하지 않으므로 순차 실행
+        threads = 1
+    count = spec['iterations'] or iterations
+
+    def timed(_):
+        started = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - started) * 1000
+        if threads > 1:
+            connections.close_all()
+        return elapsed
+
+    wall = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(threads) as pool:
+            latencies = list(pool.map(timed, range(count)))
+    else:
+        latencies = [timed(i) for i in range(count)]
+    wall = time.perf_counter() - wall
+
+    # 쿼리 수/메모리는 계측 오버헤드가 있어 별도 1회 측정
+    # (request_started 시그널이 queries_log를 비우므로 CaptureQueriesContext 대신 execute_wrapper)
+    queries = []
+
+    def count_query(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        run()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'iterations': count,
+        'threads': threads,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'rps': round(count / wall, 1),
+        'queries': len(queries),
+        'alloc_peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    """기준 대비 p50이 threshold 이상 느려지거나 쿼리 수가 늘면 회귀"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['p50_ms'] > base['p50_ms'] * (1 + threshold):
+            regressions.append(f"{name}: p50 {base['p50_ms']}ms → {result['p50_ms']}ms")
+        if result['queries'] > base['queries']:
+            regressions.append(f"{name}: 쿼리 {base['queries']} → {result['queries']}")
+    return regressions
+
+
+def print_table(results, baseline):
+    header = (
+        f"{'scenario':34} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>8} "
+        f"{'queries':>7} {'alloc KB':>9} {'vs base':>8}"
+    )
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        base = baseline.get(name)
+        delta = f"{(r['p50_ms'] / base['p50_ms'] - 1) * 100:+.0f}%" if base else '-'
+        print(
+            f"{name:34} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['rps']:>8.1f} {r['queries']:>7} {r['alloc_peak_kb']:>9.1f} {delta:>8}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='boards API 벤치마크')
+    parser.add_argument('--only', help='이름에 이 문자열이 포함된 시나리오만 실행')
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--posts', type=int, default=20000, help='필요한 최소 게시글 수')
+    parser.add_argument('--big-comments', type=int, default=5000,
+                        help='댓글 많은 글의 댓글 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='p50 회귀 허용 비율 (0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    ctx = prepare_data(args.posts, args.big_comments, args.seed)
+    baseline_path = BASELINE_DIR / f'{settings.BENCH_BACKEND}.json'
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    results = {}
+    for spec in SCENARIOS:
+        if args.only and args.only not in spec['name']:
+            continue
+        results[spec['name']] = measure(spec, ctx, args.iterations, args.warmup)
+        print(f"  {spec['name']}: p50 {results[spec['name']]['p50_ms']}ms", file=sys.stderr)
+
+    print_table(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    if args.save_baseline:
+        baseline.update(results)
+        BASELINE_DIR.mkdir(exist_ok=True)
+        baseline_path.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + '\n')
+        print(f"\n기준값 저장: {baseline_path}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print('\n성능 회귀:')
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+serializer 빠른 경로(boards/compiled.py) 벤치마크
+(출력이 DRF serializer와 같은지는 boards.tests.CompiledSerializerTests에서 검증)
+
+backend 디렉토리에서 실행:
+    python -m benchmarks.serializers
+    BENCH_BACKEND=postgres python -m benchmarks.serializers --sizes 20 50 100 --repeat 200
+
+1. 목록 페이지/상세 한 번을 만드는 데 드는 CPU 시간(process_time, 쿼리 실행 포함) 중앙값
+   - serializer: select_related 인스턴스 + PostListSerializer / PostDetailSerializer
+   - compiled: values()로 필요한 컬럼만 + CompiledSerializer
+2. 요청 전체 CPU: 테스트 클라이언트로 캐시되지 않는 목록 페이지(?page=10)를 요청
+   (디스패치, 페이지 쿼리, count 계산, 렌더링 포함 - 예전 커밋에서 같은 명령으로 비교)
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client  # noqa: E402
+
+from benchmarks.run import prepare_data  # noqa: E402
+from boards.models import Post  # noqa: E402
+from boards.serializers import (  # noqa: E402
+    PostDetailSerializer, PostListSerializer, post_detail_data, post_list_fields
+)
+
+ORDERINGS = {
+    'recent': ('-created_at', '-id'),
+    'popular': ('-upvote_count', '-created_at', '-id'),
+    'hot': ('-hot_score', '-id'),
+}
+
+
+def serializer_page(ordering, size):
+    posts = Post.objects.select_related('board').order_by(*ordering)[:size]
+    return PostListSerializer(posts, many=True).data
+
+
+def compiled_page(ordering, size):
+    rows = post_list_fields.values(Post.objects.order_by(*ordering))[:size]
+    return post_list_fields.data(rows)
+
+
+def serializer_detail(pk):
+    return PostDetailSerializer(Post.objects.select_related('board').get(pk=pk)).data
+
+
+def compiled_detail(pk):
+    return post_detail_data(Post.objects.select_related('board').get(pk=pk))
+
+
+def cpu_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        func()
+        samples.append((time.process_time() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='serializer 빠른 경로 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--posts', type=int, default=20000, help='필요한 최소 게시글 수')
+    parser.add_argument('--big-comments', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    ctx = prepare_data(args.posts, args.big_comments, args.seed)
+
+    print(f"{'CPU ms (중앙값)':22} {'serializer':>10} {'compiled':>10} {'비율':>6}")
+    cases = [
+        (f'목록 {size}개', lambda s=size: serializer_page(ORDERINGS['recent'], s),
+         lambda s=size: compiled_page(ORDERINGS['recent'], s))
+        for size in args.sizes
+    ]
+    cases.append((
+        '상세 (댓글 50개)', lambda: serializer_detail(ctx['big_post_id']),
+        lambda: compiled_detail(ctx['big_post_id'])
+    ))
+    for name, old, new in cases:
+        old_ms, new_ms = cpu_ms(old, args.repeat), cpu_ms(new, args.repeat)
+        print(f'{name:22} {old_ms:>10.3f} {new_ms:>10.3f} {new_ms / old_ms:>6.0%}')
+
+    print(f"\n{'요청 전체 CPU ms (중앙값)':22}")
+    client = Client()
+    for size in args.sizes:
+        url = f'/api/posts/?page=10&page_size={size}'
+        client.get(url)
+        print(f'목록 {size}개{"":16} {cpu_ms(lambda: client.get(url), args.repeat):>10.3f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+벤치마크용 설정
+BENCH_BACKEND=local(기본): SQLite 파일 + locmem 캐시 (별도 서버 불필요)
+BENCH_BACKEND=postgres: config.settings의 PostgreSQL/Redis 그대로 사용
+"""
+import os
+
+from config.settings import *  # noqa: F401,F403
+from config.settings import BASE_DIR
+
+BENCH_BACKEND = os.getenv('BENCH_BACKEND', 'local')
+
+if BENCH_BACKEND == 'local':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'benchmarks' / '.bench.sqlite3',
+        }
+    }
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 벤치마크 요청이 레이트 리밋에 걸리지 않도록
+RATE_LIMITS = {
+    'post': (10 ** 9, 60),
+    'comment': (10 ** 9, 60),
+    'vote': (10 ** 9, 60),
+}
@@ -0,0 +1,144 @@
+"""
+fingerprint별 활동 (작성한 글/댓글 타임라인, 모더레이션 일괄 삭제)
+글과 댓글 모두 (author_fingerprint, -created_at, -id) 인덱스 범위 스캔만 한다.
+"""
+import time
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Q
+
+from .caching import bump_post_list_generation
+from .counters import record_comment_deltas
+from .events import board_channel, post_channel, publish_event
+from .models import Comment, Post, Vote
+from .pagination import decode_cursor, encode_cursor, keyset_filter
+from .serializers import CommentSerializer, PostListSerializer
+from .votes import remove_votes
+
+ACTIVITY_ORDERING = ('-created_at', '-id')
+ACTIVITY_KEYSET = [('created_at', True), ('id', True)]
+
+# 같은 시각이면 글이 댓글보다 앞 (커서의 종류 값, 클수록 앞)
+KIND_POST = 1
+KIND_COMMENT = 0
+# 커서 값 변환용 필드 (created_at, 종류, id - 종류도 정수라 id 필드로 변환)
+_CURSOR_FIELDS = [('created_at', True), ('id', True), ('id', True)]
+
+
+def _after_cursor(kind, cursor):
+    """커서(created_at, 종류, id) 다음 위치의 조건 - 한 테이블 안에서는 종류가 고정"""
+    created_at, cursor_kind, pk = cursor
+    if kind > cursor_kind:
+        return Q(created_at__lt=created_at)
+    if kind < cursor_kind:
+        return Q(created_at__lte=created_at)
+    return keyset_filter(ACTIVITY_KEYSET, [created_at, pk])
+
+
+def activity_page(fingerprint, cursor=None, page_size=20):
+    """
+    fingerprint가 쓴 글과 댓글을 최신순으로 합친 한 페이지
+    반환값: (결과 목록, 다음 페이지 커서 또는 None)
+    """
+    querysets = [
+        (KIND_POST, Post.objects.select_related('board')),
+        (KIND_COMMENT, Comment.objects.all()),
+    ]
+    cursor_values = decode_cursor(cursor, Post, _CURSOR_FIELDS)[0] if cursor else None
+
+    rows = []
+    for kind, queryset in querysets:
+        queryset = queryset.filter(author_fingerprint=fingerprint).order_by(*ACTIVITY_ORDERING)
+        if cursor_values is not None:
+            queryset = queryset.filter(_after_cursor(kind, cursor_values))
+        rows += [(obj.created_at, kind, obj.pk, obj) for obj in queryset[:page_size + 1]]
+
+    rows.sort(key=lambda row: row[:3], reverse=True)
+    page = rows[:page_size]
+    next_cursor = encode_cursor(page[-1][:3]) if len(rows) > page_size else None
+
+    results = []
+    for _, kind, _, obj in page:
+        if kind == KIND_POST:
+            results.append({'type': 'post', **PostListSerializer(obj).data})
+        else:
+            results.append({'type': 'comment', 'post_id': obj.post_id, **CommentSerializer(obj).data})
+    return results, next_cursor
+
+
+PURGE_STAGES = ('comments', 'votes', 'posts')
+
+
+def purge_fingerprint(fingerprint, batch_size=100, pause=0):
+    """
+    fingerprint의 댓글, 투표, 글을 batch_size개씩 짧은 트랜잭션으로 삭제
+    댓글 수/추천 수는 각 버퍼(counters, 투표 샤드)로 반영하므로 Post 행을 오래 잠그지 않는다.
+    pause초씩 쉬면서 진행해 다른 쓰기 요청과 번갈아 처리되게 할 수 있음
+    반환값: {'comments': n, 'votes': n, 'posts': n}
+    """
+    deleted = dict.fromkeys(PURGE_STAGES, 0)
+    while True:
+        step = purge_fingerprint_batch(fingerprint, batch_size)
+        if not any(step.values()):
+            return deleted
+        for stage, count in step.items():
+            deleted[stage] += count
+        time.sleep(pause)
+
+
+def purge_fingerprint_batch(fingerprint, batch_size=100):
+    """
+    댓글 → 투표 → 글 순서로 아직 남은 첫 단계의 한 배치만 삭제 (트랜잭션 하나)
+    요청 안에서 나눠 실행할 수 있도록 한 번의 작업량을 batch_size개로 제한한다.
+    반환값: {'comments': n, 'votes': n, 'posts': n} - 모두 0이면 더 지울 것이 없음
+    """
+    deleted = dict.fromkeys(PURGE_STAGES, 0)
+    for stage, purge in zip(PURGE_STAGES, (_purge_comments, remove_votes, _purge_posts)):
+        deleted[stage] = purge(fingerprint, batch_size)
+        if deleted[stage]:
+            break
+    return deleted
+
+
+def purge_remaining(fingerprint):
+    """아직 남은 fingerprint의 댓글/투표/글 수 (author_fingerprint 인덱스)"""
+    return {
+        'comments': Comment.objects.filter(author_fingerprint=fingerprint).count(),
+        'votes': Vote.objects.filter(voter_fingerprint=fingerprint).count(),
+        'posts': Post.objects.filter(author_fingerprint=fingerprint).count(),
+    }
+
+
+def _purge_comments(fingerprint, batch_size):
+    with transaction.atomic():
+        comments = list(
+            Comment.objects.filter(author_fingerprint=fingerprint)
+            .order_by('id').values_list('id', 'post_id')[:batch_size]
+        )
+        if not comments:
+            return 0
+        Comment.objects.filter(pk__in=[pk for pk, _ in comments]).delete()
+    record_comment_deltas({
+        post_id: -count for post_id, count in Counter(post_id for _, post_id in comments).items()
+    })
+    return len(comments)
+
+
+def _purge_posts(fingerprint, batch_size):
+    with transaction.atomic():
+        posts = list(
+            Post.objects.filter(author_fingerprint=fingerprint)
+            .select_related('board').order_by('id')[:batch_size]
+        )
+        if not posts:
+            return 0
+        # 다른 사람의 댓글/투표는 CASCADE, 게시판 글 수와 랭킹은 post_delete 시그널이 처리
+        Post.objects.filter(pk__in=[post.pk for post in posts]).delete()
+        bump_post_list_generation(*{post.board.board_type for post in posts})
+        for post in posts:
+            publish_event(
+                [board_channel(post.board.board_type), post_channel(post.pk)],
+                'post_deleted', {'id': post.pk}
+            )
+    return len(posts)
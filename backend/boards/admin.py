@@ -4,9 +4,10 @@ from .models import Board, Post, Comment, Vote
 
 @admin.register(Board)
 class BoardAdmin(admin.ModelAdmin):
-    list_display = ['name', 'board_type', 'order', 'created_at']
+    list_display = ['name', 'board_type', 'order', 'post_count', 'created_at']
     list_filter = ['board_type']
     search_fields = ['name']
+    readonly_fields = ['post_count']
 
 
 @admin.register(Post)
@@ -0,0 +1,142 @@
+"""
+ASGI용 읽기 엔드포인트 (settings.ASYNC_READ_VIEWS가 켜져 있으면 DRF 라우터보다 먼저 연결)
+
+- 게시판 목록, 게시글 목록(캐시 히트), 게시글 상세를 이벤트 루프에서 바로 처리
+  async ORM과 redis.asyncio를 쓰므로 대기 중인 요청이 스레드를 점유하지 않는다.
+- 그 밖의 메서드(작성/수정/삭제)와 캐시 미스 목록은 기존 DRF 뷰를 스레드에서 실행
+- 응답 본문은 DRF JSONRenderer와 같은 바이트로 만들고, ETag/Cache-Control도 동기 뷰와 같다.
+  목록을 JSON이 아닌 형식(MessagePack/columnar)으로 요청하면 협상을 위해 DRF 뷰로 넘긴다.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.exceptions import NotFound
+
+from .caching import (
+    aget_cached_board_list, aset_cached_board_list,
+    is_cacheable_post_list, apost_list_cache_key, aget_cached_post_list
+)
+from .conditional import (
+    DETAIL_CACHE_CONTROL, list_cache_control, not_modified, post_etag, set_validators
+)
+from .counters import arecord_view
+from .db_router import acan_read_replica, replica_reads
+from .instrumentation import current_metrics, endpoint_name
+from .models import Board, Post
+from .partitions import acreated_at_bounds, comments_since
+from .renderers import dumps_json, wants_compact
+from .serializers import BoardSerializer, COMMENT_ORDERING, comment_fields, post_detail_data
+from .views import BoardViewSet, PostViewSet, get_client_ip
+
+# 라우터와 같은 액션 매핑 (메트릭 라벨도 동기 뷰와 같게 나옴)
+board_list_view = BoardViewSet.as_view({'get': 'list'})
+post_list_view = PostViewSet.as_view({'get': 'list', 'post': 'create'})
+post_detail_view = PostViewSet.as_view({
+    'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'
+})
+
+
+def json_response(data, status=200):
+    """DRF JSONRenderer와 같은 형식 (한글 그대로, 공백 없는 구분자)"""
+    response = HttpResponse(dumps_json(data), status=status, content_type='application/json')
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+
+def serialize(build, *args):
+    """직렬화 시간 계측 (InstrumentedViewMixin.serialize와 같은 값)"""
+    metrics = current_metrics()
+    if metrics is None:
+        return build(*args)
+    with metrics.timer('serialize'):
+        return build(*args)
+
+
+async def delegate(view, request, **kwargs):
+    """동기 DRF 뷰를 스레드에서 실행"""
+    request.metrics_endpoint = endpoint_name(view, request)
+    return await sync_to_async(view)(request, **kwargs)
+
+
+async def board_list(request):
+    if request.method != 'GET':
+        return await delegate(board_list_view, request)
+    request.metrics_endpoint = 'BoardViewSet.list'
+
+    data = await aget_cached_board_list()
+    if data is None:
+        with replica_reads(await acan_read_replica(get_client_ip(request))):
+            boards = [board async for board in Board.objects.all()]
+        data = serialize(lambda: BoardSerializer(boards, many=True).data)
+        await aset_cached_board_list(data)
+    return json_response(data)
+
+
+async def post_list(request):
+    if (request.method != 'GET' or not is_cacheable_post_list(request.GET)
+            or wants_compact(request)):
+        return await delegate(post_list_view, request)
+
+    entry = await aget_cached_post_list(await apost_list_cache_key(request.GET))
+    if entry is None:
+        return await delegate(post_list_view, request)
+    request.metrics_endpoint = 'PostViewSet.list'
+    cache_control = list_cache_control()
+    return (
+        not_modified(request, entry['etag'], cache_control)
+        or set_validators(json_response(entry['data']), entry['etag'], cache_control)
+    )
+
+
+async def post_detail(request, pk):
+    if request.method != 'GET':
+        return await delegate(post_detail_view, request, pk=pk)
+    request.metrics_endpoint = 'PostViewSet.retrieve'
+
+    with replica_reads(await acan_read_replica(get_client_ip(request))):
+        return await _post_detail(request, pk)
+
+
+async def _post_detail(request, pk):
+    queryset = Post.objects.select_related('board')
+    board_type = request.GET.get('board_type')
+    if board_type:
+        queryset = queryset.filter(board__board_type=board_type)
+    # PostViewSet.get_object와 같게 id가 속한 월 파티션 범위로 먼저 조회
+    created_range = await acreated_at_bounds(Post, pk)
+    post = None
+    if created_range:
+        post = await queryset.filter(
+            pk=pk, created_at__gte=created_range[0], created_at__lt=created_range[1]
+        ).afirst()
+    try:
+        post = post or await queryset.aget(pk=pk)
+    except Post.DoesNotExist:
+        return json_response({'detail': NotFound.default_detail}, status=404)
+
+    view_delta, comment_delta = await arecord_view(post.pk)
+    post.view_count += view_delta
+    post.comment_count += comment_delta
+
+    etag = post_etag(post)
+    response = not_modified(request, etag, DETAIL_CACHE_CONTROL, post.updated_at)
+    if response is not None:
+        return response
+
+    # 첫 댓글 페이지를 미리 읽어 두고 직렬화는 DB 접근 없이 처리
+    size = settings.POST_DETAIL_COMMENTS
+    comments = [
+        comment async for comment in comment_fields.values(
+            post.comments.filter(created_at__gte=comments_since(post.created_at))
+            .order_by(*COMMENT_ORDERING)
+        )[:size + 1]
+    ]
+    data = serialize(post_detail_data, post, comments[:size], len(comments) > size)
+    return set_validators(json_response(data), etag, DETAIL_CACHE_CONTROL, post.updated_at)
+
+
+# 쓰기 요청은 DRF 뷰(csrf_exempt)로 넘기므로 CSRF 검사도 같게 맞춤
+# (Django 4.2의 csrf_exempt 데코레이터는 async 함수를 동기 함수로 감싸버림)
+for view in (board_list, post_list, post_detail):
+    view.csrf_exempt = True
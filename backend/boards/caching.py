@@ -0,0 +1,191 @@
+import hashlib
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+
+from .conditional import data_etag
+from .utils import get_async_redis_client, get_redis_client
+
+# 게시판 목록 응답 캐시 (글 작성/삭제, 게시판 변경 시 무효화)
+BOARD_LIST_CACHE_KEY = 'boards:list'
+BOARD_LIST_CACHE_TIMEOUT = 60 * 60
+
+# 게시글 목록 페이지 캐시
+# 글/댓글 변경 시 게시판 세대(generation)를 바꿔 무효화하고,
+# 조회수/추천수처럼 카운트만 바뀌는 경우는 짧은 TTL로 허용
+POST_LIST_CACHE_TIMEOUT = 30
+POST_LIST_CACHE_PAGES = 3  # 앞쪽 몇 페이지까지 캐시할지
+POST_LIST_ALL_BOARDS = 'all'
+
+# 캐시 히트/미스 카운터 (Redis 해시, 필드: "<이름>:hit" / "<이름>:miss")
+CACHE_METRICS_KEY = 'metrics:cache'
+CACHE_METRIC_NAMES = ('post_list',)
+
+
+def get_cached_board_list():
+    return cache.get(BOARD_LIST_CACHE_KEY)
+
+
+def set_cached_board_list(data):
+    cache.set(BOARD_LIST_CACHE_KEY, data, BOARD_LIST_CACHE_TIMEOUT)
+
+
+async def aget_cached_board_list():
+    return await _acache_get(BOARD_LIST_CACHE_KEY)
+
+
+async def aset_cached_board_list(data):
+    await _acache_set(BOARD_LIST_CACHE_KEY, data, BOARD_LIST_CACHE_TIMEOUT)
+
+
+def invalidate_board_list():
+    """커밋 이후에 삭제해야 커밋 전 값이 다시 캐시되지 않음"""
+    transaction.on_commit(lambda: cache.delete(BOARD_LIST_CACHE_KEY))
+
+
+def _generation_key(board_type):
+    return f"posts:gen:{board_type}"
+
+
+def is_cacheable_post_list(query_params) -> bool:
+    """커서 방식이 아니고 앞쪽 페이지인 목록 요청만 캐시"""
+    if 'cursor' in query_params:
+        return False
+    try:
+        page = int(query_params.get('page', 1))
+    except ValueError:
+        return False
+    return 1 <= page <= POST_LIST_CACHE_PAGES
+
+
+def post_list_cache_key(query_params) -> str:
+    """게시판 세대 + 정규화한 쿼리 파라미터로 캐시 키 생성"""
+    board_type = query_params.get('board_type') or POST_LIST_ALL_BOARDS
+    generation = cache.get(_generation_key(board_type), '0')
+    return _post_list_cache_key(query_params, board_type, generation)
+
+
+async def apost_list_cache_key(query_params) -> str:
+    board_type = query_params.get('board_type') or POST_LIST_ALL_BOARDS
+    generation = await _acache_get(_generation_key(board_type), '0')
+    return _post_list_cache_key(query_params, board_type, generation)
+
+
+def _post_list_cache_key(query_params, board_type, generation) -> str:
+    # 캐시에는 렌더링 전 데이터가 들어가므로 응답 형식(?format=)이 달라도 같은 항목을 씀
+    params = '&'.join(
+        f"{name}={value}"
+        for name, value in sorted(query_params.items())
+        if name not in ('board_type', 'format')
+    )
+    digest = hashlib.md5(params.encode()).hexdigest()
+    return f"posts:page:{board_type}:{generation}:{digest}"
+
+
+def get_cached_post_list(key):
+    """캐시된 목록 페이지 {'etag': 강한 ETag, 'data': 응답 데이터} 또는 None"""
+    entry = cache.get(key)
+    record_cache_metric('post_list', entry is not None)
+    return entry
+
+
+def set_cached_post_list(key, data):
+    """ETag를 함께 계산해 저장하고 캐시 항목을 반환"""
+    entry = {'etag': data_etag(data), 'data': data}
+    cache.set(key, entry, POST_LIST_CACHE_TIMEOUT)
+    return entry
+
+
+async def aget_cached_post_list(key):
+    """
+    async 뷰용 - 히트만 기록
+    미스면 async 뷰가 동기 목록 뷰로 넘기고, 그쪽에서 다시 조회하며 미스를 기록함
+    """
+    entry = await _acache_get(key)
+    if entry is not None:
+        await arecord_cache_metric('post_list', True)
+    return entry
+
+
+def bump_post_list_generation(*board_types):
+    """
+    해당 게시판(과 전체 목록)의 캐시 세대를 바꿔 목록 캐시를 무효화
+    세대 값은 새 토큰으로 덮어쓰므로 키가 만료돼 있어도 문제 없음
+    """
+    keys = [_generation_key(bt) for bt in {*board_types, POST_LIST_ALL_BOARDS}]
+
+    def bump():
+        cache.set_many({key: uuid.uuid4().hex[:12] for key in keys}, None)
+
+    transaction.on_commit(bump)
+
+
+def record_cache_metric(name: str, hit: bool):
+    field = f"{name}:{'hit' if hit else 'miss'}"
+    client = get_redis_client()
+    if client is not None:
+        client.hincrby(CACHE_METRICS_KEY, field, 1)
+        return
+    key = f"{CACHE_METRICS_KEY}:{field}"
+    cache.add(key, 0, None)
+    cache.incr(key)
+
+
+async def arecord_cache_metric(name: str, hit: bool):
+    client = get_async_redis_client()
+    if client is None:
+        await sync_to_async(record_cache_metric)(name, hit)
+        return
+    await client.hincrby(CACHE_METRICS_KEY, f"{name}:{'hit' if hit else 'miss'}", 1)
+
+
+def get_cache_metrics() -> dict:
+    """{이름: {'hit': n, 'miss': n}}"""
+    client = get_redis_client()
+    if client is not None:
+        raw = {k.decode(): int(v) for k, v in client.hgetall(CACHE_METRICS_KEY).items()}
+    else:
+        keys = [
+            f"{CACHE_METRICS_KEY}:{name}:{kind}"
+            for name in CACHE_METRIC_NAMES for kind in ('hit', 'miss')
+        ]
+        raw = {
+            key[len(CACHE_METRICS_KEY) + 1:]: value
+            for key, value in cache.get_many(keys).items()
+        }
+
+    metrics = {}
+    for field, value in raw.items():
+        name, kind = field.rsplit(':', 1)
+        metrics.setdefault(name, {'hit': 0, 'miss': 0})[kind] = value
+    return metrics
+
+
+# async 뷰용 캐시 접근
+# django_redis 클라이언트는 동기 전용이라 같은 키/직렬화 형식으로 redis.asyncio에서 직접 읽고 쓴다.
+
+async def _acache_get(key, default=None):
+    client = get_async_redis_client()
+    if client is None:
+        return await cache.aget(key, default)
+    raw = await client.get(cache.client.make_key(key))
+    return default if raw is None else cache.client.decode(raw)
+
+
+async def _acache_set(key, value, timeout):
+    client = get_async_redis_client()
+    if client is None:
+        await cache.aset(key, value, timeout)
+        return
+    await client.set(cache.client.make_key(key), cache.client.encode(value), ex=timeout)
+
+
+async def acache_get_many(keys) -> dict:
+    """cache.get_many의 async 버전 (값이 있는 키만 반환)"""
+    client = get_async_redis_client()
+    if client is None:
+        return await cache.aget_many(keys)
+    raw = await client.mget([cache.client.make_key(key) for key in keys])
+    return {key: cache.client.decode(value) for key, value in zip(keys, raw) if value is not None}
@@ -0,0 +1,110 @@
+"""
+읽기 전용 serializer 빠른 경로 (게시글 목록/검색/상세, 댓글 목록)
+
+DRF ModelSerializer는 행마다 모든 필드 객체의 get_attribute/to_representation을 호출하고,
+모델 인스턴스(select_related면 게시판까지)를 만들어야 해서 20개짜리 목록에서도 쿼리보다 CPU를 더 쓴다.
+CompiledSerializer는 serializer 클래스의 필드 정의를 한 번 읽어
+(출력 이름, values() 조회 경로, 인스턴스 속성, 변환 함수) 목록으로 만들어 두고 응답 dict를 바로 만든다.
+
+- values(queryset): 필요한 컬럼(+ keyset 커서용 정렬키)만 읽는 .values() 쿼리
+- data(rows): values() dict 또는 이미 읽은 모델 인스턴스 목록 -> 응답 dict 목록
+출력은 원래 serializer.data와 키 순서/값이 같아 렌더링한 바이트도 같다. (benchmarks/serializers.py로 확인)
+변환 방법을 모르는 필드(SerializerMethodField 등)나 null이 될 수 있는 관계를 거치는 source는
+만들 때 TypeError를 내므로, serializer를 바꾸면 여기서 바로 드러난다.
+"""
+from operator import attrgetter
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# DB에서 읽은 값 그대로가 to_representation 결과와 같은 필드 (int/str/float/bool)
+PASSTHROUGH_FIELDS = (
+    serializers.IntegerField, serializers.CharField, serializers.FloatField,
+    serializers.BooleanField, serializers.ReadOnlyField,
+)
+
+
+def _is_plain_iso_datetime(field):
+    """DRF 기본 설정(ISO 8601, 현재 타임존)의 DateTimeField인지 - 변환을 직접 해도 결과가 같음"""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return (
+        settings.USE_TZ and isinstance(output_format, str)
+        and output_format.lower() == ISO_8601 and not hasattr(field, 'timezone')
+    )
+
+
+def _source(model, source_attrs):
+    """source 경로 -> (values() 조회 경로, 인스턴스 속성 경로)"""
+    if not source_attrs:
+        raise TypeError("source='*'는 지원하지 않습니다.")
+    path = []
+    for i, attr in enumerate(source_attrs):
+        field = model._meta.get_field(attr)
+        path.append(attr)
+        if i == len(source_attrs) - 1:
+            break
+        if not field.is_relation or field.null:
+            # DRF는 중간 객체가 None이면 키를 빼버리므로 같은 결과를 보장할 수 없음
+            raise TypeError(f"{'.'.join(source_attrs)}: null이 될 수 있는 관계는 지원하지 않습니다.")
+        model = field.related_model
+    return '__'.join(path), '.'.join(path)
+
+
+class CompiledSerializer:
+    def __init__(self, serializer_class, exclude=()):
+        serializer = serializer_class()
+        model = serializer.Meta.model
+        self.fields = []  # (출력 이름, values() 조회 경로)
+        self.converters = []  # (출력 이름, 변환 함수) - 값이 None이면 변환하지 않음
+        self.datetimes = []  # 현재 타임존 ISO 8601 문자열로 바꿀 필드 (DRF DateTimeField 기본 동작)
+        attrs = []
+        for name, field in serializer.fields.items():
+            if field.write_only or name in exclude:
+                continue
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+                # values('board')는 게시판 id, 인스턴스는 board_id (DRF의 PKOnlyObject와 같은 값)
+                lookup = field.source
+                attr = model._meta.get_field(field.source).attname
+            elif isinstance(field, serializers.DateTimeField):
+                lookup, attr = _source(model, field.source_attrs)
+                if _is_plain_iso_datetime(field):
+                    self.datetimes.append(name)
+                else:
+                    self.converters.append((name, field.to_representation))
+            elif isinstance(field, PASSTHROUGH_FIELDS):
+                lookup, attr = _source(model, field.source_attrs)
+            else:
+                raise TypeError(f'{serializer_class.__name__}.{name}: 지원하지 않는 필드입니다.')
+            self.fields.append((name, lookup))
+            attrs.append(attr)
+        self.lookups = [lookup for _, lookup in self.fields]
+        self._getters = [(name, attrgetter(attr)) for (name, _), attr in zip(self.fields, attrs)]
+
+    def values(self, queryset):
+        """필요한 컬럼만 읽는 values() 쿼리 (keyset 커서가 쓰는 정렬키 컬럼도 함께)"""
+        ordering = [
+            name.lstrip('-') for name in queryset.query.order_by or queryset.model._meta.ordering
+            if isinstance(name, str) and name.lstrip('-') not in self.lookups
+        ]
+        return queryset.values(*self.lookups, *ordering)
+
+    def data(self, rows):
+        tz = timezone.get_current_timezone()
+        result = []
+        for row in rows:
+            if isinstance(row, dict):
+                item = {name: row[lookup] for name, lookup in self.fields}
+            else:
+                item = {name: getter(row) for name, getter in self._getters}
+            for name in self.datetimes:
+                value = item[name]
+                if value is not None:
+                    value = value.astimezone(tz).isoformat()
+                    item[name] = value[:-6] + 'Z' if value.endswith('+00:00') else value
+            for name, convert in self.converters:
+                if item[name] is not None:
+                    item[name] = convert(item[name])
+            result.append(item)
+        return result
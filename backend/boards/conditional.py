@@ -0,0 +1,71 @@
+"""
+게시글 목록/상세 응답의 HTTP 검증자(ETag, Last-Modified)와 조건부 GET
+
+- 목록: 캐시에 넣을 때 응답 데이터로 강한 ETag를 계산해 함께 저장 (같은 데이터면 같은 바이트)
+  If-None-Match가 맞으면 직렬화/렌더링 없이 304, CDN은 HTTP_CACHE_LIST_S_MAXAGE초 동안 재검증 없이 사용
+  같은 데이터라도 응답 형식(JSON/MessagePack 등, boards/renderers.py)마다 바이트가 다르므로 형식 이름을 붙인다.
+- 상세: (id, updated_at, 댓글 수, 추천/비추천 수)로 만든 약한 ETag, Last-Modified(updated_at)는 참고용
+  조회수는 요청마다 바뀌므로 ETag에서 뺀다. no-cache라 CDN/브라우저가 매번 원 서버에 재검증하고,
+  원 서버는 304를 줄 때도 조회수를 기록한다.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def list_cache_control():
+    return f'public, max-age=0, must-revalidate, s-maxage={settings.HTTP_CACHE_LIST_S_MAXAGE}'
+
+
+DETAIL_CACHE_CONTROL = 'public, no-cache'
+
+
+def data_etag(data) -> str:
+    """응답 데이터의 강한 ETag (키 순서와 무관하게 같은 데이터면 같은 값)"""
+    raw = json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    )
+    return f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def representation_etag(etag, request) -> str:
+    """협상된 렌더러가 JSON이 아니면 강한 ETag에 형식 이름을 붙임 ("..." -> "...-msgpack")"""
+    renderer = getattr(request, 'accepted_renderer', None)
+    if renderer is None or renderer.format == 'json':
+        return etag
+    return f'{etag[:-1]}-{renderer.format}"'
+
+
+def post_etag(post) -> str:
+    """게시글 상세의 약한 ETag (조회수 제외, comment_count는 미반영 증감을 더한 값)"""
+    raw = ':'.join(str(value) for value in (
+        post.pk, post.updated_at.timestamp(), post.comment_count,
+        post.upvote_count, post.downvote_count,
+    ))
+    return f'W/"{hashlib.md5(raw.encode()).hexdigest()[:16]}"'
+
+
+def set_validators(response, etag, cache_control, last_modified=None):
+    """200/304 응답에 같은 검증자와 캐시 정책 헤더를 붙임"""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    response['Cache-Control'] = cache_control
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+
+def not_modified(request, etag, cache_control, last_modified=None):
+    """
+    If-None-Match가 맞으면 304 응답, 아니면 None
+    Last-Modified는 글 수정 시각이라 댓글/추천 수 변화를 담지 못하므로
+    If-Modified-Since만 보낸 요청은 비교하지 않고 200으로 응답한다.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        return None
+    return set_validators(response, etag, cache_control, last_modified)
@@ -0,0 +1,251 @@
+import logging
+import uuid
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, When
+from redis.exceptions import LockError, ResponseError
+
+from .caching import bump_post_list_generation, invalidate_board_list
+from .models import Board, CounterFlush, Post
+from .ranking import hot_score, refresh_hot_scores
+from .tasks import enqueue, task
+from .utils import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 조회수 버퍼 (post_id -> 아직 DB에 반영되지 않은 증가분)
+VIEW_PENDING_KEY = 'post:views:pending'
+# flush 진행 중인 버퍼 (중간에 실패하면 다음 flush에서 이어서 반영)
+VIEW_FLUSHING_KEY = 'post:views:flushing'
+
+# 댓글 수 버퍼 (같은 방식, 댓글이 몰리는 글의 Post 행 락 경합 제거)
+COMMENT_PENDING_KEY = 'post:comments:pending'
+COMMENT_FLUSHING_KEY = 'post:comments:flushing'
+
+# flush 중인 버퍼의 id (<flushing 키>:id)와 동시 실행 방지 락 (<flushing 키>:lock)
+FLUSH_ID_SUFFIX = ':id'
+FLUSH_LOCK_SUFFIX = ':lock'
+FLUSH_LOCK_TIMEOUT = 300  # 반영이 이보다 오래 걸리면 다른 flush가 시작될 수 있음 (id로 중복 반영은 막음)
+
+
+def _pending_deltas(pipe, post_id):
+    pipe.hincrby(VIEW_PENDING_KEY, post_id, 1)
+    pipe.hget(VIEW_FLUSHING_KEY, post_id)
+    pipe.hget(COMMENT_PENDING_KEY, post_id)
+    pipe.hget(COMMENT_FLUSHING_KEY, post_id)
+
+
+def _sum_deltas(view_pending, view_flushing, comment_pending, comment_flushing):
+    return (
+        view_pending + int(view_flushing or 0),
+        int(comment_pending or 0) + int(comment_flushing or 0),
+    )
+
+
+def record_view(post_id: int):
+    """
+    조회수 1 증가를 기록하고 DB 값에 더해 보여줄 (조회수 증가분, 댓글 수 증가분)을 반환
+    Redis가 있으면 버퍼에만 쌓고, 없으면 바로 DB에 반영
+    """
+    client = get_redis_client()
+    if client is None:
+        Post.objects.filter(pk=post_id).update(view_count=F('view_count') + 1)
+        return 1, 0
+
+    pipe = client.pipeline()
+    _pending_deltas(pipe, post_id)
+    return _sum_deltas(*pipe.execute())
+
+
+async def arecord_view(post_id: int):
+    """record_view의 async 버전"""
+    client = get_async_redis_client()
+    if client is None:
+        await Post.objects.filter(pk=post_id).aupdate(view_count=F('view_count') + 1)
+        return 1, 0
+
+    pipe = client.pipeline()
+    _pending_deltas(pipe, post_id)
+    return _sum_deltas(*await pipe.execute())
+
+
+def record_comment(post, delta: int) -> int:
+    """
+    댓글 작성(+1)/삭제(-1)에 따른 댓글 수 변화를 기록하고 현재 댓글 수를 반환
+    Redis가 있으면 버퍼에만 쌓고(flush_comment_counts가 hot 점수, 목록 캐시와 함께 반영),
+    없으면 바로 DB에 반영
+    """
+    client = get_redis_client()
+    if client is None:
+        comment_count = post.comment_count + delta
+        Post.objects.filter(pk=post.pk).update(
+            comment_count=F('comment_count') + delta,
+            hot_score=hot_score(
+                post.upvote_count, post.downvote_count, comment_count, post.created_at
+            ),
+        )
+        bump_post_list_generation(post.board.board_type)
+        return comment_count
+
+    pipe = client.pipeline()
+    pipe.hincrby(COMMENT_PENDING_KEY, post.pk, delta)
+    pipe.hget(COMMENT_FLUSHING_KEY, post.pk)
+    pending, flushing = pipe.execute()
+    return post.comment_count + pending + int(flushing or 0)
+
+
+def record_comment_deltas(deltas: dict):
+    """여러 글의 댓글 수 증감 {post_id: delta}를 한 번에 기록 (일괄 삭제 등)"""
+    if not deltas:
+        return
+    client = get_redis_client()
+    if client is None:
+        _apply_deltas('comment_count', deltas, 500)
+        _comment_counts_changed(deltas)
+        return
+
+    pipe = client.pipeline()
+    for post_id, delta in deltas.items():
+        pipe.hincrby(COMMENT_PENDING_KEY, post_id, delta)
+    pipe.execute()
+
+
+def queue_board_post_count(post, delta: int):
+    """게시글 작성(+1)/삭제(-1)에 따른 게시판 글 수 변경을 후속 작업으로"""
+    change = 'created' if delta > 0 else 'deleted'
+    enqueue(apply_board_post_counts, post.board_id, delta, key=f'board-count:{post.pk}:{change}')
+
+
+@task(batch=True)
+def apply_board_post_counts(changes):
+    """
+    [(board_id, delta), ...]를 게시판별로 합쳐 반영하고 게시판 목록 캐시 무효화
+    (글이 몰려도 인기 게시판 행 UPDATE는 묶음마다 한 번)
+    """
+    deltas = Counter()
+    for board_id, delta in changes:
+        deltas[board_id] += delta
+    with transaction.atomic():
+        for board_id, delta in sorted(deltas.items()):
+            if delta:
+                Board.objects.filter(pk=board_id).update(post_count=F('post_count') + delta)
+        invalidate_board_list()
+
+
+def _apply_deltas(field: str, deltas: dict, batch_size: int) -> int:
+    """{post_id: delta}를 batch_size개씩 UPDATE ... CASE 한 번으로 반영"""
+    items = list(deltas.items())
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        Post.objects.filter(pk__in=[post_id for post_id, _ in batch]).update(**{
+            field: Case(
+                *[When(pk=post_id, then=F(field) + delta) for post_id, delta in batch],
+                output_field=IntegerField(),
+            )
+        })
+    return len(items)
+
+
+def _take_buffer(client, pending_key, flushing_key):
+    """
+    반영할 증가분 ({post_id: delta}, flush id) - 버퍼가 비어 있으면 ({}, None)
+    RENAME으로 버퍼를 떼어낸 뒤 반영하므로 flush 중에 들어온 증가분도 유실되지 않음
+    떼어낸 버퍼마다 flush id를 하나 붙인다. (SET NX라 이전 flush가 남긴 버퍼면 그 id를 그대로 씀)
+    """
+    if not client.exists(flushing_key):
+        try:
+            client.rename(pending_key, flushing_key)
+        except ResponseError:
+            # 버퍼가 비어 있음
+            return {}, None
+
+    client.set(flushing_key + FLUSH_ID_SUFFIX, uuid.uuid4().hex, nx=True)
+    pipe = client.pipeline()
+    pipe.hgetall(flushing_key)
+    pipe.get(flushing_key + FLUSH_ID_SUFFIX)
+    buffer, flush_id = pipe.execute()
+    deltas = {int(post_id): int(delta) for post_id, delta in buffer.items() if int(delta)}
+    return deltas, flush_id.decode()
+
+
+def _flush(client, name, pending_key, flushing_key, apply) -> int:
+    """
+    버퍼를 떼어내 apply(deltas)로 DB에 반영하고 반영한 게시글 수를 반환
+    - Redis 락(SET NX + TTL)으로 같은 버퍼의 flush는 한 번에 하나만 (다른 쪽은 0을 반환)
+    - 반영과 같은 트랜잭션에서 CounterFlush에 flush id를 기록하고, 버퍼는 커밋된 뒤에만 지움
+      커밋 후 버퍼를 지우기 전에 죽으면 다음 flush는 같은 id를 보고 반영 없이 버퍼만 지운다.
+    """
+    lock = client.lock(flushing_key + FLUSH_LOCK_SUFFIX, timeout=FLUSH_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return 0
+    try:
+        deltas, flush_id = _take_buffer(client, pending_key, flushing_key)
+        if flush_id is None:
+            return 0
+        with transaction.atomic():
+            state, _ = CounterFlush.objects.select_for_update().get_or_create(name=name)
+            applied = state.flush_id == flush_id
+            if not applied:
+                apply(deltas)
+                state.flush_id = flush_id
+                state.save(update_fields=['flush_id', 'updated_at'])
+        client.delete(flushing_key, flushing_key + FLUSH_ID_SUFFIX)
+        return 0 if applied else len(deltas)
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning('카운터 flush 락이 먼저 만료됨: %s', name)
+
+
+def flush_view_counts(batch_size: int = 500) -> int:
+    """버퍼된 조회수를 DB에 일괄 반영하고 반영한 게시글 수를 반환"""
+    client = get_redis_client()
+    if client is None:
+        return 0
+    # 배치 UPDATE 전체를 한 트랜잭션으로 (중간 배치가 실패하면 앞 배치도 롤백)
+    return _flush(
+        client, 'views', VIEW_PENDING_KEY, VIEW_FLUSHING_KEY,
+        lambda deltas: _apply_deltas('view_count', deltas, batch_size),
+    )
+
+
+def flush_comment_counts(batch_size: int = 500) -> int:
+    """
+    버퍼된 댓글 수 증감을 DB에 일괄 반영하고 반영한 게시글 수를 반환
+    반영한 글의 hot 점수를 다시 계산하고 해당 게시판 목록 캐시를 무효화
+    """
+    client = get_redis_client()
+    if client is None:
+        return 0
+
+    def apply(deltas):
+        # 댓글 수 UPDATE와 hot 점수 재계산을 한 트랜잭션으로
+        _apply_deltas('comment_count', deltas, batch_size)
+        if deltas:
+            _comment_counts_changed(deltas)
+
+    return _flush(client, 'comments', COMMENT_PENDING_KEY, COMMENT_FLUSHING_KEY, apply)
+
+
+def _comment_counts_changed(post_ids):
+    """댓글 수가 바뀐 글의 hot 점수 재계산, 해당 게시판 목록 캐시 무효화"""
+    refresh_hot_scores(post_ids)
+    board_types = (
+        Post.objects.filter(pk__in=post_ids)
+        .order_by().values_list('board__board_type', flat=True).distinct()
+    )
+    bump_post_list_generation(*board_types)
+
+
+def pending_comment_post_ids() -> set:
+    """댓글 수 증감이 아직 DB에 반영되지 않은 게시글 id"""
+    client = get_redis_client()
+    if client is None:
+        return set()
+    pipe = client.pipeline()
+    pipe.hkeys(COMMENT_PENDING_KEY)
+    pipe.hkeys(COMMENT_FLUSHING_KEY)
+    pending, flushing = pipe.execute()
+    return {int(post_id) for post_id in pending + flushing}
@@ -0,0 +1,87 @@
+"""
+읽기 복제본 라우팅 (settings.DATABASE_ROUTERS)
+
+- DATABASES에 'replica'가 있을 때만 동작하고, 뷰가 replica_reads()로 허용한 구간의
+  읽기 쿼리만 복제본으로 보낸다. (게시판 목록/상세, 게시글 목록/상세)
+- 쓰기와 transaction.atomic() 블록 안의 읽기는 항상 primary
+- 글 작성/수정/추천 등을 한 클라이언트(fingerprint)는 REPLICA_STICKY_SECONDS 동안
+  primary에서 읽어 복제 지연 때문에 방금 쓴 내용이 안 보이는 일이 없게 한다.
+  fingerprint는 분 단위로 바뀌므로 직전 분의 값도 함께 확인한다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .caching import acache_get_many
+from .fingerprints import get_user_fingerprint
+
+REPLICA_DB_ALIAS = 'replica'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def _sticky_key(fingerprint):
+    return f'db:sticky:{fingerprint}'
+
+
+def _sticky_keys(ip_address):
+    now = datetime.now()
+    return [
+        _sticky_key(get_user_fingerprint(ip_address, now)),
+        _sticky_key(get_user_fingerprint(ip_address, now - timedelta(minutes=1))),
+    ]
+
+
+def mark_primary_sticky(ip_address):
+    """쓰기 직후 호출 - 이 클라이언트의 읽기를 잠시 primary로 고정"""
+    if replica_configured():
+        cache.set(_sticky_key(get_user_fingerprint(ip_address)), 1, settings.REPLICA_STICKY_SECONDS)
+
+
+def can_read_replica(ip_address) -> bool:
+    if not replica_configured():
+        return False
+    return not cache.get_many(_sticky_keys(ip_address))
+
+
+async def acan_read_replica(ip_address) -> bool:
+    if not replica_configured():
+        return False
+    return not await acache_get_many(_sticky_keys(ip_address))
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    """이 블록(과 여기서 시작한 sync_to_async 호출)의 읽기 쿼리를 복제본으로 보냄"""
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or not replica_configured():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary와 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,289 @@
+"""
+실시간 이벤트 (Server-Sent Events)
+
+- 쓰기 뷰가 만든 SSE 프레임을 커밋 후 후속 작업 큐(boards/tasks.py)를 거쳐 Redis pub/sub 채널에 그대로 발행
+    events:board:<board_type>  post_created / post_deleted / post_counts(댓글 수)
+    events:post:<id>           comment_created / comment_deleted / vote / post_deleted
+- ASGI: EventStreamMiddleware가 /api/events/ 요청을 Django 밖에서 직접 처리하고,
+  프로세스(이벤트 루프)마다 Redis 구독 연결 하나(EventHub)가 events:* 패턴을 받아
+  구독자별 asyncio.Queue로 나눠 준다. 유휴 구독자는 큐 하나와 태스크 두 개만 차지한다.
+- WSGI(로컬 개발): views.board_events/post_events가 요청마다 구독 연결과 스레드 하나를 점유
+pub/sub는 기록이 남지 않으므로 재연결한 클라이언트는 목록/상세를 다시 조회해야 한다.
+"""
+import asyncio
+import json
+import logging
+import re
+import time
+import weakref
+from collections import defaultdict
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Board
+from .tasks import enqueue, task
+from .utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL_PREFIX = 'events:'
+BOARD_EVENTS_PATH = re.compile(r'^/api/events/boards/([-\w]+)/$')
+POST_EVENTS_PATH = re.compile(r'^/api/events/posts/(\d+)/$')
+BOARD_TYPES = {board_type for board_type, _ in Board.BOARD_TYPE_CHOICES}
+
+# Redis 구독이 끊겼다 붙은 사이의 이벤트는 유실되므로 다시 조회하라고 알림
+RESYNC_FRAME = 'event: resync\ndata: {}\n\n'
+HEARTBEAT_FRAME = ': ping\n\n'
+
+
+def board_channel(board_type):
+    return f'{EVENTS_CHANNEL_PREFIX}board:{board_type}'
+
+
+def post_channel(post_id):
+    return f'{EVENTS_CHANNEL_PREFIX}post:{post_id}'
+
+
+def format_event(event, data):
+    """SSE 프레임 (발행 시 한 번만 만들고 구독자에게는 그대로 전달)"""
+    body = json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+    return f'event: {event}\ndata: {body}\n\n'
+
+
+def publish_event(channels, event, data):
+    """커밋 이후 후속 작업 큐로 발행 (롤백된 변경이 나가지 않도록). Redis가 없으면 무시"""
+    enqueue(deliver_events, list(channels), format_event(event, data))
+
+
+@task(batch=True)
+def deliver_events(events):
+    """[(채널 목록, SSE 프레임), ...]을 넣은 순서대로 파이프라인 한 번에 발행"""
+    client = get_redis_client()
+    if client is None:
+        return
+    pipe = client.pipeline(transaction=False)
+    for channels, frame in events:
+        for channel in channels:
+            pipe.publish(channel, frame)
+    pipe.execute()
+
+
+def _pubsub_client(asyncio_client=False):
+    """구독 전용 연결 (캐시용 socket_timeout을 쓰면 대기 중에 타임아웃이 나므로 따로 만듦)"""
+    if asyncio_client:
+        from redis.asyncio import Redis
+    else:
+        from redis import Redis
+    return Redis.from_url(
+        settings.CACHES['default']['LOCATION'],
+        socket_timeout=None,
+        socket_connect_timeout=2,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+
+
+def events_available():
+    return settings.CACHES['default']['BACKEND'].startswith('django_redis')
+
+
+# ---------------------------------------------------------------------------
+# ASGI: 프로세스 단위 구독 / 분배
+# ---------------------------------------------------------------------------
+
+class Subscription:
+    def __init__(self, channel):
+        self.channel = channel
+        self.queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        self.closed = False
+
+    def push(self, frame):
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # 큐가 넘칠 만큼 느린 클라이언트는 스트림을 닫아 재연결하게 함
+            self.closed = True
+
+    def close(self):
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+class EventHub:
+    """이벤트 루프마다 하나 - Redis events:* 패턴 구독 결과를 채널별 구독자에게 분배"""
+
+    def __init__(self):
+        self.subscriptions = defaultdict(set)
+        self.task = None
+
+    def subscribe(self, channel):
+        subscription = Subscription(channel)
+        self.subscriptions[channel].add(subscription)
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.listen())
+        return subscription
+
+    def unsubscribe(self, subscription):
+        subscriptions = self.subscriptions.get(subscription.channel)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscriptions[subscription.channel]
+
+    def dispatch(self, channel, frame):
+        for subscription in self.subscriptions.get(channel, ()):
+            subscription.push(frame)
+
+    async def listen(self):
+        reconnecting = False
+        while True:
+            client = _pubsub_client(asyncio_client=True)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f'{EVENTS_CHANNEL_PREFIX}*')
+                if reconnecting:
+                    for subscriptions in self.subscriptions.values():
+                        for subscription in subscriptions:
+                            subscription.push(RESYNC_FRAME)
+                reconnecting = False
+                async for message in pubsub.listen():
+                    if message['type'] == 'pmessage':
+                        self.dispatch(message['channel'].decode(), message['data'].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if not self.subscriptions:
+                    return
+                logger.exception('이벤트 구독 연결 끊김, 재연결')
+                reconnecting = True
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+
+_hubs = weakref.WeakKeyDictionary()
+
+
+def get_event_hub():
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = EventHub()
+    return hub
+
+
+def event_channel(path):
+    """/api/events/ 경로 -> 구독 채널 (형식이 맞지 않거나 없는 게시판이면 None)"""
+    match = BOARD_EVENTS_PATH.match(path)
+    if match:
+        board_type = match.group(1)
+        return board_channel(board_type) if board_type in BOARD_TYPES else None
+    match = POST_EVENTS_PATH.match(path)
+    if match:
+        return post_channel(int(match.group(1)))
+    return None
+
+
+def _response_headers(scope):
+    headers = [
+        (b'content-type', b'text/event-stream'),
+        (b'cache-control', b'no-cache'),
+        (b'x-accel-buffering', b'no'),  # nginx 등 프록시 버퍼링 끄기
+    ]
+    # Django를 거치지 않으므로 corsheaders 설정(전체 허용)을 여기서 적용
+    origin = dict(scope['headers']).get(b'origin')
+    if origin and settings.CORS_ALLOW_ALL_ORIGINS:
+        headers += [(b'access-control-allow-origin', origin), (b'vary', b'origin')]
+        if settings.CORS_ALLOW_CREDENTIALS:
+            headers.append((b'access-control-allow-credentials', b'true'))
+    return headers
+
+
+async def _watch_disconnect(receive, subscription):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+    subscription.close()
+
+
+async def serve_event_stream(scope, receive, send, channel):
+    """
+    SSE 응답을 ASGI로 직접 전송
+    하트비트 주기마다 빈 프레임을 보내고, EVENTS_STREAM_MAX_AGE가 지나면 닫아
+    클라이언트(EventSource)가 다시 연결하게 한다.
+    """
+    loop = asyncio.get_running_loop()
+    hub = get_event_hub()
+    subscription = hub.subscribe(channel)
+    watcher = loop.create_task(_watch_disconnect(receive, subscription))
+    deadline = loop.time() + settings.EVENTS_STREAM_MAX_AGE
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': _response_headers(scope)})
+        frame = f'retry: {settings.EVENTS_RETRY_MS}\n\n'
+        while True:
+            await send({'type': 'http.response.body', 'body': frame.encode(), 'more_body': True})
+            if subscription.closed or loop.time() >= deadline:
+                break
+            try:
+                frame = await asyncio.wait_for(
+                    subscription.queue.get(), settings.EVENTS_HEARTBEAT_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                frame = HEARTBEAT_FRAME
+            if frame is None:
+                break
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    finally:
+        watcher.cancel()
+        hub.unsubscribe(subscription)
+
+
+class EventStreamMiddleware:
+    """
+    ASGI 미들웨어 (config/asgi.py)
+    /api/events/ 구독은 Django를 거치지 않고 여기서 처리한다. Django ASGI 핸들러를 거치면
+    연결마다 스레드와 DB 연결이 스트림이 끝날 때까지 묶이고, 응답 중 연결 종료도 알 수 없다.
+    형식이 맞지 않는 경로나 GET이 아닌 요청은 Django(views.board_events 등)로 넘긴다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['method'] == 'GET' and events_available():
+            channel = event_channel(scope['path'])
+            if channel is not None:
+                return await serve_event_stream(scope, receive, send, channel)
+        return await self.app(scope, receive, send)
+
+
+# ---------------------------------------------------------------------------
+# WSGI (로컬 개발)
+# ---------------------------------------------------------------------------
+
+def stream_events_sync(channel):
+    """WSGI용 SSE 본문 (요청마다 구독 연결 하나, 끊기면 쓰기 실패로 종료됨)"""
+    client = _pubsub_client()
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(channel)
+    deadline = time.monotonic() + settings.EVENTS_STREAM_MAX_AGE
+    try:
+        yield f'retry: {settings.EVENTS_RETRY_MS}\n\n'
+        while time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=settings.EVENTS_HEARTBEAT_INTERVAL)
+            yield message['data'].decode() if message else HEARTBEAT_FRAME
+    finally:
+        pubsub.close()
+        client.close()
+
+
+def event_stream_response(channel):
+    response = StreamingHttpResponse(stream_events_sync(channel), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
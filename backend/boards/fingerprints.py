@@ -0,0 +1,81 @@
+"""
+작성자/투표자 fingerprint (IP + 분 단위 시각 -> BIP39 단어)
+
+- keyed(기본): 서버 비밀키로 keyed BLAKE2b 해시 후 FINGERPRINT_WORDS개 단어를 '-'로 연결
+  비밀키 없이는 IP 공간(IPv4 2^32)을 대입해 단어에서 IP를 찾아낼 수 없고,
+  단어 2개면 2048^2 구간이라 같은 분에 다른 사용자와 겹칠 일이 거의 없다.
+- legacy: 예전 결과와 같은 값 (SHA-256, 단어 1개, 로컬 시각 '%Y%m%d%H%M')
+같은 분에 같은 IP는 같은 값을 받으므로 (IP, 분) 단위로 계산 결과를 캐시한다.
+레이트 리밋은 분이 바뀌어도 같은 키를 써야 하므로 rate_limit_key(IP만의 keyed 해시)를 쓴다.
+"""
+import hashlib
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+# BIP39 영어 단어 목록 (2048개, 순서를 바꾸면 legacy 값이 달라짐)
+WORDLIST = tuple(Path(__file__).with_name('bip39_english.txt').read_text().split())
+WORD_BITS = 11  # 2048 = 2^11
+
+
+@lru_cache(maxsize=8)
+def _secret_key(secret: str) -> bytes:
+    """설정의 비밀값 -> BLAKE2b 키 (64바이트 제한이 있어 한 번 해시)"""
+    return hashlib.blake2b(secret.encode(), digest_size=32, person=b'fingerprint').digest()
+
+
+@lru_cache(maxsize=8192)
+def _keyed_fingerprint(ip_address: str, minute: int, secret: str, words: int) -> str:
+    digest = hashlib.blake2b(
+        f'{ip_address}:{minute}'.encode(), key=_secret_key(secret), digest_size=8
+    ).digest()
+    value = int.from_bytes(digest, 'big')
+    mask = len(WORDLIST) - 1
+    return '-'.join(WORDLIST[(value >> (WORD_BITS * i)) & mask] for i in range(words))
+
+
+@lru_cache(maxsize=8192)
+def _rate_limit_key(ip_address: str, secret: str) -> str:
+    return hashlib.blake2b(
+        ip_address.encode(), key=_secret_key(secret), digest_size=16, person=b'rate-limit'
+    ).hexdigest()
+
+
+def rate_limit_key(ip_address: str) -> str:
+    """
+    레이트 리밋 키 (IP의 keyed 해시)
+    fingerprint는 분마다 바뀌어 슬라이딩 윈도우가 분 단위 고정 윈도우가 되므로 시각을 넣지 않는다.
+    """
+    return _rate_limit_key(ip_address, settings.FINGERPRINT_SECRET)
+
+
+@lru_cache(maxsize=4)
+def _legacy_time_key(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime('%Y%m%d%H%M')
+
+
+@lru_cache(maxsize=8192)
+def _legacy_fingerprint(ip_address: str, time_key: str) -> str:
+    digest = hashlib.sha256(f'{ip_address}:{time_key}'.encode()).digest()
+    return WORDLIST[int.from_bytes(digest[:2], 'big') % 2048]
+
+
+def get_user_fingerprint(ip_address: str, timestamp: datetime = None) -> str:
+    """
+    IP 주소와 시간(1분 단위)으로 fingerprint 반환
+    timestamp를 주면 그 시각 기준 (직전 분의 값 확인 등)
+    """
+    if settings.FINGERPRINT_MODE == 'legacy':
+        if timestamp is None:
+            time_key = _legacy_time_key(int(time.time() // 60))
+        else:
+            time_key = timestamp.strftime('%Y%m%d%H%M')
+        return _legacy_fingerprint(ip_address, time_key)
+
+    minute = int((time.time() if timestamp is None else timestamp.timestamp()) // 60)
+    return _keyed_fingerprint(
+        ip_address, minute, settings.FINGERPRINT_SECRET, settings.FINGERPRINT_WORDS
+    )
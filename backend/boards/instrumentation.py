@@ -0,0 +1,431 @@
+"""
+요청 단위 계측
+
+- RequestMetricsMiddleware: 엔드포인트별 요청 수/지연시간 히스토그램(전체 요청)과
+  쿼리 수, DB/캐시/직렬화 시간(샘플링된 요청)을 집계
+- 집계값은 프로세스 메모리에 모았다가 METRICS_FLUSH_INTERVAL마다 Redis 해시에 합산
+  (gunicorn 워커 여러 개의 값을 /api/metrics/에서 한 번에 내보내기 위해)
+- 샘플링된 요청은 Server-Timing 헤더, N+1 의심 쿼리/느린 요청 로그를 남김
+"""
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from redis.connection import ConnectionPool
+
+from .caching import get_cache_metrics
+from .utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REQUEST_METRICS_KEY = 'metrics:requests'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_current = ContextVar('request_metrics', default=None)
+
+_lock = threading.Lock()
+_pending = Counter()  # 아직 Redis에 합산하지 않은 시계열 값
+_local_totals = Counter()  # Redis가 없을 때(로컬 개발) 누적값
+_last_flush = time.monotonic()
+
+
+class RequestMetrics:
+    """샘플링된 요청 하나의 계측값"""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_calls = 0
+        self.cache_time = 0.0
+        self.serialize_time = 0.0
+        self.statements = Counter()
+
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            setattr(self, f'{name}_time', getattr(self, f'{name}_time') + elapsed)
+
+
+def current_metrics():
+    """현재 요청이 샘플링 대상이면 RequestMetrics, 아니면 None"""
+    return _current.get()
+
+
+# ---------------------------------------------------------------------------
+# DB / Redis 훅
+# ---------------------------------------------------------------------------
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += time.perf_counter() - started
+        metrics.queries += 1
+        metrics.statements[sql] += 1
+
+
+@receiver(connection_created)
+def install_query_hook(sender, connection, **kwargs):
+    """
+    모든 DB 연결(스레드/alias별)에 쿼리 계측 훅을 한 번씩 설치
+    connection.execute_wrapper()는 마지막 항목을 pop하므로 맨 앞에 넣는다.
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _record_query)
+
+
+class RedisTimingMixin:
+    """명령 전송 ~ 응답 수신 시간을 현재 요청의 캐시 시간으로 기록"""
+
+    def send_packed_command(self, command, check_health=True):
+        metrics = _current.get()
+        if metrics is None:
+            return super().send_packed_command(command, check_health)
+        started = time.perf_counter()
+        try:
+            return super().send_packed_command(command, check_health)
+        finally:
+            metrics.cache_time += time.perf_counter() - started
+
+    def read_response(self, *args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return super().read_response(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().read_response(*args, **kwargs)
+        finally:
+            metrics.cache_time += time.perf_counter() - started
+            metrics.cache_calls += 1
+
+
+_timed_connection_classes = {}
+
+
+class InstrumentedConnectionPool(ConnectionPool):
+    """
+    django_redis CONNECTION_POOL_CLASS용
+    URL 스킴에 따라 정해진 연결 클래스(TCP/SSL/유닉스 소켓)에 타이밍 mixin을 씌운다.
+    """
+
+    def __init__(self, connection_class=None, **kwargs):
+        if connection_class is None:
+            from redis.connection import Connection
+            connection_class = Connection
+        timed = _timed_connection_classes.get(connection_class)
+        if timed is None:
+            timed = type(
+                f'Timed{connection_class.__name__}', (RedisTimingMixin, connection_class), {}
+            )
+            _timed_connection_classes[connection_class] = timed
+        super().__init__(connection_class=timed, **kwargs)
+
+
+class AsyncRedisTimingMixin:
+    """RedisTimingMixin의 redis.asyncio 버전"""
+
+    async def send_packed_command(self, command, check_health=True):
+        metrics = _current.get()
+        if metrics is None:
+            return await super().send_packed_command(command, check_health)
+        started = time.perf_counter()
+        try:
+            return await super().send_packed_command(command, check_health)
+        finally:
+            metrics.cache_time += time.perf_counter() - started
+
+    async def read_response(self, *args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return await super().read_response(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return await super().read_response(*args, **kwargs)
+        finally:
+            metrics.cache_time += time.perf_counter() - started
+            metrics.cache_calls += 1
+
+
+def instrument_async_pool(pool):
+    """redis.asyncio 연결 풀의 연결 클래스에 타이밍 mixin을 씌움 (연결을 만들기 전에 호출)"""
+    connection_class = pool.connection_class
+    timed = _timed_connection_classes.get(connection_class)
+    if timed is None:
+        timed = type(
+            f'Timed{connection_class.__name__}', (AsyncRedisTimingMixin, connection_class), {}
+        )
+        _timed_connection_classes[connection_class] = timed
+    pool.connection_class = timed
+    return pool
+
+
+# ---------------------------------------------------------------------------
+# 집계 / 내보내기
+# ---------------------------------------------------------------------------
+
+def _series(name, **labels):
+    if not labels:
+        return name
+    body = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    return f'{name}{{{body}}}'
+
+
+def _observe(endpoint, method, status, elapsed, metrics):
+    labels = {'endpoint': endpoint, 'method': method}
+    values = Counter()
+    values[_series('http_requests_total', status=status, **labels)] += 1
+    values[_series('http_request_duration_seconds_sum', **labels)] += elapsed
+    values[_series('http_request_duration_seconds_count', **labels)] += 1
+    for bound in LATENCY_BUCKETS:
+        if elapsed <= bound:
+            values[_series('http_request_duration_seconds_bucket', **labels, le=bound)] += 1
+    values[_series('http_request_duration_seconds_bucket', **labels, le='+Inf')] += 1
+
+    if metrics is not None:
+        values[_series('http_requests_sampled_total', **labels)] += 1
+        values[_series('http_request_db_queries_total', **labels)] += metrics.queries
+        values[_series('http_request_db_seconds_total', **labels)] += metrics.db_time
+        values[_series('http_request_cache_calls_total', **labels)] += metrics.cache_calls
+        values[_series('http_request_cache_seconds_total', **labels)] += metrics.cache_time
+        values[_series('http_request_serialize_seconds_total', **labels)] += metrics.serialize_time
+
+    with _lock:
+        _pending.update(values)
+
+
+def _flush_due():
+    return bool(_pending) and time.monotonic() - _last_flush >= settings.METRICS_FLUSH_INTERVAL
+
+
+def flush_request_metrics(force=False):
+    """메모리에 모인 값을 Redis 해시에 합산 (METRICS_FLUSH_INTERVAL마다)"""
+    global _last_flush
+    now = time.monotonic()
+    with _lock:
+        if not _pending or (not force and now - _last_flush < settings.METRICS_FLUSH_INTERVAL):
+            return
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = now
+
+    client = get_redis_client()
+    if client is None:
+        with _lock:
+            _local_totals.update(pending)
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for series, value in pending.items():
+            pipe.hincrbyfloat(REQUEST_METRICS_KEY, series, value)
+        pipe.execute()
+    except Exception:
+        # 메트릭 때문에 요청이 실패하면 안 됨 (이번 값은 버림)
+        logger.exception('요청 메트릭 저장 실패')
+
+
+def _sort_key(item):
+    """같은 라벨끼리 모으고 히스토그램 버킷은 le 숫자 순으로"""
+    series = item[0]
+    match = re.search(r',?le="([^"]+)"', series)
+    if match is None:
+        return series, 0.0
+    return series[:match.start()] + series[match.end():], float(match.group(1))
+
+
+def _format_value(value):
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_prometheus():
+    """Prometheus 텍스트 형식으로 전체 메트릭 출력"""
+    flush_request_metrics(force=True)
+    client = get_redis_client()
+    if client is None:
+        with _lock:
+            totals = dict(_local_totals)
+    else:
+        totals = {k.decode(): v.decode() for k, v in client.hgetall(REQUEST_METRICS_KEY).items()}
+
+    families = {}
+    for series, value in totals.items():
+        name = series.split('{', 1)[0]
+        family = re.sub(r'_(bucket|sum|count)$', '', name)
+        if family != 'http_request_duration_seconds':
+            family = name
+        families.setdefault(family, []).append((series, value))
+
+    lines = []
+    for family in sorted(families):
+        kind = 'histogram' if family == 'http_request_duration_seconds' else 'counter'
+        lines.append(f'# TYPE {family} {kind}')
+        for series, value in sorted(families[family], key=_sort_key):
+            lines.append(f'{series} {_format_value(value)}')
+
+    lines.append('# TYPE cache_requests_total counter')
+    for name, counts in sorted(get_cache_metrics().items()):
+        for result in ('hit', 'miss'):
+            series = _series('cache_requests_total', cache=name, result=result)
+            lines.append(f'{series} {counts[result]}')
+    return '\n'.join(lines) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# 미들웨어 / DRF mixin
+# ---------------------------------------------------------------------------
+
+def endpoint_name(view_func, request):
+    """지표 라벨 (PostViewSet.list, delete_comment 등 - URL 값이 들어가지 않게)"""
+    view_class = getattr(view_func, 'cls', None)
+    actions = getattr(view_func, 'actions', None)
+    if view_class is not None and actions:
+        return f"{view_class.__name__}.{actions.get(request.method.lower(), request.method.lower())}"
+    if view_class is not None:
+        return view_class.__name__
+    return getattr(view_func, '__name__', 'unknown')
+
+
+def request_endpoint(request):
+    """
+    뷰가 request.metrics_endpoint를 지정했으면 그 값(async 뷰), 아니면 URL에 연결된 뷰로 결정
+    """
+    endpoint = getattr(request, 'metrics_endpoint', None)
+    if endpoint:
+        return endpoint
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return endpoint_name(match.func, request)
+
+
+class RequestMetricsMiddleware:
+    """
+    MIDDLEWARE 맨 앞에 두어야 전체 지연시간이 측정됨
+    WSGI/ASGI 양쪽에서 동작 (ASGI에서는 스레드 전환 없이 async로 실행)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        metrics, token = self.start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, time.perf_counter() - started, metrics)
+        flush_request_metrics()
+        return response
+
+    async def __acall__(self, request):
+        metrics, token = self.start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, time.perf_counter() - started, metrics)
+        if _flush_due():
+            await sync_to_async(flush_request_metrics, thread_sensitive=False)()
+        return response
+
+    def start(self):
+        sampled = random.random() < settings.METRICS_SAMPLE_RATE
+        metrics = RequestMetrics() if sampled else None
+        return metrics, _current.set(metrics)
+
+    def finish(self, request, response, elapsed, metrics):
+        endpoint = request_endpoint(request)
+        _observe(endpoint, request.method, response.status_code, elapsed, metrics)
+        if metrics is not None:
+            self.report(request, endpoint, elapsed, metrics)
+            if settings.METRICS_SERVER_TIMING:
+                response['Server-Timing'] = server_timing(elapsed, metrics)
+
+    def report(self, request, endpoint, elapsed, metrics):
+        for sql, count in metrics.statements.items():
+            if count >= settings.METRICS_N_PLUS_ONE_THRESHOLD:
+                logger.warning(
+                    'N+1 의심: %s %s에서 같은 쿼리 %d회 실행 - %s',
+                    request.method, endpoint, count, sql[:300]
+                )
+        if elapsed * 1000 >= settings.METRICS_SLOW_REQUEST_MS:
+            logger.warning(
+                '느린 요청: %s %s %.1fms (쿼리 %d개 %.1fms, 캐시 %d회 %.1fms, 직렬화 %.1fms)',
+                request.method, request.get_full_path(), elapsed * 1000,
+                metrics.queries, metrics.db_time * 1000,
+                metrics.cache_calls, metrics.cache_time * 1000,
+                metrics.serialize_time * 1000,
+            )
+
+
+def server_timing(elapsed, metrics):
+    return ', '.join([
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+        f'cache;dur={metrics.cache_time * 1000:.1f};desc="{metrics.cache_calls} calls"',
+        f'serialize;dur={metrics.serialize_time * 1000:.1f}',
+        f'total;dur={elapsed * 1000:.1f}',
+    ])
+
+
+class TimedSerializer:
+    """serializer.data 평가 시간을 직렬화 시간으로 기록 (나머지 속성은 그대로 위임)"""
+
+    def __init__(self, serializer, metrics):
+        self._serializer = serializer
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self._serializer, name)
+
+    @property
+    def data(self):
+        with self._metrics.timer('serialize'):
+            return self._serializer.data
+
+
+class InstrumentedViewMixin:
+    """
+    DRF 뷰용: get_serializer()로 만든 serializer(또는 serialize()로 호출한 함수)의 직렬화 시간을 계측
+    (직렬화 중 실행되는 지연 쿼리 시간도 포함됨)
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        metrics = _current.get()
+        if metrics is None:
+            return serializer
+        return TimedSerializer(serializer, metrics)
+
+    def serialize(self, build, *args):
+        """serializer 없이 응답 데이터를 만드는 빠른 경로(boards/compiled.py)도 직렬화 시간으로 계측"""
+        metrics = _current.get()
+        if metrics is None:
+            return build(*args)
+        with metrics.timer('serialize'):
+            return build(*args)
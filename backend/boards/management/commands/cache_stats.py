@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from boards.caching import get_cache_metrics
+
+
+class Command(BaseCommand):
+    help = '응답 캐시 히트/미스 횟수와 히트율 출력'
+
+    def handle(self, *args, **options):
+        metrics = get_cache_metrics()
+        if not metrics:
+            self.stdout.write('기록된 캐시 통계가 없습니다.')
+            return
+        for name, counts in sorted(metrics.items()):
+            total = counts['hit'] + counts['miss']
+            rate = counts['hit'] / total * 100 if total else 0
+            self.stdout.write(
+                f"{name}: hit {counts['hit']} / miss {counts['miss']} ({rate:.1f}%)"
+            )
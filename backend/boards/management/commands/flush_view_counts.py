@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from boards.counters import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = 'Redis에 버퍼된 게시글 조회수를 DB에 일괄 반영'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='UPDATE 한 번에 반영할 게시글 수')
+        parser.add_argument('--interval', type=float, default=0,
+                            help='지정하면 N초마다 반복 실행 (워커 모드)')
+
+    def handle(self, *args, **options):
+        while True:
+            flushed = flush_view_counts(batch_size=options['batch_size'])
+            if flushed or not options['interval']:
+                self.stdout.write(f"조회수 반영: 게시글 {flushed}개")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
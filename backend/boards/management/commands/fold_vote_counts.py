@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from boards.votes import fold_vote_counts
+
+
+class Command(BaseCommand):
+    help = '투표 카운트 샤드에 쌓인 증가분을 게시글 추천/비추천 수에 합산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='한 번에 합산할 샤드 행 수')
+        parser.add_argument('--interval', type=float, default=0,
+                            help='지정하면 N초마다 반복 실행 (워커 모드)')
+
+    def handle(self, *args, **options):
+        while True:
+            post_ids = fold_vote_counts(batch_size=options['batch_size'])
+            if post_ids or not options['interval']:
+                self.stdout.write(f"투표 카운트 반영: 게시글 {len(set(post_ids))}개")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,198 @@
+import csv
+import io
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from boards.caching import bump_post_list_generation, invalidate_board_list
+from boards.fingerprints import WORDLIST
+from boards.models import Board, Comment, Post, Vote
+from boards.ranking import hot_score, rebuild_rankings
+from boards.utils import hash_password
+
+NICKNAMES = ['익명', 'ㅇㅇ', '지나가던사람', '눈팅족', '고독한코더', '새벽감성', '퇴근각', '비트코인존버']
+WORDS = ['오늘', '진짜', '이거', '근데', '아니', '그냥', '비트코인', '떡상', '떡락', '존버',
+         '점심', '뭐먹지', 'ㅋㅋㅋ', '레알', '후기', '질문', '정보', '공유', '생각', '어떻게']
+
+
+@contextmanager
+def manual_timestamps(*models):
+    """bulk_create 시 auto_now/auto_now_add를 끄고 지정한 시각을 그대로 저장"""
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def power_law(rng, alpha, scale, cap):
+    """대부분은 0~소수, 일부 게시글에 몰리는 long-tail 분포"""
+    return min(int((rng.paretovariate(alpha) - 1) * scale), cap)
+
+
+def sentence(rng, n):
+    return ' '.join(rng.choices(WORDS, k=n))
+
+
+class Command(BaseCommand):
+    help = '대량의 게시글/댓글/투표 데이터를 현실적인 분포로 생성 (부하 재현용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=100000, help='생성할 게시글 수')
+        parser.add_argument('--board', default='free', help='대상 게시판 타입')
+        parser.add_argument('--days', type=int, default=365, help='게시글 작성 시각 분포 기간(일)')
+        parser.add_argument('--comment-scale', type=float, default=3.0,
+                            help='게시글당 댓글 수 분포 크기 (클수록 많음)')
+        parser.add_argument('--vote-scale', type=float, default=5.0,
+                            help='게시글당 투표 수 분포 크기 (클수록 많음)')
+        parser.add_argument('--batch-size', type=int, default=2000,
+                            help='한 번에 처리할 게시글 수 (메모리 사용량 결정)')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            board = Board.objects.get(board_type=options['board'])
+        except Board.DoesNotExist:
+            raise CommandError(f"게시판이 없습니다: {options['board']} (init_data.py 먼저 실행)")
+
+        self.rng = random.Random(options['seed'])
+        self.password_hash = hash_password('load1234')
+        # 댓글 본문은 미리 만든 문장 풀에서 골라 생성 비용을 줄임
+        self.comment_texts = [sentence(self.rng, self.rng.randint(1, 20)) for _ in range(5000)]
+        self.use_copy = connection.vendor == 'postgresql'
+
+        total = options['posts']
+        batch_size = options['batch_size']
+        now = self.now = timezone.now()
+        start = now - timedelta(days=options['days'])
+        step = (now - start) / max(total, 1)
+
+        started = time.monotonic()
+        counts = {'posts': 0, 'comments': 0, 'votes': 0}
+        with manual_timestamps(Post, Comment, Vote):
+            for offset in range(0, total, batch_size):
+                size = min(batch_size, total - offset)
+                batch_start = start + step * offset
+                created = self.generate_batch(board, batch_start, step, size, options)
+                for key, value in created.items():
+                    counts[key] += value
+
+                elapsed = time.monotonic() - started
+                rows = sum(counts.values())
+                self.stdout.write(
+                    f"  게시글 {counts['posts']:,}/{total:,} · 전체 {rows:,}행 "
+                    f"({rows / max(elapsed, 1e-9):,.0f}행/초)"
+                )
+
+        Board.objects.filter(pk=board.pk).update(post_count=F('post_count') + counts['posts'])
+        invalidate_board_list()
+        bump_post_list_generation(board.board_type)
+        rebuild_rankings()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 게시글 {counts['posts']:,} · 댓글 {counts['comments']:,} · "
+            f"투표 {counts['votes']:,} ({elapsed:.1f}초)"
+        ))
+
+    def generate_batch(self, board, batch_start, step, size, options):
+        rng = self.rng
+        posts, plans = [], []
+        for i in range(size):
+            created_at = batch_start + step * i
+            n_comments = power_law(rng, 1.5, options['comment_scale'], 5000)
+            n_votes = power_law(rng, 1.3, options['vote_scale'], len(WORDLIST))
+            voters = rng.sample(WORDLIST, n_votes)
+            # 글마다 비추천 비율을 다르게
+            down_ratio = rng.uniform(0.05, 0.4)
+            vote_types = rng.choices((1, -1), (1 - down_ratio, down_ratio), k=n_votes)
+            up = vote_types.count(1)
+            down = n_votes - up
+
+            posts.append(Post(
+                board=board,
+                title=sentence(rng, rng.randint(2, 8)),
+                content=sentence(rng, rng.randint(5, 80)),
+                author_name=rng.choice(NICKNAMES),
+                password_hash=self.password_hash,
+                author_fingerprint=rng.choice(WORDLIST),
+                upvote_count=up,
+                downvote_count=down,
+                view_count=n_votes * rng.randint(3, 30) + rng.randint(0, 50),
+                comment_count=n_comments,
+                hot_score=hot_score(up, down, n_comments, created_at),
+                created_at=created_at,
+                updated_at=created_at,
+            ))
+            plans.append((n_comments, voters, vote_types))
+
+        with transaction.atomic():
+            Post.objects.bulk_create(posts)
+
+            # 최근 글의 댓글/투표가 미래 시각이 되지 않도록 현재 시각으로 자름
+            # (미래 행은 (created_at, id) 댓글 커서 순서를 깨고 다음 달 파티션에 들어감)
+            now = self.now
+            comment_rows, vote_rows = [], []
+            for post, (n_comments, voters, vote_types) in zip(posts, plans):
+                texts = rng.choices(self.comment_texts, k=n_comments)
+                names = rng.choices(NICKNAMES, k=n_comments)
+                fingerprints = rng.choices(WORDLIST, k=n_comments)
+                for text, name, fingerprint in zip(texts, names, fingerprints):
+                    comment_rows.append((
+                        post.pk,
+                        text,
+                        name,
+                        self.password_hash,
+                        fingerprint,
+                        min(now, post.created_at + timedelta(seconds=rng.random() * 3 * 86400)),
+                    ))
+                for voter, vote_type in zip(voters, vote_types):
+                    vote_rows.append((
+                        post.pk,
+                        voter,
+                        vote_type,
+                        min(now, post.created_at + timedelta(seconds=rng.random() * 86400)),
+                    ))
+
+            self.insert_rows(
+                Comment,
+                ['post_id', 'content', 'author_name', 'password_hash',
+                 'author_fingerprint', 'created_at'],
+                comment_rows,
+            )
+            self.insert_rows(
+                Vote, ['post_id', 'voter_fingerprint', 'vote_type', 'created_at'], vote_rows
+            )
+
+        return {'posts': len(posts), 'comments': len(comment_rows), 'votes': len(vote_rows)}
+
+    def insert_rows(self, model, columns, rows):
+        """PostgreSQL은 COPY, 그 외 DB는 bulk_create"""
+        if not rows:
+            return
+        if not self.use_copy:
+            model.objects.bulk_create(
+                [model(**dict(zip(columns, row))) for row in rows], batch_size=1000
+            )
+            return
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {model._meta.db_table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
@@ -0,0 +1,93 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from boards.models import Comment, Post
+from boards.partitions import (
+    archive_partition, detach_partition, ensure_partitions, is_partitioned,
+    list_partitions, old_partitions
+)
+
+PARTITIONED_MODELS = (Post, Comment)
+
+
+class Command(BaseCommand):
+    help = '게시글/댓글 월별 파티션 관리 (미리 생성, 오래된 파티션 보관/분리)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ahead', type=int, default=3,
+                            help='이번 달부터 N달 뒤까지 파티션을 미리 생성')
+        parser.add_argument('--archive-after', type=int, default=0,
+                            help='끝난 지 N달 지난 파티션을 보관 계층으로 이동 (0이면 안 함)')
+        parser.add_argument('--archive-tablespace', default=None,
+                            help='보관 파티션을 옮길 테이블스페이스 (없으면 VACUUM FREEZE만)')
+        parser.add_argument('--detach-after', type=int, default=0,
+                            help='끝난 지 N달 지난 파티션을 분리 (API에서 더 이상 조회되지 않음, 0이면 안 함)')
+        parser.add_argument('--list', action='store_true', help='파티션 목록과 크기만 출력')
+        parser.add_argument('--interval', type=float, default=0,
+                            help='지정하면 N초마다 반복 실행 (워커 모드)')
+
+    def handle(self, *args, **options):
+        if options['detach_after'] and options['detach_after'] <= options['archive_after']:
+            raise CommandError('--detach-after는 --archive-after보다 커야 합니다.')
+        with connection.cursor() as cursor:
+            tables = [m._meta.db_table for m in PARTITIONED_MODELS]
+            tables = [table for table in tables if is_partitioned(cursor, table)]
+        if not tables:
+            raise CommandError('파티션 테이블이 없습니다. (PostgreSQL에서 migrate 필요)')
+
+        if options['list']:
+            for table in tables:
+                self.list_partitions(table)
+            return
+
+        while True:
+            for table in tables:
+                self.manage(table, options)
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def manage(self, table, options):
+        with transaction.atomic(), connection.cursor() as cursor:
+            created = ensure_partitions(cursor, table, options['ahead'])
+        if created:
+            self.stdout.write(f"{table}: 파티션 생성 {', '.join(created)}")
+
+        # 보관 이동(VACUUM)은 트랜잭션 밖에서 파티션 하나씩
+        if options['archive_after']:
+            with connection.cursor() as cursor:
+                for partition in old_partitions(cursor, table, options['archive_after']):
+                    tablespace = options['archive_tablespace']
+                    if partition.archived and (not tablespace or partition.tablespace == tablespace):
+                        continue
+                    started = time.monotonic()
+                    archive_partition(cursor, partition, tablespace)
+                    self.stdout.write(
+                        f"{table}: 보관 {partition.name} ({time.monotonic() - started:.1f}초)"
+                    )
+
+        if options['detach_after']:
+            with connection.cursor() as cursor:
+                for partition in old_partitions(cursor, table, options['detach_after']):
+                    with transaction.atomic():
+                        detach_partition(cursor, table, partition)
+                    self.stdout.write(f"{table}: 분리 {partition.name}")
+
+    def list_partitions(self, table):
+        with connection.cursor() as cursor:
+            partitions = list_partitions(cursor, table)
+            self.stdout.write(f"{table}")
+            for partition in partitions:
+                cursor.execute("""
+                    SELECT c.reltuples::bigint, pg_table_size(c.oid), pg_indexes_size(c.oid)
+                    FROM pg_class c WHERE c.oid = to_regclass(%s)
+                """, [partition.name])
+                rows, table_size, index_size = cursor.fetchone()
+                tier = '보관' if partition.archived else '일반'
+                self.stdout.write(
+                    f"  {partition.name:28} {max(rows, 0):>12,}행 "
+                    f"테이블 {table_size / 2 ** 20:>9.1f}MB 인덱스 {index_size / 2 ** 20:>9.1f}MB "
+                    f"{tier} {partition.tablespace or ''}"
+                )
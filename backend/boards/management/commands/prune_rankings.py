@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from boards.ranking import prune_rankings
+from boards.utils import get_redis_client
+
+
+class Command(BaseCommand):
+    help = 'sort=top 기간별 랭킹(Redis)에서 기간이 지난 글을 제거'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0,
+                            help='지정하면 N초마다 반복 실행 (워커 모드)')
+
+    def handle(self, *args, **options):
+        client = get_redis_client()
+        if client is None:
+            raise CommandError('Redis가 없으면 sort=top은 DB 쿼리로 처리되므로 정리할 랭킹이 없습니다.')
+        while True:
+            removed = prune_rankings(client)
+            if removed or not options['interval']:
+                self.stdout.write(f"랭킹에서 제거: {removed}개")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
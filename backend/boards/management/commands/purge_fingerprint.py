@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from boards.activity import purge_fingerprint
+
+
+class Command(BaseCommand):
+    help = 'fingerprint가 쓴 글/댓글과 투표를 배치 단위로 삭제 (모더레이션)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fingerprint')
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='트랜잭션 하나에서 삭제할 행 수')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='배치 사이에 쉬는 시간(초)')
+
+    def handle(self, *args, **options):
+        deleted = purge_fingerprint(
+            options['fingerprint'], batch_size=options['batch_size'], pause=options['pause']
+        )
+        self.stdout.write(
+            f"삭제: 댓글 {deleted['comments']}개, 투표 {deleted['votes']}개, 글 {deleted['posts']}개"
+        )
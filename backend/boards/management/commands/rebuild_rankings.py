@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from boards.ranking import rebuild_rankings
+
+
+class Command(BaseCommand):
+    help = 'DB 기준으로 sort=top 기간별 랭킹(Redis)을 다시 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_rankings(batch_size=options['batch_size'])
+        self.stdout.write(f"랭킹 재생성: {rebuilt}개 항목")
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from boards.caching import bump_post_list_generation, invalidate_board_list
+from boards.counters import flush_comment_counts, pending_comment_post_ids
+from boards.models import Board, Comment, Post
+from boards.partitions import comments_since
+from boards.ranking import refresh_hot_scores
+
+
+class Command(BaseCommand):
+    help = '캐시된 카운트 컬럼을 실제 행 수로 다시 계산해 어긋난 값을 복구'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='댓글 수를 한 번에 고칠 게시글 수')
+
+    def handle(self, *args, **options):
+        self.reconcile_board_post_count()
+        self.reconcile_post_comment_count(options['batch_size'])
+
+    def reconcile_board_post_count(self):
+        counts = (
+            Post.objects.filter(board=OuterRef('pk'))
+            .order_by().values('board').annotate(c=Count('id')).values('c')
+        )
+        actual = Coalesce(Subquery(counts), 0)
+        fixed = (
+            Board.objects.annotate(actual=actual)
+            .exclude(post_count=actual)
+            .update(post_count=actual)
+        )
+        invalidate_board_list()
+        self.stdout.write(f"게시판 글 수 복구: {fixed}개")
+
+    def reconcile_post_comment_count(self, batch_size):
+        """
+        Post.comment_count를 (post, created_at) 인덱스로 센 실제 댓글 수로 복구
+        버퍼를 먼저 반영하고, 그 사이에 다시 증감이 쌓인 글은 다음 실행으로 미룸
+        """
+        flush_comment_counts()
+        counts = (
+            Comment.objects.filter(
+                post=OuterRef('pk'), created_at__gte=comments_since(OuterRef('created_at'))
+            )
+            .order_by().values('post').annotate(c=Count('id')).values('c')
+        )
+        actual = Coalesce(Subquery(counts), 0)
+        drifted = list(
+            Post.objects.annotate(actual=actual)
+            .exclude(comment_count=actual)
+            .exclude(pk__in=pending_comment_post_ids())
+            .values_list('id', 'board__board_type')
+        )
+        for start in range(0, len(drifted), batch_size):
+            post_ids = [post_id for post_id, _ in drifted[start:start + batch_size]]
+            Post.objects.filter(pk__in=post_ids).update(comment_count=actual)
+            refresh_hot_scores(post_ids)
+        if drifted:
+            bump_post_list_generation(*{board_type for _, board_type in drifted})
+        self.stdout.write(f"게시글 댓글 수 복구: {len(drifted)}개")
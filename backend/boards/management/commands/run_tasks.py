@@ -0,0 +1,53 @@
+import socket
+
+from django.core.management.base import BaseCommand, CommandError
+
+from boards.tasks import process, queue_stats, recover, requeue_dead, sync_mode
+from boards.utils import get_redis_client
+
+# 큐가 비었을 때 한 번에 기다리는 최대 시간(초) - 캐시 연결의 socket_timeout(2초)보다 짧게
+MAX_BLOCK_SECONDS = 1
+
+
+class Command(BaseCommand):
+    help = '쓰기 요청이 넘긴 후속 작업(게시판 글 수, 랭킹, 이벤트 발행 등)을 Redis 큐에서 꺼내 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='한 번에 꺼내 묶어 실행할 메시지 수')
+        parser.add_argument('--interval', type=float, default=0,
+                            help='지정하면 큐가 빌 때 최대 N초씩 기다리며 계속 실행 (워커 모드)')
+        parser.add_argument('--name', default=socket.gethostname(),
+                            help='워커 이름 (처리 중 목록 키, 재시작 시 같은 이름의 미완료 메시지를 되돌림)')
+        parser.add_argument('--requeue-dead', action='store_true',
+                            help='재시도를 다 쓴 메시지를 다시 큐에 넣고 종료')
+
+    def handle(self, *args, **options):
+        client = get_redis_client()
+        if client is None or sync_mode():
+            raise CommandError('동기 모드(Redis 없음 또는 TASKS_SYNC=True)에서는 작업이 바로 실행됩니다.')
+
+        if options['requeue_dead']:
+            self.stdout.write(f"다시 넣은 작업: {requeue_dead(client)}개")
+            return
+
+        name = options['name']
+        recovered = recover(client, name)
+        if recovered:
+            self.stdout.write(f"이전 워커({name})의 미완료 작업 {recovered}개를 큐로 되돌림")
+
+        interval = options['interval']
+        timeout = min(interval, MAX_BLOCK_SECONDS)
+        total = 0
+        while True:
+            processed = process(client, name, batch_size=options['batch_size'], timeout=timeout)
+            total += processed
+            if processed and interval:
+                self.stdout.write(f"작업 실행: {processed}개")
+            if not processed and not interval:
+                break
+        stats = queue_stats(client)
+        self.stdout.write(
+            f"작업 실행: {total}개 (대기 {stats['queued']} / 재시도 대기 {stats['delayed']} "
+            f"/ 실패 {stats['dead']})"
+        )
@@ -0,0 +1,103 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Board',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='게시판명')),
+                ('board_type', models.CharField(choices=[('free', '자유게시판'), ('news', '뉴스게시판')], max_length=10, unique=True, verbose_name='게시판 타입')),
+                ('description', models.TextField(blank=True, verbose_name='설명')),
+                ('order', models.IntegerField(default=0, verbose_name='정렬순서')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '게시판',
+                'verbose_name_plural': '게시판',
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Post',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('author_name', models.CharField(max_length=50, verbose_name='작성자')),
+                ('password_hash', models.CharField(max_length=64)),
+                ('author_fingerprint', models.CharField(db_index=True, max_length=20)),
+                ('upvote_count', models.IntegerField(default=0, verbose_name='추천수')),
+                ('downvote_count', models.IntegerField(default=0, verbose_name='비추천수')),
+                ('view_count', models.IntegerField(default=0, verbose_name='조회수')),
+                ('comment_count', models.IntegerField(default=0, verbose_name='댓글수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='작성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posts', to='boards.board', verbose_name='게시판')),
+            ],
+            options={
+                'verbose_name': '게시글',
+                'verbose_name_plural': '게시글',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('author_name', models.CharField(max_length=50, verbose_name='작성자')),
+                ('password_hash', models.CharField(max_length=64)),
+                ('author_fingerprint', models.CharField(db_index=True, max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='작성일')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='boards.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '댓글',
+                'verbose_name_plural': '댓글',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Vote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('voter_fingerprint', models.CharField(db_index=True, max_length=20)),
+                ('vote_type', models.SmallIntegerField(choices=[(1, '추천'), (-1, '비추천')], verbose_name='투표 타입')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='boards.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '투표',
+                'verbose_name_plural': '투표',
+                'indexes': [models.Index(fields=['post', 'voter_fingerprint'], name='boards_vote_post_id_85fad9_idx')],
+                'unique_together': {('post', 'voter_fingerprint')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_at'], name='boards_post_created_4f7dca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-created_at'], name='boards_post_board_i_044b17_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-upvote_count'], name='boards_post_upvote__a265c1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at'], name='boards_comm_post_id_794b50_idx'),
+        ),
+    ]
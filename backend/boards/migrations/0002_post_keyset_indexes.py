@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='boards_post_created_4f7dca_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='boards_post_board_i_044b17_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='boards_post_upvote__a265c1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_at', '-id'], name='boards_post_created_6ffabb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-created_at', '-id'], name='boards_post_board_i_b2c7e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-upvote_count', '-created_at', '-id'], name='boards_post_upvote__c06592_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-upvote_count', '-created_at', '-id'], name='boards_post_board_i_779077_idx'),
+        ),
+    ]
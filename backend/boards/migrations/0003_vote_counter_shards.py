@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_post_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VoteCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.SmallIntegerField()),
+                ('upvote_delta', models.IntegerField(default=0)),
+                ('downvote_delta', models.IntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vote_shards', to='boards.post')),
+            ],
+            options={
+                'verbose_name': '투표 카운트 샤드',
+                'verbose_name_plural': '투표 카운트 샤드',
+                'unique_together': {('post', 'shard')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_post_count(apps, schema_editor):
+    Board = apps.get_model('boards', 'Board')
+    Post = apps.get_model('boards', 'Post')
+    counts = (
+        Post.objects.filter(board=OuterRef('pk'))
+        .order_by().values('board').annotate(c=Count('id')).values('c')
+    )
+    Board.objects.update(post_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_vote_counter_shards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='post_count',
+            field=models.IntegerField(default=0, verbose_name='게시글수'),
+        ),
+        migrations.RunPython(backfill_post_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:16
+
+from django.db import migrations, models
+
+
+def backfill_hot_score(apps, schema_editor):
+    from boards.ranking import hot_score
+
+    Post = apps.get_model('boards', 'Post')
+    batch = []
+    for post in Post.objects.only(
+        'id', 'upvote_count', 'downvote_count', 'comment_count', 'created_at'
+    ).iterator(chunk_size=2000):
+        post.hot_score = hot_score(
+            post.upvote_count, post.downvote_count, post.comment_count, post.created_at
+        )
+        batch.append(post)
+        if len(batch) >= 2000:
+            Post.objects.bulk_update(batch, ['hot_score'])
+            batch = []
+    Post.objects.bulk_update(batch, ['hot_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_board_post_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0, verbose_name='인기점수'),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-hot_score', '-id'], name='boards_post_hot_sco_68c02f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-hot_score', '-id'], name='boards_post_board_i_544335_idx'),
+        ),
+    ]
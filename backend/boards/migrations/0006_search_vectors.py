@@ -0,0 +1,135 @@
+from django.db import migrations
+
+# 한국어는 조사가 붙어 단어 단위 검색이 어렵기 때문에 한글이 포함된 단어는 2글자씩(bigram)
+# 잘라 색인한다. ("비트코인이" -> 비트, 트코, 코인, 인이 / "비트코인" 검색 시 비트 & 트코 & 코인)
+# to_tsvector 파서는 DB 로케일에 따라 한글을 버릴 수 있어 tsvector 문자열을 직접 만든다.
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION boards_search_terms(doc text)
+RETURNS TABLE(term text, pos bigint) AS $$
+    SELECT CASE WHEN w.hangul THEN substr(w.word, g.i, 2) ELSE w.word END,
+           row_number() OVER (ORDER BY w.n, g.i)
+    FROM (
+        SELECT s.word, s.n, char_length(s.word) > 1 AND s.word ~ '[가-힣]' AS hangul
+        FROM regexp_split_to_table(lower(coalesce(doc, '')), '[[:space:][:punct:]]+')
+             WITH ORDINALITY AS s(word, n)
+        WHERE s.word <> '' AND octet_length(s.word) < 2000
+    ) w
+    CROSS JOIN LATERAL generate_series(
+        1, CASE WHEN w.hangul THEN char_length(w.word) - 1 ELSE 1 END
+    ) AS g(i)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION boards_search_vector(doc text, weight text)
+RETURNS tsvector AS $$
+    SELECT coalesce(
+        string_agg(format('''%s'':%s%s', term, least(pos, 16383), weight), ' '), ''
+    )::tsvector
+    FROM boards_search_terms(doc)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION boards_search_query(q text)
+RETURNS tsquery AS $$
+    SELECT coalesce(string_agg(
+        format('''%s''%s', term,
+               CASE WHEN char_length(term) = 1 AND term ~ '[가-힣]' THEN ':*' ELSE '' END),
+        ' & '
+    ), '')::tsquery
+    FROM (SELECT DISTINCT term FROM boards_search_terms(q)) t
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+ALTER TABLE boards_post ADD COLUMN search_vector tsvector;
+ALTER TABLE boards_comment ADD COLUMN search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION boards_post_search_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := boards_search_vector(NEW.title, 'A')
+                      || boards_search_vector(NEW.content, 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION boards_comment_search_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := boards_search_vector(NEW.content, 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER boards_post_search BEFORE INSERT OR UPDATE OF title, content
+    ON boards_post FOR EACH ROW EXECUTE FUNCTION boards_post_search_update();
+CREATE TRIGGER boards_comment_search BEFORE INSERT OR UPDATE OF content
+    ON boards_comment FOR EACH ROW EXECUTE FUNCTION boards_comment_search_update();
+"""
+
+BACKFILL_SQL = {
+    'boards_post': """
+        UPDATE boards_post
+        SET search_vector = boards_search_vector(title, 'A') || boards_search_vector(content, 'B')
+        WHERE id >= %s AND id < %s
+    """,
+    'boards_comment': """
+        UPDATE boards_comment SET search_vector = boards_search_vector(content, 'C')
+        WHERE id >= %s AND id < %s
+    """,
+}
+
+INDEX_SQL = [
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS boards_post_search_idx '
+    'ON boards_post USING gin (search_vector)',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS boards_comment_search_idx '
+    'ON boards_comment USING gin (search_vector)',
+]
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS boards_post_search ON boards_post;
+DROP TRIGGER IF EXISTS boards_comment_search ON boards_comment;
+DROP FUNCTION IF EXISTS boards_post_search_update();
+DROP FUNCTION IF EXISTS boards_comment_search_update();
+DROP INDEX IF EXISTS boards_post_search_idx;
+DROP INDEX IF EXISTS boards_comment_search_idx;
+ALTER TABLE boards_post DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE boards_comment DROP COLUMN IF EXISTS search_vector;
+DROP FUNCTION IF EXISTS boards_search_query(text);
+DROP FUNCTION IF EXISTS boards_search_vector(text, text);
+DROP FUNCTION IF EXISTS boards_search_terms(text);
+"""
+
+BATCH_SIZE = 10000
+
+
+def create_search_vectors(apps, schema_editor):
+    """PostgreSQL 전용 (SQLite 개발 환경은 boards.search의 icontains 검색 사용)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(CREATE_SQL)
+        # 기존 행은 id 범위 단위로 채움 (non-atomic 마이그레이션이라 배치마다 커밋)
+        for table, sql in BACKFILL_SQL.items():
+            cursor.execute(f'SELECT min(id), max(id) FROM {table}')
+            low, high = cursor.fetchone()
+            if low is None:
+                continue
+            for start in range(low, high + 1, BATCH_SIZE):
+                cursor.execute(sql, [start, start + BATCH_SIZE])
+        # 색인 생성 중에도 쓰기가 막히지 않도록
+        for sql in INDEX_SQL:
+            cursor.execute(sql)
+
+
+def drop_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('boards', '0005_post_hot_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vectors, drop_search_vectors),
+    ]
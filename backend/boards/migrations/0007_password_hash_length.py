@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='password_hash',
+            field=models.CharField(max_length=128),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='password_hash',
+            field=models.CharField(max_length=128),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0007_password_hash_length'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='author_fingerprint',
+            field=models.CharField(db_index=True, max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='author_fingerprint',
+            field=models.CharField(db_index=True, max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='vote',
+            name='voter_fingerprint',
+            field=models.CharField(db_index=True, max_length=32),
+        ),
+    ]
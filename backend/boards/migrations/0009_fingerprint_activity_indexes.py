@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0008_fingerprint_length'),
+    ]
+
+    operations = [
+        # 새 복합 인덱스를 먼저 만든 뒤 기존 단일 컬럼 인덱스 제거
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['author_fingerprint', '-created_at', '-id'], name='boards_comm_author__17becc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author_fingerprint', '-created_at', '-id'], name='boards_post_author__78ffeb_idx'),
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='author_fingerprint',
+            field=models.CharField(max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='author_fingerprint',
+            field=models.CharField(max_length=32),
+        ),
+    ]
@@ -0,0 +1,118 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from boards.partitions import create_partition, ensure_partitions, is_partitioned
+
+# boards_post, boards_comment를 created_at 기준 월별 RANGE 파티션 테이블로 바꾼다. (PostgreSQL 전용)
+# 파티션 테이블의 기본키/유니크 제약은 파티션 키를 포함해야 하므로 기본키가 (id, created_at)가 되고,
+# 이 테이블을 가리키는 FK 제약은 둘 수 없어 먼저 db_constraint=False로 바꾼다. (CASCADE는 ORM이 처리)
+# boards_vote는 (post, voter_fingerprint) 유니크 제약에 created_at을 넣을 수 없어 파티션하지 않는다.
+PARTITIONED_TABLES = ['boards_post', 'boards_comment']
+MONTHS_AHEAD = 3
+
+
+def _table_ddl(cursor, table):
+    """테이블을 다시 만들 때 옮겨야 할 인덱스/FK/트리거 정의 (기본키 제외)"""
+    cursor.execute("""
+        SELECT pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        WHERE x.indrelid = to_regclass(%s) AND NOT x.indisprimary
+    """, [table])
+    # 파티션 테이블의 인덱스는 'ON ONLY'로 나오므로 파티션까지 만들어지게 뺀다.
+    statements = [row[0].replace(' ON ONLY ', ' ON ') for row in cursor.fetchall()]
+    cursor.execute("""
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'
+    """, [table])
+    statements += [
+        f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}'
+        for name, definition in cursor.fetchall()
+    ]
+    cursor.execute("""
+        SELECT pg_get_triggerdef(oid) FROM pg_trigger
+        WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal
+    """, [table])
+    statements += [row[0] for row in cursor.fetchall()]
+    return statements
+
+
+def _rebuild_table(cursor, table, partitioned):
+    """
+    같은 컬럼의 새 테이블(partitioned면 월별 파티션)을 만들어 데이터를 옮기고
+    인덱스/FK/트리거를 같은 이름으로 다시 만든다. (마이그레이션 트랜잭션 안에서 실행)
+    """
+    old = f'{table}_old'
+    statements = _table_ddl(cursor, table)
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+    sequence = cursor.fetchone()[0]
+    cursor.execute(f'SELECT min(created_at), max(id) FROM {table}')
+    oldest, max_id = cursor.fetchone()
+
+    cursor.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    cursor.execute(f'ALTER SEQUENCE {sequence} RENAME TO {old}_id_seq')
+    # 파티션 테이블은 (PostgreSQL 16까지) identity 컬럼을 지원하지 않아 시퀀스 기본값을 쓴다.
+    cursor.execute(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS '
+        f'INCLUDING STORAGE)' + (' PARTITION BY RANGE (created_at)' if partitioned else '')
+    )
+    cursor.execute(f'CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    cursor.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+    if partitioned:
+        create_partition(cursor, table)
+        ensure_partitions(cursor, table, MONTHS_AHEAD, since=oldest)
+
+    cursor.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    if max_id is not None:
+        cursor.execute(f"SELECT setval('{table}_id_seq', %s)", [max_id])
+    cursor.execute(f'DROP TABLE {old}')
+
+    primary_key = '(id, created_at)' if partitioned else '(id)'
+    cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY {primary_key}')
+    for sql in statements:
+        cursor.execute(sql)
+    cursor.execute(f'ANALYZE {table}')
+
+
+def partition_tables(apps, schema_editor):
+    """PostgreSQL 전용 (SQLite 개발 환경은 일반 테이블 그대로)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(cursor, table):
+                _rebuild_table(cursor, table, partitioned=True)
+
+
+def unpartition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            if is_partitioned(cursor, table):
+                _rebuild_table(cursor, table, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0009_fingerprint_activity_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='boards.post', verbose_name='게시글'),
+        ),
+        migrations.AlterField(
+            model_name='vote',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='boards.post', verbose_name='게시글'),
+        ),
+        migrations.AlterField(
+            model_name='votecountershard',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='vote_shards', to='boards.post'),
+        ),
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
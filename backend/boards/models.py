@@ -18,6 +18,10 @@ class Board(models.Model):
     )
     description = models.TextField(blank=True, verbose_name='설명')
     order = models.IntegerField(default=0, verbose_name='정렬순서')
+    
+    # 게시글수 캐시 (signals에서 작성/삭제 시 갱신)
+    post_count = models.IntegerField(default=0, verbose_name='게시글수')
+    
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -42,10 +46,10 @@ class Post(models.Model):
     author_name = models.CharField(max_length=50, verbose_name='작성자')
     
     # 비밀번호 해시 (수정/삭제용)
-    password_hash = models.CharField(max_length=64)
+    password_hash = models.CharField(max_length=128)
     
-    # 작성자 고유 식별자 (니모닉 단어)
-    author_fingerprint = models.CharField(max_length=20, db_index=True)
+    # 작성자 고유 식별자 (니모닉 단어, 활동 타임라인용 복합 인덱스가 검색도 담당)
+    author_fingerprint = models.CharField(max_length=32)
     
     # 추천/비추천 카운트 (캐시)
     upvote_count = models.IntegerField(default=0, verbose_name='추천수')
@@ -57,15 +61,24 @@ class Post(models.Model):
     # 댓글수 캐시
     comment_count = models.IntegerField(default=0, verbose_name='댓글수')
     
+    # 시간 감쇠 인기 점수 (boards.ranking.hot_score, 투표/댓글 반영 시 갱신)
+    hot_score = models.FloatField(default=0, verbose_name='인기점수')
+    
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
     class Meta:
         ordering = ['-created_at']
+        # keyset 페이지네이션 정렬키와 동일한 복합 인덱스 (id는 동률 처리용)
         indexes = [
-            models.Index(fields=['-created_at']),
-            models.Index(fields=['board', '-created_at']),
-            models.Index(fields=['-upvote_count']),
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['board', '-created_at', '-id']),
+            models.Index(fields=['-upvote_count', '-created_at', '-id']),
+            models.Index(fields=['board', '-upvote_count', '-created_at', '-id']),
+            models.Index(fields=['-hot_score', '-id']),
+            models.Index(fields=['board', '-hot_score', '-id']),
+            # fingerprint별 활동 타임라인 (boards.activity)
+            models.Index(fields=['author_fingerprint', '-created_at', '-id']),
         ]
         verbose_name = '게시글'
         verbose_name_plural = '게시글'
@@ -76,20 +89,22 @@ class Post(models.Model):
 
 class Comment(models.Model):
     """댓글"""
+    # 게시글 테이블이 월별 파티션(기본키 id, created_at)이라 DB FK 제약 없이 ORM이 CASCADE 처리
     post = models.ForeignKey(
         Post, 
         on_delete=models.CASCADE, 
         related_name='comments',
+        db_constraint=False,
         verbose_name='게시글'
     )
     content = models.TextField(verbose_name='내용')
     author_name = models.CharField(max_length=50, verbose_name='작성자')
     
     # 비밀번호 해시 (삭제용)
-    password_hash = models.CharField(max_length=64)
+    password_hash = models.CharField(max_length=128)
     
-    # 작성자 고유 식별자 (니모닉 단어)
-    author_fingerprint = models.CharField(max_length=20, db_index=True)
+    # 작성자 고유 식별자 (니모닉 단어, 활동 타임라인용 복합 인덱스가 검색도 담당)
+    author_fingerprint = models.CharField(max_length=32)
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
     
@@ -97,6 +112,7 @@ class Comment(models.Model):
         ordering = ['created_at']
         indexes = [
             models.Index(fields=['post', 'created_at']),
+            models.Index(fields=['author_fingerprint', '-created_at', '-id']),
         ]
         verbose_name = '댓글'
         verbose_name_plural = '댓글'
@@ -112,15 +128,17 @@ class Vote(models.Model):
         (-1, '비추천'),
     ]
     
+    # DB FK 제약 없음 (Comment.post 참고)
     post = models.ForeignKey(
         Post, 
         on_delete=models.CASCADE, 
         related_name='votes',
+        db_constraint=False,
         verbose_name='게시글'
     )
     
     # 투표자 고유 식별자 (fingerprint)
-    voter_fingerprint = models.CharField(max_length=20, db_index=True)
+    voter_fingerprint = models.CharField(max_length=32, db_index=True)
     
     vote_type = models.SmallIntegerField(
         choices=VOTE_TYPE_CHOICES,
@@ -140,3 +158,41 @@ class Vote(models.Model):
     
     def __str__(self):
         return f"{self.post.title} - {self.get_vote_type_display()}"
+
+
+class VoteCounterShard(models.Model):
+    """
+    추천/비추천 카운트 증가분 샤드
+    인기 게시글에 투표가 몰려도 Post 행 하나에 락이 걸리지 않도록
+    투표자별로 샤드에 나눠 누적하고, fold_vote_counts가 주기적으로 Post에 합산
+    """
+    # DB FK 제약 없음 (Comment.post 참고)
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='vote_shards',
+        db_constraint=False
+    )
+    shard = models.SmallIntegerField()
+    upvote_delta = models.IntegerField(default=0)
+    downvote_delta = models.IntegerField(default=0)
+    
+    class Meta:
+        unique_together = [['post', 'shard']]
+        verbose_name = '투표 카운트 샤드'
+        verbose_name_plural = '투표 카운트 샤드'
+
+
+class CounterFlush(models.Model):
+    """
+    Redis 카운터 버퍼(조회수/댓글 수)별 마지막으로 DB에 반영한 flush id
+    반영과 같은 트랜잭션에서 갱신하므로, 커밋 후 버퍼를 지우기 전에 죽어 같은 버퍼를
+    다시 가져와도 두 번 더하지 않는다. (boards/counters.py)
+    """
+    name = models.CharField(max_length=32, primary_key=True)
+    flush_id = models.CharField(max_length=32, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = '카운터 반영 기록'
+        verbose_name_plural = '카운터 반영 기록'
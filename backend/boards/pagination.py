@@ -0,0 +1,199 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def encode_cursor(values, reverse=False):
+    """정렬키 값 목록을 불투명한 커서 문자열로 변환"""
+    payload = {'v': [v.isoformat() if hasattr(v, 'isoformat') else v for v in values]}
+    if reverse:
+        payload['r'] = 1
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, fields):
+    """커서 문자열을 (정렬키 값 목록, reverse 여부)로 복원"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload['v']
+        if len(values) != len(fields):
+            raise ValueError
+        values = [
+            model._meta.get_field(name).to_python(value)
+            for (name, _), value in zip(fields, values)
+        ]
+    except Exception:
+        raise NotFound('잘못된 커서입니다.')
+    return values, bool(payload.get('r'))
+
+
+def parse_ordering(queryset):
+    """queryset의 order_by를 [(필드명, 내림차순 여부), ...]로 변환"""
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return [
+        (field[1:], True) if field.startswith('-') else (field, False)
+        for field in ordering
+    ]
+
+
+def keyset_filter(fields, values, reverse=False):
+    """
+    (a, b, c) 정렬키 기준으로 커서 "다음" 위치를 가리키는 조건
+    a < x OR (a = x AND (b < y OR (b = y AND c < z))) 형태로 펼치고,
+    인덱스 범위 스캔을 위해 선행 컬럼 조건(a <= x)을 함께 건다.
+    """
+    condition = None
+    for (name, desc), value in reversed(list(zip(fields, values))):
+        op = 'lt' if desc != reverse else 'gt'
+        step = Q(**{f'{name}__{op}': value})
+        if condition is not None:
+            step |= Q(**{name: value}) & condition
+        condition = step
+
+    (name, desc), value = fields[0], values[0]
+    bound = 'lte' if desc != reverse else 'gte'
+    return Q(**{f'{name}__{bound}': value}) & condition
+
+
+def keyset_page(queryset, fields, cursor_values, reverse, page_size):
+    """
+    keyset 방식으로 한 페이지를 가져온다.
+    반환값: (결과 목록, 이후 페이지 존재 여부) - reverse면 이전 방향 기준
+    """
+    if reverse:
+        queryset = queryset.reverse()
+    if cursor_values is not None:
+        queryset = queryset.filter(keyset_filter(fields, cursor_values, reverse))
+
+    rows = list(queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+    return rows, has_more
+
+
+def row_key(obj, fields):
+    """행의 정렬키 값 목록 (모델 인스턴스 또는 values() dict)"""
+    if isinstance(obj, dict):
+        return [obj[name] for name, _ in fields]
+    return [getattr(obj, name) for name, _ in fields]
+
+
+class PostPagination(PageNumberPagination):
+    """
+    게시글 목록 페이지네이션
+    - 기본: page 번호 방식 (?page=N), count=false면 COUNT(*) 생략
+    - ?pagination=cursor 또는 ?cursor=...: 정렬키 기반 keyset 방식
+      OFFSET 없이 인덱스 범위 스캔만 하므로 깊은 페이지도 첫 페이지와 같은 비용
+    """
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    count_query_param = 'count'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.mode = 'page'
+        # QuerySet이 아닌 시퀀스(Redis 랭킹 등)는 page 번호 방식만 지원
+        is_queryset = hasattr(queryset, 'query')
+        if is_queryset and (request.query_params.get(self.mode_query_param) == 'cursor'
+                            or self.cursor_query_param in request.query_params):
+            self.mode = 'cursor'
+            return self.paginate_keyset(queryset, request)
+        if request.query_params.get(self.count_query_param) in ('false', '0'):
+            self.mode = 'nocount'
+            return self.paginate_without_count(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def paginate_keyset(self, queryset, request):
+        page_size = self.get_page_size(request)
+        self.fields = parse_ordering(queryset)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        cursor_values, reverse = None, False
+        if cursor:
+            cursor_values, reverse = decode_cursor(cursor, queryset.model, self.fields)
+
+        rows, has_more = keyset_page(queryset, self.fields, cursor_values, reverse, page_size)
+
+        if reverse:
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor_values is not None
+        self.rows = rows
+        return rows
+
+    def paginate_without_count(self, queryset, request):
+        page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+            if self.page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound('잘못된 페이지입니다.')
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.has_previous = self.page_number > 1
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if self.mode == 'page':
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.mode == 'nocount':
+            return replace_query_param(url, self.page_query_param, self.page_number + 1)
+        if not self.rows:
+            return None
+        cursor = encode_cursor(row_key(self.rows[-1], self.fields))
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if self.mode == 'page':
+            return super().get_previous_link()
+        if not self.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.mode == 'nocount':
+            if self.page_number == 2:
+                return remove_query_param(url, self.page_query_param)
+            return replace_query_param(url, self.page_query_param, self.page_number - 1)
+        if not self.rows:
+            return None
+        cursor = encode_cursor(row_key(self.rows[0], self.fields), reverse=True)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if self.mode == 'page':
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+
+class CommentPagination(PostPagination):
+    """댓글 목록: 항상 (created_at, id) keyset 방식 (post, created_at 인덱스 사용)"""
+    page_size = settings.COMMENT_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.mode = 'cursor'
+        return self.paginate_keyset(queryset, request)
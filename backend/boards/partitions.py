@@ -0,0 +1,230 @@
+"""
+게시글/댓글 월별 파티션 (PostgreSQL 선언적 파티셔닝, 0010 마이그레이션)
+
+- boards_post, boards_comment는 created_at 기준 월별 RANGE 파티션 (boards_post_p202610 등)
+  월 경계는 settings.TIME_ZONE 기준, 범위 밖의 행은 기본 파티션(_pdefault)에 들어간다.
+- 기본키는 (id, created_at)이라 id만으로 조회하면 모든 파티션을 훑으므로,
+  파티션별 id 범위를 프로세스마다 잠시 캐시해 두고 id -> created_at 범위로 바꿔 조건에 더한다.
+- manage_partitions 커맨드가 앞으로 쓸 파티션을 미리 만들고, 오래된 파티션을 보관 계층으로 옮긴다.
+SQLite 등 다른 DB에서는 파티션이 없으므로 모든 함수가 아무 일도 하지 않는다.
+"""
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+
+PARTITION_NAME_RE = re.compile(r'_p(\d{4})(\d{2})$')
+# 보관 계층으로 옮긴 파티션 표시 (COMMENT ON TABLE)
+ARCHIVED_COMMENT = 'archived'
+# id 범위 캐시 유지 시간(초)
+ID_RANGE_TTL = 60
+# 캐시한 뒤 끝난 달이어도 이 시간 안이면 아직 행이 들어올 수 있는 파티션으로 본다 (서버 간 시계 차이)
+OPEN_MARGIN = timedelta(hours=1)
+
+_id_ranges = {}
+
+
+@dataclass
+class Partition:
+    name: str
+    start: datetime = None  # 기본 파티션은 None
+    end: datetime = None
+    tablespace: str = None
+    archived: bool = False
+
+    @property
+    def is_default(self):
+        return self.start is None
+
+
+def month_start(value: datetime) -> datetime:
+    """value가 속한 달의 시작 시각 (settings.TIME_ZONE 기준)"""
+    local = value.astimezone(ZoneInfo(settings.TIME_ZONE))
+    return local.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, start: datetime = None) -> str:
+    return f'{table}_pdefault' if start is None else f'{table}_p{start:%Y%m}'
+
+
+def is_partitioned(cursor, table: str) -> bool:
+    if cursor.db.vendor != 'postgresql':
+        return False
+    cursor.execute(
+        'SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)', [table]
+    )
+    return cursor.fetchone() is not None
+
+
+def list_partitions(cursor, table: str):
+    """붙어 있는 파티션 목록 (기본 파티션 먼저, 나머지는 달 순서)"""
+    if not is_partitioned(cursor, table):
+        return []
+    cursor.execute("""
+        SELECT c.relname, t.spcname, obj_description(c.oid, 'pg_class')
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        LEFT JOIN pg_tablespace t ON t.oid = c.reltablespace
+        WHERE i.inhparent = to_regclass(%s)
+    """, [table])
+    tz = ZoneInfo(settings.TIME_ZONE)
+    partitions = []
+    for name, tablespace, comment in cursor.fetchall():
+        partition = Partition(name, tablespace=tablespace, archived=comment == ARCHIVED_COMMENT)
+        match = PARTITION_NAME_RE.search(name)
+        if match:
+            partition.start = datetime(int(match[1]), int(match[2]), 1, tzinfo=tz)
+            partition.end = add_months(partition.start, 1)
+        partitions.append(partition)
+    partitions.sort(key=lambda p: (not p.is_default, p.start or datetime.min.replace(tzinfo=tz)))
+    return partitions
+
+
+def create_partition(cursor, table: str, start: datetime = None):
+    """월 파티션(start가 None이면 기본 파티션) 생성, 이미 있으면 그대로 둠"""
+    name = partition_name(table, start)
+    if start is None:
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} DEFAULT')
+        return name
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)',
+        [start, add_months(start, 1)]
+    )
+    return name
+
+
+def ensure_partitions(cursor, table: str, months_ahead: int, since: datetime = None):
+    """since(기본: 이번 달)부터 months_ahead달 뒤까지의 파티션을 만들고 새로 만든 이름 목록 반환"""
+    existing = {p.name for p in list_partitions(cursor, table)}
+    current = month_start(since or datetime.now(ZoneInfo(settings.TIME_ZONE)))
+    last = add_months(month_start(datetime.now(ZoneInfo(settings.TIME_ZONE))), months_ahead)
+    created = []
+    while current <= last:
+        if partition_name(table, current) not in existing:
+            created.append(create_partition(cursor, table, current))
+        current = add_months(current, 1)
+    return created
+
+
+def old_partitions(cursor, table: str, older_than_months: int):
+    """끝난 지 older_than_months달이 지난 월 파티션"""
+    cutoff = add_months(month_start(datetime.now(ZoneInfo(settings.TIME_ZONE))), -older_than_months)
+    return [
+        p for p in list_partitions(cursor, table)
+        if not p.is_default and p.end <= cutoff
+    ]
+
+
+def archive_partition(cursor, partition: Partition, tablespace: str = None):
+    """
+    보관 계층으로 이동: 지정한 테이블스페이스(느리지만 싼/압축 디스크)로 옮기고
+    VACUUM FREEZE로 튜플을 동결해 autovacuum이 다시 훑을 일을 줄인다.
+    파티션은 붙어 있는 그대로라 조회는 계속 된다. (VACUUM 때문에 트랜잭션 밖에서 호출)
+    """
+    if tablespace and partition.tablespace != tablespace:
+        cursor.execute(f'ALTER TABLE {partition.name} SET TABLESPACE {tablespace}')
+        cursor.execute("""
+            SELECT i.relname FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = to_regclass(%s)
+        """, [partition.name])
+        for (index,) in cursor.fetchall():
+            cursor.execute(f'ALTER INDEX {index} SET TABLESPACE {tablespace}')
+    cursor.execute(f'VACUUM (FREEZE, ANALYZE) {partition.name}')
+    cursor.execute(f"COMMENT ON TABLE {partition.name} IS '{ARCHIVED_COMMENT}'")
+
+
+def detach_partition(cursor, table: str, partition: Partition):
+    """
+    파티션을 떼어내 독립 테이블로 남김 (데이터는 그대로지만 API에서는 더 이상 보이지 않음)
+    다시 붙이려면 ALTER TABLE ... ATTACH PARTITION
+    """
+    cursor.execute(f'ALTER TABLE {table} DETACH PARTITION {partition.name}')
+    _id_ranges.pop(table, None)
+
+
+def _load_id_ranges(table):
+    """파티션별 (시작, 끝, 최소 id, 최대 id) - 기본키 인덱스 양 끝만 읽음"""
+    with connection.cursor() as cursor:
+        partitions = list_partitions(cursor, table)
+        if not partitions:
+            return []
+        cursor.execute(' UNION ALL '.join(
+            f"SELECT '{p.name}', min(id), max(id) FROM {p.name}" for p in partitions
+        ))
+        bounds = {name: (low, high) for name, low, high in cursor.fetchall()}
+    return [(p.start, p.end, *bounds[p.name]) for p in partitions]
+
+
+def _cached_id_ranges(table):
+    entry = _id_ranges.get(table)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1], entry[2]
+
+
+def _refresh_id_ranges(table):
+    ranges = _load_id_ranges(table)
+    loaded_at = datetime.now(ZoneInfo(settings.TIME_ZONE))
+    _id_ranges[table] = (time.monotonic() + ID_RANGE_TTL, ranges, loaded_at)
+    return ranges, loaded_at
+
+
+def _bounds_from_ranges(ranges, loaded_at, pk):
+    matched = []
+    for start, end, low, high in ranges:
+        if low is None:
+            continue
+        # 지금 쓰이는 달(과 그 뒤) 파티션은 캐시 이후 생긴 id도 들어 있을 수 있음
+        open_ended = end is None or end > loaded_at - OPEN_MARGIN
+        if low <= pk and (open_ended or pk <= high):
+            if start is None:
+                return None  # 기본 파티션에 있을 수 있으면 범위를 좁히지 않음
+            matched.append((start, end))
+    if not matched:
+        return None
+    return min(start for start, _ in matched), max(end for _, end in matched)
+
+
+def created_at_bounds(model, pk):
+    """
+    id가 pk인 행이 있을 수 있는 created_at 범위 (시작 이상, 끝 미만) 또는 None
+    파티션 테이블이 아니거나 범위를 알 수 없으면 None (조건 없이 조회)
+    캐시 이후 지난 달 파티션에 들어온 행(과거 시각으로 넣은 데이터 등)은 빠질 수 있으므로
+    이 범위로 못 찾으면 범위 없이 다시 조회해야 한다.
+    """
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    table = model._meta.db_table
+    cached = _cached_id_ranges(table) or _refresh_id_ranges(table)
+    return _bounds_from_ranges(*cached, pk)
+
+
+async def acreated_at_bounds(model, pk):
+    """created_at_bounds의 async 버전 (캐시가 만료됐을 때만 스레드에서 DB 조회)"""
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    table = model._meta.db_table
+    cached = _cached_id_ranges(table) or await sync_to_async(_refresh_id_ranges)(table)
+    return _bounds_from_ranges(*cached, pk)
+
+
+def comments_since(post_created_at):
+    """
+    게시글의 댓글이 있을 수 있는 가장 이른 created_at
+    (댓글은 글보다 나중에 쓰이므로 그 이전 달 댓글 파티션은 보지 않음, 서버 간 시계 차이만큼 여유)
+    """
+    return post_created_at - OPEN_MARGIN
@@ -0,0 +1,252 @@
+import math
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Board, Post, VoteCounterShard
+from .tasks import enqueue, task
+from .utils import get_redis_client
+
+# hot 점수 기준 시각과 감쇠 상수
+# 점수 = log10(순추천) + 작성시각/HOT_GRAVITY 이므로 시간이 지나도 다시 계산할 필요가 없고
+# 12.5시간(45000초) 늦게 쓴 글은 순추천이 10배여야 같은 점수가 된다.
+HOT_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+HOT_GRAVITY = 45000
+HOT_COMMENT_WEIGHT = 0.5
+
+# sort=top 기간별 랭킹 (Redis ZSET, 점수 = 추천 - 비추천)
+TOP_WINDOWS = {
+    'day': timedelta(days=1),
+    'week': timedelta(days=7),
+}
+RANKING_ALL_BOARDS = 'all'
+
+# 기간이 지난 글을 랭킹에서 제거 (KEYS[1]: 작성시각 ZSET, KEYS[2]: 랭킹 ZSET, ARGV[1]: 기준 시각)
+PRUNE_SCRIPT = """
+local removed = 0
+while true do
+    local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 500)
+    if #ids == 0 then
+        return removed
+    end
+    redis.call('ZREM', KEYS[1], unpack(ids))
+    redis.call('ZREM', KEYS[2], unpack(ids))
+    removed = removed + #ids
+end
+"""
+_prune_script = None
+
+
+def hot_score(upvote_count, downvote_count, comment_count, created_at) -> float:
+    """Reddit 방식 시간 감쇠 인기 점수"""
+    score = upvote_count - downvote_count + comment_count * HOT_COMMENT_WEIGHT
+    order = math.log10(max(abs(score), 1))
+    sign = 1 if score > 0 else -1 if score < 0 else 0
+    seconds = (created_at - HOT_EPOCH).total_seconds()
+    return round(sign * order + seconds / HOT_GRAVITY, 7)
+
+
+def refresh_hot_scores(post_ids):
+    """카운트가 바뀐 게시글들의 hot 점수를 다시 계산해 일괄 반영"""
+    posts = list(
+        Post.objects.filter(pk__in=set(post_ids)).only(
+            'id', 'upvote_count', 'downvote_count', 'comment_count', 'created_at'
+        )
+    )
+    for post in posts:
+        post.hot_score = hot_score(
+            post.upvote_count, post.downvote_count, post.comment_count, post.created_at
+        )
+    Post.objects.bulk_update(posts, ['hot_score'], batch_size=500)
+
+
+def _top_key(board_type, window):
+    return f"rank:top:{board_type}:{window}"
+
+
+def _created_key(board_type, window):
+    return f"rank:created:{board_type}:{window}"
+
+
+def _ranking_boards(board_type):
+    return (board_type, RANKING_ALL_BOARDS)
+
+
+def _add_post(pipe, board_type, post_id, created_ts):
+    for bt in _ranking_boards(board_type):
+        for window in TOP_WINDOWS:
+            pipe.zadd(_top_key(bt, window), {post_id: 0}, nx=True)
+            pipe.zadd(_created_key(bt, window), {post_id: created_ts})
+
+
+def _set_votes(pipe, now, board_type, post_id, created_ts, net_votes):
+    for window, span in TOP_WINDOWS.items():
+        if created_ts < (now - span).timestamp():
+            continue
+        for bt in _ranking_boards(board_type):
+            pipe.zadd(_top_key(bt, window), {post_id: net_votes})
+            pipe.zadd(_created_key(bt, window), {post_id: created_ts}, nx=True)
+
+
+def _remove_post(pipe, board_type, post_id):
+    for bt in _ranking_boards(board_type):
+        for window in TOP_WINDOWS:
+            pipe.zrem(_top_key(bt, window), post_id)
+            pipe.zrem(_created_key(bt, window), post_id)
+
+
+def _net_votes(post_ids) -> dict:
+    """
+    게시글별 현재 순추천 {post_id: 추천 - 비추천}
+    Post 카운트에 아직 합산되지 않은 샤드 증가분까지 한 쿼리(같은 스냅샷)로 더한다. 삭제된 글은 빠짐
+    """
+    pending = (
+        VoteCounterShard.objects.filter(post_id=OuterRef('pk')).order_by()
+        .values('post_id').annotate(delta=Sum('upvote_delta') - Sum('downvote_delta'))
+        .values('delta')
+    )
+    rows = (
+        Post.objects.filter(pk__in=set(post_ids))
+        .annotate(pending=Coalesce(Subquery(pending), 0))
+        .values_list('id', 'upvote_count', 'downvote_count', 'pending')
+    )
+    return {post_id: up - down + delta for post_id, up, down, delta in rows}
+
+
+@task(batch=True)
+def update_rankings(changes):
+    """
+    쓰기 요청이 넘긴 랭킹 변경을 넣은 순서대로 파이프라인 한 번에 반영
+    ('post', board_type, post_id, created_ts) / ('vote', board_type, post_id, created_ts)
+    / ('remove', board_type, post_id)
+    투표는 증가분을 더하지 않고 DB 기준 순추천으로 덮어쓰므로 재시도/중복 전달돼도 점수가 같다.
+    """
+    client = get_redis_client()
+    if client is None:
+        return
+    net_votes = _net_votes(post_id for op, _, post_id, *_ in changes if op == 'vote')
+    now = timezone.now()
+    pipe = client.pipeline()
+    for op, board_type, post_id, *rest in changes:
+        if op == 'post':
+            _add_post(pipe, board_type, post_id, *rest)
+        elif op == 'vote':
+            if post_id in net_votes:
+                _set_votes(pipe, now, board_type, post_id, *rest, net_votes[post_id])
+        else:
+            _remove_post(pipe, board_type, post_id)
+    pipe.execute()
+    prune_rankings(client, {board_type for _, board_type, *_ in changes})
+
+
+def prune_rankings(client, board_types=None) -> int:
+    """
+    기간이 지난 글을 랭킹에서 제거 (board_types를 주지 않으면 모든 게시판)
+    전체 게시판 랭킹은 항상 함께 정리, 반환값: 제거한 항목 수
+    """
+    global _prune_script
+    if _prune_script is None:
+        _prune_script = client.register_script(PRUNE_SCRIPT)
+    if board_types is None:
+        board_types = Board.objects.values_list('board_type', flat=True)
+    now = timezone.now()
+    removed = 0
+    for bt in {*board_types, RANKING_ALL_BOARDS}:
+        for window, span in TOP_WINDOWS.items():
+            removed += _prune_script(
+                keys=[_created_key(bt, window), _top_key(bt, window)],
+                args=[(now - span).timestamp()],
+                client=client,
+            )
+    return removed
+
+
+def queue_post(post):
+    enqueue(update_rankings, 'post', post.board.board_type, post.pk,
+            post.created_at.timestamp(), key=f'ranking:post:{post.pk}')
+
+
+def queue_vote(board_type, post_id, created_at, net_delta):
+    """순추천이 바뀐 글의 랭킹 점수 갱신 (net_delta가 0이면 바뀐 것이 없으므로 넣지 않음)"""
+    if net_delta:
+        enqueue(update_rankings, 'vote', board_type, post_id, created_at.timestamp())
+
+
+def queue_remove_post(post):
+    enqueue(update_rankings, 'remove', post.board.board_type, post.pk,
+            key=f'ranking:remove:{post.pk}')
+
+
+class TopPosts:
+    """
+    기간별 추천 랭킹을 Django Paginator가 슬라이스할 수 있는 시퀀스로 감싼 것
+    len()은 ZCARD, 슬라이스는 ZREVRANGE(O(log n + 페이지 크기)) 후 id로 게시글 조회
+    기간이 지난 글은 읽을 때가 아니라 update_rankings/prune_rankings가 제거한다.
+    """
+
+    def __init__(self, queryset, board_type, window):
+        self.queryset = queryset
+        self.client = get_redis_client()
+        self.key = _top_key(board_type or RANKING_ALL_BOARDS, window)
+
+
+    def __len__(self):
+        return self.client.zcard(self.key)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start = index.start or 0
+        ids = [int(i) for i in self.client.zrevrange(self.key, start, index.stop - 1)]
+        posts = self.queryset.in_bulk(ids)
+        return [posts[i] for i in ids if i in posts]
+
+
+def top_posts(queryset, board_type, window):
+    """sort=top 목록 (Redis가 없으면 기간 필터 + 순추천 정렬 쿼리)"""
+    if get_redis_client() is None:
+        since = timezone.now() - TOP_WINDOWS[window]
+        return (
+            queryset.filter(created_at__gte=since)
+            .annotate(net_votes=F('upvote_count') - F('downvote_count'))
+            .order_by('-net_votes', '-id')
+        )
+    return TopPosts(queryset.order_by(), board_type, window)
+
+
+def rebuild_rankings(batch_size=1000):
+    """DB 기준으로 기간별 랭킹을 다시 만든다 (Redis 초기화 후 등)"""
+    client = get_redis_client()
+    if client is None:
+        return 0
+
+    now = timezone.now()
+    board_types = list(
+        Post.objects.order_by().values_list('board__board_type', flat=True).distinct()
+    )
+    rebuilt = 0
+    for window, span in TOP_WINDOWS.items():
+        keys = [
+            key
+            for bt in (*board_types, RANKING_ALL_BOARDS)
+            for key in (_top_key(bt, window), _created_key(bt, window))
+        ]
+        client.delete(*keys)
+
+        rows = (
+            Post.objects.filter(created_at__gte=now - span)
+            .values_list('id', 'board__board_type', 'upvote_count', 'downvote_count', 'created_at')
+            .iterator(chunk_size=batch_size)
+        )
+        pipe = client.pipeline(transaction=False)
+        for count, (post_id, board_type, up, down, created_at) in enumerate(rows, 1):
+            for bt in _ranking_boards(board_type):
+                pipe.zadd(_top_key(bt, window), {post_id: up - down})
+                pipe.zadd(_created_key(bt, window), {post_id: created_at.timestamp()})
+            if count % batch_size == 0:
+                pipe.execute()
+            rebuilt += 1
+        pipe.execute()
+    return rebuilt
@@ -0,0 +1,145 @@
+"""
+응답 렌더러 (settings.REST_FRAMEWORK의 DEFAULT_RENDERER_CLASSES, PostViewSet.get_renderers)
+
+- FastJSONRenderer: 기본 JSON. orjson으로 DRF JSONRenderer와 같은 바이트를 만든다.
+  (들여쓰기 요청이나 orjson이 못 다루는 값은 DRF 렌더러로 처리,
+   float은 지수 표기만 1e16 / 1e+16처럼 다를 수 있음 - 값은 같음)
+- 목록 엔드포인트(목록/검색/댓글)는 Accept 또는 ?format=으로 작은 형식을 고를 수 있다.
+  application/msgpack (format=msgpack): JSON과 같은 구조의 MessagePack
+  application/vnd.biback.columnar+json (format=columnar): results를 columns + rows로 바꾼 JSON
+  application/vnd.biback.columnar+msgpack (format=columnar-msgpack): 위 구조의 MessagePack
+- columnar 형식에서 행마다 반복되던 값은 페이지 단위로 한 번만 보낸다.
+  board_name 컬럼은 빼고 boards({게시판 id: 이름}) 사전으로, 시각 컬럼은 epoch 밀리초 정수로 보낸다.
+"""
+from datetime import datetime
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+COLUMNAR_JSON = 'application/vnd.biback.columnar+json'
+COLUMNAR_MSGPACK = 'application/vnd.biback.columnar+msgpack'
+MSGPACK = 'application/msgpack'
+COMPACT_MEDIA_TYPES = (COLUMNAR_JSON, COLUMNAR_MSGPACK, MSGPACK)
+
+# 행에서 빼서 사전으로 보내는 컬럼: 이름 컬럼 -> (키 컬럼, 사전 이름)
+DICTIONARY_COLUMNS = {'board_name': ('board', 'boards')}
+# epoch 밀리초로 보내는 시각 컬럼
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+_json_default = JSONEncoder().default
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps_json(data) -> bytes:
+    """DRF JSONRenderer(한글 그대로, 공백 없는 구분자)와 같은 바이트"""
+    try:
+        body = orjson.dumps(data, default=_json_default, option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # 64비트를 넘는 정수 등
+        return JSONRenderer().render(data)
+    # DRF처럼 \u2028, \u2029는 항상 이스케이프 (JavaScript 문자열에 그대로 넣을 수 있게)
+    if b'\xe2\x80\xa8' in body or b'\xe2\x80\xa9' in body:
+        body = body.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return body
+
+
+def dumps_msgpack(data) -> bytes:
+    return msgpack.packb(data, default=_json_default, use_bin_type=True)
+
+
+def epoch_ms(value):
+    if not isinstance(value, str):
+        return value
+    return int(datetime.fromisoformat(value).timestamp() * 1000)
+
+
+def to_columnar(data):
+    """
+    {'results': [{...}, ...], ...} -> {'columns': [...], 'rows': [[...], ...], 'boards': {...}, ...}
+    results 밖의 키(next, previous 등)는 그대로 둔다. results가 없는 응답(에러 등)은 바꾸지 않음
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('results'), list):
+        return data
+    results = data['results']
+    keys = list(results[0]) if results else []
+    dictionaries = {}
+    for column, (key_column, name) in DICTIONARY_COLUMNS.items():
+        if column in keys and key_column in keys:
+            keys.remove(column)
+            dictionaries[name] = {row[key_column]: row[column] for row in results}
+    timestamps = [i for i, key in enumerate(keys) if key in TIMESTAMP_COLUMNS]
+
+    rows = []
+    for result in results:
+        row = [result[key] for key in keys]
+        for i in timestamps:
+            row[i] = epoch_ms(row[i])
+        rows.append(row)
+
+    columnar = {key: value for key, value in data.items() if key != 'results'}
+    columnar['columns'] = keys
+    columnar['rows'] = rows
+    columnar.update(dictionaries)
+    return columnar
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps_json(data)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = MSGPACK
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps_msgpack(data)
+
+
+class ColumnarJSONRenderer(BaseRenderer):
+    media_type = COLUMNAR_JSON
+    format = 'columnar'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps_json(to_columnar(data))
+
+
+class ColumnarMessagePackRenderer(BaseRenderer):
+    media_type = COLUMNAR_MSGPACK
+    format = 'columnar-msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps_msgpack(to_columnar(data))
+
+
+COMPACT_RENDERERS = (MessagePackRenderer, ColumnarJSONRenderer, ColumnarMessagePackRenderer)
+COMPACT_FORMATS = tuple(renderer.format for renderer in COMPACT_RENDERERS)
+
+
+def wants_compact(request):
+    """
+    Accept 또는 ?format=으로 작은 형식을 요청했는지
+    (async 뷰가 JSON 캐시 응답을 바로 줄지, DRF 뷰로 넘겨 협상할지 정할 때 사용)
+    """
+    if request.GET.get('format') in COMPACT_FORMATS:
+        return True
+    accept = request.headers.get('Accept', '')
+    return any(media_type in accept for media_type in COMPACT_MEDIA_TYPES)
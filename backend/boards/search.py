@@ -0,0 +1,151 @@
+import base64
+import json
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+
+from .models import Board, Comment, Post
+from .pagination import decode_cursor, encode_cursor, keyset_page, row_key
+
+SEARCH_QUERY_MAX_LENGTH = 100
+SEARCH_SCOPES = ('post', 'all')
+SEARCH_MAX_CANDIDATES = 1000  # 관련도 정렬 대상 최대 행 수 (최신 매칭 기준)
+
+# 관련도순 검색 (search_vector는 0006 마이그레이션의 트리거가 유지)
+# - 게시글(제목 A/내용 B 가중치)과, scope=all이면 댓글(C 가중치)에서 매칭되는 최신 행을
+#   SEARCH_MAX_CANDIDATES개까지만 후보로 뽑는다. 흔한 검색어는 id 역순 인덱스 스캔이 금방
+#   후보를 채우고, 드문 검색어는 GIN 색인으로 찾으므로 어느 쪽이든 전체를 읽지 않는다.
+#   (boards_search_query는 IMMUTABLE이라 계획 시점에 상수로 접혀 선택도가 추정된다)
+# - 후보 안에서 게시글별 최고 점수로 정렬하고 (점수, id) keyset으로 다음 페이지를 이어감
+#   점수는 real이라 커서 값도 real로 비교해야 같은 행이 다시 나오지 않는다.
+# - 후보가 상한에 걸리면 그보다 오래된 매칭은 관련도가 높아도 빠지므로 truncated로 알린다.
+#   (모든 매칭에 점수를 매기면 흔한 검색어가 수백 ms라 상한을 두고 응답에 표시)
+#   결과가 없는 페이지에서도 truncated를 알 수 있게 항상 한 행 이상 돌려준다.
+SEARCH_SQL = """
+WITH candidates AS (
+    (SELECT p.id AS post_id, p.search_vector, 'post' AS source
+     FROM {post} p
+     WHERE p.search_vector @@ boards_search_query(%(q)s) {post_board}
+     ORDER BY p.id DESC
+     LIMIT %(candidates)s)
+    {comment_hits}
+), ranked AS (
+    SELECT post_id, max(ts_rank(search_vector, boards_search_query(%(q)s)))::real AS rank
+    FROM candidates
+    GROUP BY post_id
+)
+SELECT page.post_id, page.rank, t.truncated
+FROM (
+    SELECT coalesce(max(n) >= %(candidates)s, FALSE) AS truncated
+    FROM (SELECT count(*) AS n FROM candidates GROUP BY source) counts
+) t
+LEFT JOIN (
+    SELECT post_id, rank
+    FROM ranked
+    WHERE {after}
+    ORDER BY rank DESC, post_id DESC
+    LIMIT %(limit)s
+) page ON TRUE
+ORDER BY page.rank DESC, page.post_id DESC
+"""
+
+COMMENT_HITS_SQL = """
+    UNION ALL
+    (SELECT c.post_id, c.search_vector, 'comment'
+     FROM {comment} c
+     WHERE c.search_vector @@ boards_search_query(%(q)s) {comment_board}
+     ORDER BY c.id DESC
+     LIMIT %(candidates)s)
+"""
+
+BOARD_FILTER_SQL = "AND {column} = (SELECT id FROM {board} WHERE board_type = %(board_type)s)"
+COMMENT_BOARD_FILTER_SQL = (
+    "AND c.post_id IN (SELECT id FROM {post} WHERE board_id = "
+    "(SELECT id FROM {board} WHERE board_type = %(board_type)s))"
+)
+
+# PostgreSQL이 아닐 때(로컬 개발용 SQLite 등) 최신순 정렬키
+FALLBACK_ORDERING = [('created_at', True), ('id', True)]
+
+
+def _tables():
+    return {
+        'post': Post._meta.db_table,
+        'comment': Comment._meta.db_table,
+        'board': Board._meta.db_table,
+    }
+
+
+def _decode_rank_cursor(cursor):
+    """관련도순 커서 -> (점수, id)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        rank, post_id = json.loads(base64.urlsafe_b64decode(padded.encode()))['v']
+        return float(rank), int(post_id)
+    except Exception:
+        raise NotFound('잘못된 커서입니다.')
+
+
+def search_posts(q, board_type=None, scope='post', cursor=None, page_size=20):
+    """
+    게시글 검색
+    반환값: (게시글 목록, 다음 페이지 커서 또는 None, 후보 상한으로 잘렸는지)
+    PostgreSQL은 최신 매칭 SEARCH_MAX_CANDIDATES개 안에서 관련도순, 그 외 DB는 제목/내용 부분 일치 최신순
+    """
+    if connection.vendor != 'postgresql':
+        return _search_posts_orm(q, board_type, scope, cursor, page_size)
+
+    tables = _tables()
+    params = {
+        'q': q,
+        'board_type': board_type,
+        'candidates': SEARCH_MAX_CANDIDATES,
+        'limit': page_size + 1,
+    }
+    after = 'TRUE'
+    if cursor:
+        params['rank'], params['post_id'] = _decode_rank_cursor(cursor)
+        after = '(rank, post_id) < (%(rank)s::real, %(post_id)s)'
+
+    post_board = comment_board = ''
+    if board_type:
+        post_board = BOARD_FILTER_SQL.format(column='p.board_id', **tables)
+        comment_board = COMMENT_BOARD_FILTER_SQL.format(**tables)
+    comment_hits = ''
+    if scope == 'all':
+        comment_hits = COMMENT_HITS_SQL.format(comment_board=comment_board, **tables)
+    sql = SEARCH_SQL.format(
+        post=tables['post'], post_board=post_board, comment_hits=comment_hits, after=after
+    )
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, params)
+        rows = db_cursor.fetchall()
+    truncated = rows[0][2]
+    rows = [(post_id, rank) for post_id, rank, _ in rows if post_id is not None]
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    posts = Post.objects.select_related('board').in_bulk([post_id for post_id, _ in rows])
+    results = [posts[post_id] for post_id, _ in rows if post_id in posts]
+    next_cursor = None
+    if has_more:
+        post_id, rank = rows[-1]
+        next_cursor = encode_cursor([rank, post_id])
+    return results, next_cursor, truncated
+
+
+def _search_posts_orm(q, board_type, scope, cursor, page_size):
+    condition = Q(title__icontains=q) | Q(content__icontains=q)
+    if scope == 'all':
+        condition |= Q(id__in=Comment.objects.filter(content__icontains=q).values('post_id'))
+    queryset = Post.objects.select_related('board').filter(condition).order_by('-created_at', '-id')
+    if board_type:
+        queryset = queryset.filter(board__board_type=board_type)
+
+    cursor_values = None
+    if cursor:
+        cursor_values, _ = decode_cursor(cursor, Post, FALLBACK_ORDERING)
+    rows, has_more = keyset_page(queryset, FALLBACK_ORDERING, cursor_values, False, page_size)
+    next_cursor = encode_cursor(row_key(rows[-1], FALLBACK_ORDERING)) if has_more else None
+    return rows, next_cursor, False
@@ -1,17 +1,22 @@
+from django.conf import settings
 from rest_framework import serializers
+from .compiled import CompiledSerializer
 from .models import Board, Post, Comment, Vote
+from .pagination import encode_cursor, keyset_page, row_key
+from .partitions import comments_since
 from .utils import hash_password
 
 
 class BoardSerializer(serializers.ModelSerializer):
-    post_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Board
         fields = ['id', 'name', 'board_type', 'description', 'post_count']
-    
-    def get_post_count(self, obj):
-        return obj.posts.count()
+        read_only_fields = ['post_count']
+
+
+# 댓글 정렬키 (keyset 커서 기준)
+COMMENT_ORDERING = ('created_at', 'id')
+COMMENT_KEYSET = [(name, False) for name in COMMENT_ORDERING]
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -49,9 +54,14 @@ class PostListSerializer(serializers.ModelSerializer):
 
 
 class PostDetailSerializer(serializers.ModelSerializer):
-    """게시글 상세용"""
+    """
+    게시글 상세용
+    댓글은 앞쪽 POST_DETAIL_COMMENTS개만 포함하고, 나머지는 comments_cursor로
+    /api/posts/{id}/comments/?cursor=... 에서 이어서 조회
+    """
     board_name = serializers.CharField(source='board.name', read_only=True)
-    comments = CommentSerializer(many=True, read_only=True)
+    comments = serializers.SerializerMethodField()
+    comments_cursor = serializers.SerializerMethodField()
     
     class Meta:
         model = Post
@@ -59,12 +69,63 @@ class PostDetailSerializer(serializers.ModelSerializer):
             'id', 'board', 'board_name', 'title', 'content', 
             'author_name', 'author_fingerprint', 'view_count', 
             'comment_count', 'upvote_count', 'downvote_count',
-            'created_at', 'updated_at', 'comments'
+            'created_at', 'updated_at', 'comments', 'comments_cursor'
         ]
         read_only_fields = [
             'id', 'author_fingerprint', 'view_count', 'comment_count',
             'upvote_count', 'downvote_count', 'created_at', 'updated_at'
         ]
+    
+    def _first_comments(self, obj):
+        """첫 댓글 페이지 (comments/comments_cursor가 같은 쿼리 결과를 공유)"""
+        cached = getattr(self, '_comments_page', None)
+        if cached is None or cached[0] != obj.pk:
+            cached = self._comments_page = (obj.pk, *first_comments_page(obj))
+        return cached[1], cached[2]
+    
+    def get_comments(self, obj):
+        rows, _ = self._first_comments(obj)
+        return CommentSerializer(rows, many=True).data
+    
+    def get_comments_cursor(self, obj):
+        rows, has_more = self._first_comments(obj)
+        if not has_more:
+            return None
+        return encode_cursor(row_key(rows[-1], COMMENT_KEYSET))
+
+
+# 읽기 요청용 빠른 경로 (출력은 위 serializer와 같음, boards/compiled.py)
+post_list_fields = CompiledSerializer(PostListSerializer)
+comment_fields = CompiledSerializer(CommentSerializer)
+# comments/comments_cursor는 Meta.fields 맨 뒤라 post_detail_data에서 이어 붙임
+post_detail_fields = CompiledSerializer(
+    PostDetailSerializer, exclude=('comments', 'comments_cursor')
+)
+
+
+def first_comments_page(post):
+    """게시글 상세의 첫 댓글 페이지 (values() 행 목록, 이후 페이지 존재 여부)"""
+    return keyset_page(
+        comment_fields.values(
+            post.comments.filter(created_at__gte=comments_since(post.created_at))
+            .order_by(*COMMENT_ORDERING)
+        ), COMMENT_KEYSET, None, False, settings.POST_DETAIL_COMMENTS
+    )
+
+
+def post_detail_data(post, comments=None, has_more=False):
+    """
+    PostDetailSerializer(post).data와 같은 응답 dict
+    comments를 주지 않으면 첫 댓글 페이지를 조회 (async 뷰는 미리 읽은 댓글 인스턴스를 넘김)
+    """
+    if comments is None:
+        comments, has_more = first_comments_page(post)
+    data = post_detail_fields.data([post])[0]
+    data['comments'] = comment_fields.data(comments)
+    data['comments_cursor'] = (
+        encode_cursor(row_key(comments[-1], COMMENT_KEYSET)) if has_more else None
+    )
+    return data
 
 
 class PostCreateSerializer(serializers.ModelSerializer):
@@ -91,7 +152,12 @@ class PostUpdateSerializer(serializers.ModelSerializer):
         """비밀번호 검증"""
         from .utils import verify_password
         instance = self.instance
-        if not verify_password(value, instance.password_hash):
+        
+        def upgrade(password):
+            # 예전 형식 해시는 수정 내용과 함께 새 형식으로 저장
+            instance.password_hash = hash_password(password)
+        
+        if not verify_password(value, instance.password_hash, setter=upgrade):
             raise serializers.ValidationError("비밀번호가 일치하지 않습니다.")
         return value
 
@@ -0,0 +1,41 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .caching import invalidate_board_list
+from .counters import queue_board_post_count
+from .models import Board, Post
+from .ranking import hot_score, queue_post, queue_remove_post
+
+
+@receiver(pre_save, sender=Post)
+def set_initial_hot_score(sender, instance, **kwargs):
+    """새 글의 hot 점수 (이후에는 투표/댓글 반영 시 갱신)"""
+    if not instance._state.adding:
+        return
+    instance.hot_score = hot_score(
+        instance.upvote_count, instance.downvote_count,
+        instance.comment_count, instance.created_at or timezone.now()
+    )
+
+
+@receiver(post_save, sender=Post)
+def increase_board_post_count(sender, instance, created, **kwargs):
+    """게시글 작성 시 게시판 글 수 증가, 랭킹 등록 (후속 작업 큐에서 반영)"""
+    if not created:
+        return
+    queue_board_post_count(instance, 1)
+    queue_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def decrease_board_post_count(sender, instance, **kwargs):
+    """게시글 삭제 시 게시판 글 수 감소, 랭킹에서 제거 (게시판 삭제로 인한 cascade 포함)"""
+    queue_board_post_count(instance, -1)
+    queue_remove_post(instance)
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def board_changed(sender, **kwargs):
+    invalidate_board_list()
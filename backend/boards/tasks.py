@@ -0,0 +1,269 @@
+"""
+쓰기 요청의 후속 작업 큐 (Redis 리스트, 워커: run_tasks 커맨드)
+
+요청 핸들러는 주 행만 쓰고 게시판 글 수, 랭킹, 실시간 이벤트 같은 후속 작업은 enqueue로 넘긴다.
+- enqueue(func, *args, key=None): 커밋 이후 tasks:queue에 넣음 (롤백되면 넣지 않음)
+  key(멱등 키)를 주면 TASKS_IDEMPOTENCY_TTL 동안 같은 key의 작업은 한 번만 들어가고,
+  이미 실행을 마친 key는 워커가 다시 꺼내도 건너뛴다.
+- 워커는 큐에서 최대 batch_size개를 꺼내 작업별로 묶어 실행한다.
+  @task(batch=True) 작업은 메시지들의 인자 목록을 한 번에 받는다. (파이프라인 한 번, UPDATE 한 번)
+- 실패하면 TASKS_RETRY_DELAY * 2^(시도-1)초 뒤 재시도 (tasks:delayed ZSET),
+  max_retries를 넘기면 tasks:dead에 남긴다. (run_tasks --requeue-dead로 다시 넣기)
+- 꺼낸 메시지는 워커별 처리 중 리스트로 옮겨 두므로 워커가 죽어도 다시 시작할 때 큐로 돌아간다.
+  최소 한 번 실행이라 실행 직후 죽으면 다시 실행될 수 있다. (카운트는 reconcile_counters로 보정)
+- 동기 모드: Redis가 없거나 TASKS_SYNC=True면 커밋 직후 같은 프로세스에서 바로 실행 (로컬 개발/테스트)
+  인자는 큐와 같이 JSON을 거쳐 전달하고, 재시도도 같은 횟수만큼 (대기 없이) 한다.
+"""
+import json
+import logging
+import time
+from collections import defaultdict
+from importlib import import_module
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from redis.exceptions import RedisError
+
+from .utils import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+TASK_QUEUE_KEY = 'tasks:queue'
+TASK_DELAYED_KEY = 'tasks:delayed'  # 재시도 대기 (점수 = 실행할 시각)
+TASK_DEAD_KEY = 'tasks:dead'  # 재시도를 다 쓴 메시지
+TASK_PROCESSING_PREFIX = 'tasks:processing:'  # 워커별 처리 중 메시지
+TASK_KEY_PREFIX = 'tasks:key:'  # 멱등 키 (queued -> done)
+TASK_DEAD_MAX = 1000
+
+# 멱등 키가 없거나 처음이면 큐에 넣음 (KEYS[1]: 큐, KEYS[2]: 멱등 키, ARGV[1]: 메시지, ARGV[2]: TTL)
+ENQUEUE_SCRIPT = """
+if KEYS[2] ~= '' and not redis.call('SET', KEYS[2], 'queued', 'NX', 'EX', ARGV[2]) then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], ARGV[1])
+return 1
+"""
+# 실행 시각이 된 재시도 메시지를 큐로 (KEYS[1]: 대기 ZSET, KEYS[2]: 큐, ARGV[1]: 현재 시각)
+PROMOTE_SCRIPT = """
+local messages = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 500)
+if #messages > 0 then
+    redis.call('ZREM', KEYS[1], unpack(messages))
+    redis.call('RPUSH', KEYS[2], unpack(messages))
+end
+return #messages
+"""
+_scripts = {}
+
+_registry = {}
+
+
+def task(max_retries=None, batch=False):
+    """
+    후속 작업 등록 (이름은 모듈 경로 + 함수 이름, 워커는 처음 보는 이름이면 모듈을 import)
+    batch=True면 func(args_list) - 메시지마다의 인자 리스트 목록을 받는다.
+    """
+    def decorator(func):
+        func.task_name = f'{func.__module__}.{func.__qualname__}'
+        func.max_retries = settings.TASKS_MAX_RETRIES if max_retries is None else max_retries
+        func.batch = batch
+        _registry[func.task_name] = func
+        return func
+    return decorator
+
+
+def get_task(name):
+    if name not in _registry:
+        import_module(name.rsplit('.', 1)[0])
+    return _registry[name]
+
+
+def _run_script(client, source, keys, args):
+    """Lua 스크립트 실행 (Script 객체는 처음 등록한 클라이언트에 묶이므로 client를 매번 넘김)"""
+    if source not in _scripts:
+        _scripts[source] = client.register_script(source)
+    return _scripts[source](keys=keys, args=args, client=client)
+
+
+def _dumps(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def sync_mode():
+    return settings.TASKS_SYNC or get_redis_client() is None
+
+
+def enqueue(func, *args, key=None):
+    """커밋 이후 후속 작업을 큐에 넣음 (동기 모드면 바로 실행). args는 JSON으로 보낼 수 있어야 함"""
+    message = _dumps({'task': func.task_name, 'args': args, 'key': key, 'attempts': 0})
+
+    def push():
+        if sync_mode():
+            _run_sync(message)
+            return
+        try:
+            _run_script(
+                get_redis_client(), ENQUEUE_SCRIPT,
+                keys=[TASK_QUEUE_KEY, TASK_KEY_PREFIX + key if key else ''],
+                args=[message, settings.TASKS_IDEMPOTENCY_TTL],
+            )
+        except RedisError:
+            # 큐에 못 넣으면 요청 안에서라도 실행 (후속 작업 유실 방지)
+            # 같은 Redis를 쓰는 캐시도 실패할 것이므로 멱등 키 확인은 건너뜀
+            logger.exception('작업 큐 추가 실패, 바로 실행: %s', func.task_name)
+            _run_sync(message, check_key=False)
+
+    transaction.on_commit(push)
+
+
+def _run_sync(message, check_key=True):
+    """
+    커밋 이후(on_commit)에 같은 프로세스에서 실행
+    이미 커밋된 요청이 실패하지 않도록 여기서 나는 예외(캐시 장애 포함)는 기록만 한다.
+    """
+    data = json.loads(message)
+    key = data['key']
+    if key and check_key:
+        try:
+            if not cache.add(TASK_KEY_PREFIX + key, 'queued', settings.TASKS_IDEMPOTENCY_TTL):
+                return
+        except Exception:
+            # 중복 실행 여부를 알 수 없어도 후속 작업을 잃는 것보다 실행하는 쪽을 택함
+            logger.exception('작업 멱등 키 확인 실패, 그대로 실행: %s', data['task'])
+    try:
+        func = get_task(data['task'])
+    except (ImportError, KeyError):
+        logger.exception('알 수 없는 작업: %s', data['task'])
+        return
+    for attempt in range(func.max_retries + 1):
+        try:
+            if func.batch:
+                func([data['args']])
+            else:
+                func(*data['args'])
+            return
+        except Exception:
+            if attempt == func.max_retries:
+                logger.exception('작업 실패: %s', data['task'])
+
+
+# ---------------------------------------------------------------------------
+# 워커 (run_tasks 커맨드)
+# ---------------------------------------------------------------------------
+
+def processing_key(worker):
+    return TASK_PROCESSING_PREFIX + worker
+
+
+def recover(client, worker) -> int:
+    """이전에 죽은 같은 이름 워커가 처리하던 메시지를 큐 앞으로 되돌림"""
+    recovered = 0
+    while client.lmove(processing_key(worker), TASK_QUEUE_KEY, 'RIGHT', 'LEFT') is not None:
+        recovered += 1
+    return recovered
+
+
+def requeue_dead(client) -> int:
+    """tasks:dead의 메시지를 시도 횟수를 지우고 다시 큐에 넣음"""
+    requeued = 0
+    while True:
+        raw = client.rpop(TASK_DEAD_KEY)
+        if raw is None:
+            return requeued
+        data = json.loads(raw)
+        data['attempts'] = 0
+        data.pop('error', None)
+        client.rpush(TASK_QUEUE_KEY, _dumps(data))
+        requeued += 1
+
+
+def _fetch(client, worker, batch_size, timeout):
+    """큐에서 최대 batch_size개를 처리 중 리스트로 옮겨 가져옴 (비어 있으면 timeout초 대기)"""
+    processing = processing_key(worker)
+    if timeout:
+        first = client.blmove(TASK_QUEUE_KEY, processing, timeout, 'LEFT', 'RIGHT')
+    else:
+        first = client.lmove(TASK_QUEUE_KEY, processing, 'LEFT', 'RIGHT')
+    if first is None:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for _ in range(batch_size - 1):
+        pipe.lmove(TASK_QUEUE_KEY, processing, 'LEFT', 'RIGHT')
+    return [first] + [raw for raw in pipe.execute() if raw is not None]
+
+
+def _retry(pipe, data, max_retries, error):
+    data['attempts'] += 1
+    if data['attempts'] > max_retries:
+        logger.error('작업 재시도 초과: %s (%s)', data['task'], error)
+        data['error'] = error
+        pipe.lpush(TASK_DEAD_KEY, _dumps(data))
+        pipe.ltrim(TASK_DEAD_KEY, 0, TASK_DEAD_MAX - 1)
+        return
+    delay = settings.TASKS_RETRY_DELAY * 2 ** (data['attempts'] - 1)
+    pipe.zadd(TASK_DELAYED_KEY, {_dumps(data): time.time() + delay})
+
+
+def process(client, worker, batch_size=100, timeout=0) -> int:
+    """
+    재시도 대기열에서 때가 된 메시지를 옮기고 한 묶음을 실행
+    반환값: 꺼낸 메시지 수 (0이면 큐가 비어 있음)
+    """
+    _run_script(
+        client, PROMOTE_SCRIPT, keys=[TASK_DELAYED_KEY, TASK_QUEUE_KEY], args=[time.time()]
+    )
+    messages = _fetch(client, worker, batch_size, timeout)
+    if not messages:
+        return 0
+
+    decoded = [json.loads(raw) for raw in messages]
+    keys = [data['key'] for data in decoded if data['key']]
+    done = set()
+    if keys:
+        states = client.mget([TASK_KEY_PREFIX + key for key in keys])
+        done = {key for key, state in zip(keys, states) if state == b'done'}
+    # 작업별로 묶되 처음 나온 순서대로 실행 (같은 작업 안에서는 넣은 순서 유지)
+    groups = defaultdict(list)
+    for data in decoded:
+        if data['key'] not in done:
+            groups[data['task']].append(data)
+
+    pipe = client.pipeline(transaction=False)
+    for name, items in groups.items():
+        try:
+            func = get_task(name)
+        except (ImportError, KeyError) as exc:
+            logger.error('알 수 없는 작업: %s', name)
+            for data in items:
+                _retry(pipe, data, 0, repr(exc))
+            continue
+        for batch in [items] if func.batch else [[data] for data in items]:
+            try:
+                if func.batch:
+                    func([data['args'] for data in batch])
+                else:
+                    func(*batch[0]['args'])
+            except Exception as exc:
+                logger.exception('작업 실패: %s', name)
+                for data in batch:
+                    _retry(pipe, data, func.max_retries, repr(exc))
+                continue
+            for data in batch:
+                _finish(pipe, data)
+    pipe.delete(processing_key(worker))
+    pipe.execute()
+    return len(messages)
+
+
+def _finish(pipe, data):
+    if data['key']:
+        pipe.set(TASK_KEY_PREFIX + data['key'], 'done', ex=settings.TASKS_IDEMPOTENCY_TTL)
+
+
+def queue_stats(client) -> dict:
+    pipe = client.pipeline(transaction=False)
+    pipe.llen(TASK_QUEUE_KEY)
+    pipe.zcard(TASK_DELAYED_KEY)
+    pipe.llen(TASK_DEAD_KEY)
+    queued, delayed, dead = pipe.execute()
+    return {'queued': queued, 'delayed': delayed, 'dead': dead}
@@ -0,0 +1,1429 @@
+import gzip
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from unittest import mock, skipIf
+
+import brotli
+import msgpack
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, transaction
+from django.db.models import QuerySet
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import parse_http_date
+from redis.exceptions import RedisError
+from rest_framework.renderers import JSONRenderer
+
+from . import db_router, partitions
+from .activity import purge_fingerprint, purge_fingerprint_batch, purge_remaining
+from .caching import (
+    POST_LIST_CACHE_PAGES, bump_post_list_generation, get_cache_metrics, is_cacheable_post_list,
+    post_list_cache_key
+)
+from .compression import choose_encoding
+from .conditional import data_etag
+from .counters import (
+    COMMENT_FLUSHING_KEY, VIEW_FLUSHING_KEY, flush_comment_counts, flush_view_counts,
+    record_comment, record_view
+)
+from .fingerprints import WORDLIST, get_user_fingerprint, rate_limit_key
+from .models import Board, Comment, Post, Vote, VoteCounterShard
+from .pagination import encode_cursor
+from .ranking import (
+    HOT_GRAVITY, TOP_WINDOWS, hot_score, prune_rankings, refresh_hot_scores, update_rankings
+)
+from .renderers import (
+    COLUMNAR_JSON, COLUMNAR_MSGPACK, MSGPACK, FastJSONRenderer, dumps_json, to_columnar,
+    wants_compact
+)
+from .serializers import (
+    PostDetailSerializer, PostListSerializer, post_detail_data, post_list_fields
+)
+from .tasks import TASK_DELAYED_KEY, TASK_QUEUE_KEY, enqueue, process, task
+from .utils import check_rate_limit, hash_password, password_needs_rehash, verify_password
+from .votes import cast_vote, fold_vote_counts, remove_votes
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+ADMIN_HEADERS = {'HTTP_X_ADMIN_TOKEN': 'biback_admin_2024'}
+
+
+def create_post(board, **fields):
+    fields = {'title': 't', 'content': 'c', 'author_name': 'a', 'password_hash': '-',
+              'author_fingerprint': 'f', **fields}
+    return Post.objects.create(board=board, **fields)
+
+
+def set_created_at(obj, created_at):
+    """auto_now_add를 덮어쓰기 (정렬/기간 테스트용)"""
+    type(obj).objects.filter(pk=obj.pk).update(created_at=created_at)
+    obj.created_at = created_at
+    return obj
+
+calls = []
+
+
+@task(max_retries=2)
+def record_call(value):
+    calls.append(value)
+
+
+@task(max_retries=2)
+def always_fail(value):
+    calls.append(value)
+    raise RuntimeError('실패')
+
+
+@task(batch=True)
+def record_batch(items):
+    calls.append(('batch', items))
+
+
+@override_settings(TASKS_SYNC=True, CACHES=LOCMEM_CACHES)
+class SyncTaskTests(TestCase):
+    def setUp(self):
+        calls.clear()
+        cache.clear()
+
+    def test_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue(record_call, 1)
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [1])
+
+    def test_rollback_skips_task(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    enqueue(record_call, 1)
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertEqual(calls, [])
+
+    def test_duplicate_key_runs_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue(record_call, 1, key='same')
+            enqueue(record_call, 2, key='same')
+            enqueue(record_call, 3, key='other')
+        self.assertEqual(calls, [1, 3])
+
+    def test_retries_up_to_max_retries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue(always_fail, 'x')
+        self.assertEqual(calls, ['x'] * 3)
+
+    def test_batch_task_gets_args_list(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue(record_batch, 1, 'a')
+        self.assertEqual(calls, [('batch', [[1, 'a']])])
+
+
+@skipIf(fakeredis is None, 'fakeredis가 설치되어 있지 않음')
+@override_settings(TASKS_RETRY_DELAY=0)
+class WorkerTests(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.client = fakeredis.FakeRedis()
+
+    def push(self, func, *args, key=None):
+        self.client.rpush(TASK_QUEUE_KEY, json.dumps(
+            {'task': func.task_name, 'args': args, 'key': key, 'attempts': 0}
+        ))
+
+    def test_groups_batch_tasks(self):
+        self.push(record_batch, 1)
+        self.push(record_call, 'a')
+        self.push(record_batch, 2)
+        self.push(record_call, 'b')
+        self.push(record_batch, 3)
+
+        self.assertEqual(process(self.client, 'test', batch_size=10), 5)
+        # 배치 작업은 한 번에 넣은 순서대로, 일반 작업은 메시지마다
+        self.assertEqual(calls, [('batch', [[1], [2], [3]]), 'a', 'b'])
+        self.assertEqual(self.client.llen(TASK_QUEUE_KEY), 0)
+        self.assertEqual(self.client.llen('tasks:processing:test'), 0)
+
+    def test_batch_size_limits_messages(self):
+        for i in range(5):
+            self.push(record_batch, i)
+        self.assertEqual(process(self.client, 'test', batch_size=2), 2)
+        self.assertEqual(calls, [('batch', [[0], [1]])])
+        self.assertEqual(self.client.llen(TASK_QUEUE_KEY), 3)
+
+    def test_done_key_skipped(self):
+        self.push(record_call, 1, key='k')
+        process(self.client, 'test')
+        self.push(record_call, 1, key='k')
+        process(self.client, 'test')
+        self.assertEqual(calls, [1])
+
+    def test_failed_task_retried_then_dead(self):
+        self.push(always_fail, 'x')
+        for _ in range(5):
+            process(self.client, 'test')
+        self.assertEqual(calls, ['x'] * 3)
+        self.assertEqual(self.client.zcard(TASK_DELAYED_KEY), 0)
+        self.assertEqual(self.client.llen('tasks:dead'), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RATE_LIMITS={'post': (3, 60)})
+class RateLimitTests(TestCase):
+    requests = 40
+
+    def setUp(self):
+        cache.clear()
+
+    def fire(self, subject):
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            return list(pool.map(lambda _: check_rate_limit(subject, 'post'), range(self.requests)))
+
+    def assert_exact_limit(self, results):
+        self.assertEqual(results.count(0), 3)
+        self.assertTrue(all(retry_after > 0 for retry_after in results if retry_after))
+
+    def test_key_is_stable_across_minutes(self):
+        with mock.patch('boards.fingerprints.time.time', return_value=59.0):
+            before = rate_limit_key('1.2.3.4')
+        with mock.patch('boards.fingerprints.time.time', return_value=60.0):
+            self.assertEqual(rate_limit_key('1.2.3.4'), before)
+        self.assertNotEqual(rate_limit_key('1.2.3.5'), before)
+
+    def test_concurrent_requests_fixed_window(self):
+        with mock.patch('boards.utils.get_redis_client', return_value=None):
+            self.assert_exact_limit(self.fire(rate_limit_key('1.2.3.4')))
+
+    @skipIf(fakeredis is None, 'fakeredis가 설치되어 있지 않음')
+    def test_concurrent_requests_sliding_window(self):
+        client = fakeredis.FakeRedis()
+        with mock.patch('boards.utils.get_redis_client', return_value=client):
+            self.assert_exact_limit(self.fire(rate_limit_key('1.2.3.4')))
+
+
+@skipIf(fakeredis is None, 'fakeredis가 설치되어 있지 않음')
+@override_settings(CACHES=LOCMEM_CACHES)
+class CounterFlushTests(TestCase):
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis()
+        patcher = mock.patch('boards.counters.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.posts = [
+            Post.objects.create(
+                board=board, title='t', content='c', author_name='a',
+                password_hash='-', author_fingerprint='f'
+            )
+            for _ in range(2)
+        ]
+
+    def counts(self, field):
+        return [getattr(Post.objects.get(pk=post.pk), field) for post in self.posts]
+
+    def fail_on_update(self, number):
+        """number번째 QuerySet.update에서 DatabaseError"""
+        real_update = QuerySet.update
+        calls = []
+
+        def update(queryset, **kwargs):
+            calls.append(1)
+            if len(calls) == number:
+                raise DatabaseError('실패')
+            return real_update(queryset, **kwargs)
+        return mock.patch.object(QuerySet, 'update', update)
+
+    def test_failed_view_flush_applies_nothing(self):
+        for post, views in zip(self.posts, (3, 2)):
+            for _ in range(views):
+                record_view(post.pk)
+
+        # 게시글 1개씩 배치 - 두 번째 배치에서 실패하면 첫 배치도 롤백되고 버퍼는 남음
+        with self.fail_on_update(2), self.assertRaises(DatabaseError):
+            flush_view_counts(batch_size=1)
+        self.assertEqual(self.counts('view_count'), [0, 0])
+        self.assertTrue(self.redis.exists(VIEW_FLUSHING_KEY))
+
+        self.assertEqual(flush_view_counts(batch_size=1), 2)
+        self.assertEqual(self.counts('view_count'), [3, 2])
+        self.assertFalse(self.redis.exists(VIEW_FLUSHING_KEY))
+
+    def test_view_flush_is_not_reapplied_after_crash(self):
+        post = self.posts[0]
+        for _ in range(3):
+            record_view(post.pk)
+        # 커밋 후 버퍼를 지우기 전에 죽음
+        with mock.patch.object(self.redis, 'delete', side_effect=RedisError('끊김')):
+            with self.assertRaises(RedisError):
+                flush_view_counts()
+        self.assertEqual(self.counts('view_count'), [3, 0])
+        self.assertTrue(self.redis.exists(VIEW_FLUSHING_KEY))
+
+        # 그동안 들어온 조회는 다음 flush에서, 이미 반영한 버퍼는 지우기만
+        self.assertEqual(record_view(post.pk), (4, 0))
+        self.assertEqual(flush_view_counts(), 0)
+        self.assertFalse(self.redis.exists(VIEW_FLUSHING_KEY))
+        self.assertEqual(self.counts('view_count'), [3, 0])
+        self.assertEqual(flush_view_counts(), 1)
+        self.assertEqual(self.counts('view_count'), [4, 0])
+
+    def test_concurrent_view_flush_skipped(self):
+        record_view(self.posts[0].pk)
+        lock = self.redis.lock(VIEW_FLUSHING_KEY + ':lock', timeout=60)
+        self.assertTrue(lock.acquire(blocking=False))
+        self.assertEqual(flush_view_counts(), 0)
+        self.assertEqual(self.counts('view_count'), [0, 0])
+        lock.release()
+        self.assertEqual(flush_view_counts(), 1)
+        self.assertEqual(self.counts('view_count'), [1, 0])
+
+    def test_comment_flush_is_not_reapplied_after_crash(self):
+        record_comment(self.posts[0], 1)
+        record_comment(self.posts[1], 1)
+        record_comment(self.posts[1], 1)
+        with mock.patch.object(self.redis, 'delete', side_effect=RedisError('끊김')):
+            with self.assertRaises(RedisError):
+                flush_comment_counts()
+        self.assertEqual(self.counts('comment_count'), [1, 2])
+        hot_scores = self.counts('hot_score')
+
+        self.assertEqual(flush_comment_counts(), 0)
+        self.assertEqual(self.counts('comment_count'), [1, 2])
+        self.assertEqual(self.counts('hot_score'), hot_scores)
+        self.assertFalse(self.redis.exists(COMMENT_FLUSHING_KEY))
+
+    def test_concurrent_comment_flush_skipped(self):
+        record_comment(self.posts[0], 1)
+        with self.redis.lock(COMMENT_FLUSHING_KEY + ':lock', timeout=60):
+            self.assertEqual(flush_comment_counts(), 0)
+        self.assertEqual(flush_comment_counts(), 1)
+        self.assertEqual(self.counts('comment_count'), [1, 0])
+
+    def test_failed_comment_flush_applies_nothing(self):
+        record_comment(self.posts[0], 1)
+        record_comment(self.posts[0], 1)
+        record_comment(self.posts[1], 1)
+
+        # hot 점수 재계산에서 실패하면 이미 실행한 댓글 수 UPDATE도 롤백
+        with mock.patch('boards.counters.refresh_hot_scores', side_effect=DatabaseError('실패')):
+            with self.assertRaises(DatabaseError):
+                flush_comment_counts()
+        self.assertEqual(self.counts('comment_count'), [0, 0])
+        self.assertTrue(self.redis.exists(COMMENT_FLUSHING_KEY))
+
+        self.assertEqual(flush_comment_counts(), 2)
+        self.assertEqual(self.counts('comment_count'), [2, 1])
+        self.assertFalse(self.redis.exists(COMMENT_FLUSHING_KEY))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class VoteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.post = create_post(board)
+
+    def counts(self):
+        """Post 카운트 + 아직 합산되지 않은 샤드 증가분"""
+        post = Post.objects.get(pk=self.post.pk)
+        shards = VoteCounterShard.objects.filter(post=post)
+        return (post.upvote_count + sum(s.upvote_delta for s in shards),
+                post.downvote_count + sum(s.downvote_delta for s in shards))
+
+    def test_vote_change_cancel(self):
+        self.assertEqual(cast_vote(self.post.pk, 'a', 1), ('voted', 1, 0))
+        self.assertEqual(cast_vote(self.post.pk, 'b', 1), ('voted', 2, 0))
+        self.assertEqual(cast_vote(self.post.pk, 'a', -1), ('changed', 1, 1))
+        self.assertEqual(cast_vote(self.post.pk, 'a', -1), ('cancelled', 1, 0))
+        self.assertEqual(self.counts(), (1, 0))
+        self.assertEqual(
+            list(Vote.objects.filter(post=self.post).values_list('voter_fingerprint', 'vote_type')),
+            [('b', 1)]
+        )
+
+    def test_missing_post(self):
+        with self.assertRaises(Post.DoesNotExist):
+            cast_vote(self.post.pk + 1000, 'a', 1)
+        self.assertFalse(Vote.objects.exists())
+
+    @skipIf(connection.vendor != 'postgresql', '샤드 카운터는 PostgreSQL 전용')
+    def test_fold_sums_shards(self):
+        for i in range(20):
+            cast_vote(self.post.pk, f'voter-{i}', 1 if i % 4 else -1)
+        cast_vote(self.post.pk, 'voter-1', -1)
+        # Post 행은 그대로, 증가분은 투표자 샤드에 나뉘어 쌓임
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual((post.upvote_count, post.downvote_count), (0, 0))
+        self.assertGreater(VoteCounterShard.objects.filter(post=post).count(), 1)
+        self.assertEqual(self.counts(), (14, 6))
+
+        self.assertEqual(set(fold_vote_counts(batch_size=3)), {self.post.pk})
+        post.refresh_from_db()
+        self.assertEqual((post.upvote_count, post.downvote_count), (14, 6))
+        self.assertFalse(VoteCounterShard.objects.exists())
+        self.assertEqual(fold_vote_counts(), [])
+        # 합산 후 이어지는 투표도 같은 카운트를 반환
+        self.assertEqual(cast_vote(self.post.pk, 'voter-1', 1), ('changed', 15, 5))
+
+    def test_remove_votes(self):
+        other = create_post(self.post.board)
+        cast_vote(self.post.pk, 'spam', 1)
+        cast_vote(other.pk, 'spam', -1)
+        cast_vote(self.post.pk, 'user', 1)
+
+        self.assertEqual(remove_votes('spam', batch_size=1), 1)
+        self.assertEqual(remove_votes('spam', batch_size=1), 1)
+        self.assertEqual(remove_votes('spam'), 0)
+        fold_vote_counts()
+        self.assertEqual(self.counts(), (1, 0))
+        other.refresh_from_db()
+        self.assertEqual((other.upvote_count, other.downvote_count), (0, 0))
+        self.assertFalse(Vote.objects.filter(voter_fingerprint='spam').exists())
+
+    def test_api(self):
+        url = f'/api/posts/{self.post.pk}/vote/'
+        self.assertEqual(self.client.post(url, {'vote_type': 1}).json(),
+                         {'action': 'voted', 'upvote_count': 1, 'downvote_count': 0})
+        self.assertEqual(self.client.post(url, {'vote_type': -1}).json()['action'], 'changed')
+        self.assertEqual(self.client.post(f'/api/posts/{self.post.pk + 1000}/vote/',
+                                          {'vote_type': 1}).status_code, 404)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class BoardListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.board = Board.objects.create(name='자유게시판', board_type='free')
+
+    def board_list(self):
+        return {b['board_type']: b for b in self.client.get('/api/boards/').json()}
+
+    def test_cached_until_post_count_changes(self):
+        self.assertEqual(self.board_list()['free']['post_count'], 0)
+        with self.assertNumQueries(0):
+            self.board_list()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/posts/', {
+                'board': self.board.pk, 'title': 't', 'content': 'c',
+                'author_name': 'a', 'password': 'pass1234',
+            })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.board_list()['free']['post_count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/posts/{response.json()['id']}/",
+                                          {'password': 'pass1234'}, content_type='application/json')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.board_list()['free']['post_count'], 0)
+
+    def test_batched_counts(self):
+        other = Board.objects.create(name='유머게시판', board_type='humor')
+        with self.captureOnCommitCallbacks(execute=True):
+            posts = [create_post(self.board) for _ in range(3)] + [create_post(other)]
+            posts[0].delete()
+        self.assertEqual(
+            dict(Board.objects.values_list('board_type', 'post_count')), {'free': 2, 'humor': 1}
+        )
+
+    def test_board_change_invalidates(self):
+        self.board_list()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.name = '잡담'
+            self.board.save()
+        self.assertEqual(self.board_list()['free']['name'], '잡담')
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class PostListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.board = Board.objects.create(name='자유게시판', board_type='free')
+        self.other = Board.objects.create(name='유머게시판', board_type='humor')
+        self.post = create_post(self.board, password_hash=hash_password('pass1234'))
+
+    def titles(self, board_type='free'):
+        url = '/api/posts/?' + urlencode({'board_type': board_type, 'count': 'false'})
+        return [post['title'] for post in self.client.get(url).json()['results']]
+
+    def cache_key(self, board_type='free'):
+        return post_list_cache_key({'board_type': board_type})
+
+    def test_cached_page(self):
+        self.assertEqual(self.titles(), ['t'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(), ['t'])
+        # 세대가 그대로면 DB가 바뀌어도 TTL 동안은 캐시된 페이지
+        Post.objects.filter(pk=self.post.pk).update(title='수정')
+        self.assertEqual(self.titles(), ['t'])
+        self.assertEqual(get_cache_metrics(), {'post_list': {'hit': 2, 'miss': 1}})
+
+    def test_only_front_pages_cached(self):
+        self.assertTrue(is_cacheable_post_list({'page': str(POST_LIST_CACHE_PAGES)}))
+        self.assertFalse(is_cacheable_post_list({'page': str(POST_LIST_CACHE_PAGES + 1)}))
+        self.assertFalse(is_cacheable_post_list({'page': 'x'}))
+        self.assertFalse(is_cacheable_post_list({'cursor': 'abc'}))
+        # 게시판 외 파라미터 순서와 format은 키에 영향 없음
+        self.assertEqual(post_list_cache_key({'sort': 'top', 'page': '2'}),
+                         post_list_cache_key({'page': '2', 'sort': 'top', 'format': 'json'}))
+        self.assertNotEqual(post_list_cache_key({'page': '2'}), post_list_cache_key({'page': '3'}))
+
+    def test_writes_bump_generation(self):
+        def bumped(write):
+            before = {bt: self.cache_key(bt) for bt in ('free', 'humor', None)}
+            with self.captureOnCommitCallbacks(execute=True):
+                response = write()
+            self.assertLess(response.status_code, 300)
+            after = {bt: self.cache_key(bt) for bt in before}
+            return {bt for bt in before if before[bt] != after[bt]}
+
+        changed = {'free', None}
+        self.assertEqual(bumped(lambda: self.client.post('/api/posts/', {
+            'board': self.board.pk, 'title': '새 글', 'content': 'c',
+            'author_name': 'a', 'password': 'pass1234',
+        })), changed)
+        self.assertEqual(bumped(lambda: self.client.patch(
+            f'/api/posts/{self.post.pk}/', {'title': '수정'}, content_type='application/json'
+        )), changed)
+        self.assertEqual(bumped(lambda: self.client.post(
+            f'/api/posts/{self.post.pk}/comment/',
+            {'content': 'c', 'author_name': 'a', 'password': 'pass1234'}
+        )), changed)
+        comment = Comment.objects.get(post=self.post)
+        self.assertEqual(bumped(lambda: self.client.delete(
+            f'/api/comments/{comment.pk}/', {'password': 'pass1234'},
+            content_type='application/json'
+        )), changed)
+        self.assertEqual(bumped(lambda: self.client.delete(
+            f'/api/posts/{self.post.pk}/', {'password': 'pass1234'}, content_type='application/json'
+        )), changed)
+        self.assertEqual(self.titles(), ['새 글'])
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL은 fold_vote_counts에서 무효화')
+    def test_orm_vote_bumps_generation(self):
+        before = self.cache_key()
+        with self.captureOnCommitCallbacks(execute=True):
+            cast_vote(self.post.pk, 'voter', 1)
+        self.assertNotEqual(self.cache_key(), before)
+
+    @skipIf(connection.vendor != 'postgresql', '샤드 카운터는 PostgreSQL 전용')
+    def test_fold_bumps_generation(self):
+        # 투표 요청은 샤드만 쓰고, Post에 합산될 때 목록 캐시를 무효화
+        before = self.cache_key()
+        other_before = self.cache_key('humor')
+        with self.captureOnCommitCallbacks(execute=True):
+            cast_vote(self.post.pk, 'voter', 1)
+        self.assertEqual(self.cache_key(), before)
+        with self.captureOnCommitCallbacks(execute=True):
+            fold_vote_counts()
+        self.assertNotEqual(self.cache_key(), before)
+        self.assertEqual(self.cache_key('humor'), other_before)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, POST_DETAIL_COMMENTS=3)
+class CommentPageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.post = create_post(board)
+        created_at = self.post.created_at + timedelta(minutes=1)
+        self.comments = []
+        for i in range(7):
+            comment = Comment.objects.create(post=self.post, content=str(i), author_name='a',
+                                             password_hash='-', author_fingerprint='f')
+            # 두 개씩 같은 시각 (id로 순서 결정)
+            self.comments.append(set_created_at(comment, created_at + timedelta(seconds=i // 2)))
+
+    def walk(self, url):
+        ids = []
+        while url:
+            data = self.client.get(url).json()
+            ids += [comment['id'] for comment in data['results']]
+            url = data['next']
+        return ids
+
+    def test_detail_embeds_first_page(self):
+        data = self.client.get(f'/api/posts/{self.post.pk}/').json()
+        ids = [comment['id'] for comment in data['comments']]
+        self.assertEqual(ids, [comment.pk for comment in self.comments[:3]])
+        self.assertIsNotNone(data['comments_cursor'])
+
+        # 상세의 커서에서 이어서 조회하면 빠지거나 겹치는 댓글 없음
+        rest = self.walk(f'/api/posts/{self.post.pk}/comments/?' + urlencode({
+            'cursor': data['comments_cursor'], 'page_size': 3
+        }))
+        self.assertEqual(ids + rest, [comment.pk for comment in self.comments])
+
+    def test_comment_pages(self):
+        ids = self.walk(f'/api/posts/{self.post.pk}/comments/?page_size=2')
+        self.assertEqual(ids, [comment.pk for comment in self.comments])
+
+    def test_no_cursor_when_all_embedded(self):
+        Comment.objects.filter(pk__in=[c.pk for c in self.comments[3:]]).delete()
+        data = self.client.get(f'/api/posts/{self.post.pk}/').json()
+        self.assertEqual(len(data['comments']), 3)
+        self.assertIsNone(data['comments_cursor'])
+
+    def test_unknown_post(self):
+        self.assertEqual(self.client.get('/api/posts/abc/comments/').status_code, 404)
+        data = self.client.get(f'/api/posts/{self.post.pk + 1000}/comments/').json()
+        self.assertEqual(data['results'], [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+@mock.patch('boards.db_router.replica_configured', return_value=True)
+class ReplicaRoutingTests(TestCase):
+    """복제본 DB 없이 라우터 판단만 확인 (실제 쿼리는 primary로)"""
+    def setUp(self):
+        cache.clear()
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.post = create_post(board)
+
+    def replica_reads_of(self, method, url, ip='10.0.0.1', **kwargs):
+        """요청 중 읽기 쿼리가 복제본 구간이었는지 목록"""
+        seen = []
+
+        def db_for_read(router, model, **hints):
+            seen.append(db_router._replica_reads.get())
+
+        with mock.patch.object(db_router.ReplicaRouter, 'db_for_read', db_for_read):
+            response = getattr(self.client, method)(url, REMOTE_ADDR=ip, **kwargs)
+        self.assertLess(response.status_code, 300)
+        self.assertTrue(seen)
+        return seen
+
+    def test_router(self, _):
+        router = db_router.ReplicaRouter()
+        not_atomic = {DEFAULT_DB_ALIAS: mock.Mock(in_atomic_block=False)}
+        with mock.patch.object(db_router, 'connections', not_atomic):
+            self.assertIsNone(router.db_for_read(Post))
+            with db_router.replica_reads():
+                self.assertEqual(router.db_for_read(Post), db_router.REPLICA_DB_ALIAS)
+                self.assertEqual(router.db_for_write(Post), DEFAULT_DB_ALIAS)
+            with db_router.replica_reads(False):
+                self.assertIsNone(router.db_for_read(Post))
+        # atomic 블록 안의 읽기는 primary
+        with db_router.replica_reads():
+            self.assertIsNone(router.db_for_read(Post))
+
+    def test_reads_stick_to_primary_after_write(self, _):
+        detail = f'/api/posts/{self.post.pk}/'
+        self.assertTrue(all(self.replica_reads_of('get', detail)))
+        self.assertTrue(all(self.replica_reads_of('get', '/api/posts/')))
+
+        self.client.post(f'{detail}vote/', {'vote_type': 1}, REMOTE_ADDR='10.0.0.1')
+        self.assertFalse(any(self.replica_reads_of('get', detail)))
+        self.assertFalse(any(self.replica_reads_of('get', '/api/boards/')))
+        # 다른 클라이언트는 계속 복제본
+        self.assertTrue(all(self.replica_reads_of('get', detail, ip='10.0.0.2')))
+        # 쓰기 요청 자체의 읽기는 primary
+        self.assertFalse(any(self.replica_reads_of('post', f'{detail}comment/', ip='10.0.0.3', data={
+            'content': 'c', 'author_name': 'a', 'password': 'pass1234'
+        })))
+
+    def test_failed_write_not_sticky(self, _):
+        response = self.client.post(f'/api/posts/{self.post.pk}/vote/', {'vote_type': 5},
+                                    REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(db_router.can_read_replica('10.0.0.1'))
+
+    def test_sticky_across_minute_boundary(self, _):
+        # fingerprint가 바뀌어도 직전 분에 남긴 표시를 확인
+        previous = datetime.now() - timedelta(minutes=1)
+        cache.set(db_router._sticky_key(get_user_fingerprint('10.0.0.1', previous)), 1)
+        self.assertFalse(db_router.can_read_replica('10.0.0.1'))
+        self.assertTrue(db_router.can_read_replica('10.0.0.2'))
+
+    def test_no_replica_configured(self, replica_configured):
+        replica_configured.return_value = False
+        db_router.mark_primary_sticky('10.0.0.1')
+        self.assertFalse(db_router.can_read_replica('10.0.0.1'))
+        self.assertEqual(cache.get(db_router._sticky_key(get_user_fingerprint('10.0.0.1'))), None)
+
+
+SCRYPT_HASHER = {'algorithm': 'scrypt', 'scrypt_n': 16, 'scrypt_r': 8, 'scrypt_p': 1,
+                 'pbkdf2_iterations': 1000}
+PBKDF2_HASHER = {**SCRYPT_HASHER, 'algorithm': 'pbkdf2_sha256'}
+
+
+@override_settings(PASSWORD_HASHER=SCRYPT_HASHER)
+class PasswordHashTests(TestCase):
+    def verify(self, password, hashed):
+        """(검증 결과, setter로 받은 새 해시 또는 None)"""
+        upgraded = []
+        valid = verify_password(password, hashed, setter=lambda p: upgraded.append(hash_password(p)))
+        return valid, (upgraded[0] if upgraded else None)
+
+    def test_hash_format(self):
+        for hasher, prefix in ((SCRYPT_HASHER, 'scrypt$16$8$1$'),
+                               (PBKDF2_HASHER, 'pbkdf2_sha256$1000$')):
+            with self.subTest(hasher['algorithm']), override_settings(PASSWORD_HASHER=hasher):
+                hashed = hash_password('pass1234')
+                self.assertTrue(hashed.startswith(prefix))
+                # 솔트가 매번 다름
+                self.assertNotEqual(hashed, hash_password('pass1234'))
+                self.assertEqual(self.verify('pass1234', hashed), (True, None))
+                self.assertEqual(self.verify('wrong', hashed), (False, None))
+                self.assertFalse(password_needs_rehash(hashed))
+
+    def test_rehash_on_settings_change(self):
+        hashed = hash_password('pass1234')
+        for hasher in (PBKDF2_HASHER, {**SCRYPT_HASHER, 'scrypt_n': 32}):
+            with self.subTest(hasher=hasher), override_settings(PASSWORD_HASHER=hasher):
+                # 저장된 파라미터로 검증하고, 새 설정의 해시를 setter로 넘김
+                self.assertTrue(password_needs_rehash(hashed))
+                valid, upgraded = self.verify('pass1234', hashed)
+                self.assertTrue(valid)
+                self.assertFalse(password_needs_rehash(upgraded))
+                self.assertEqual(self.verify('wrong', hashed), (False, None))
+
+    def test_legacy_sha256(self):
+        legacy = hashlib.sha256(b'pass1234').hexdigest()
+        self.assertTrue(password_needs_rehash(legacy))
+        valid, upgraded = self.verify('pass1234', legacy)
+        self.assertTrue(valid)
+        self.assertTrue(upgraded.startswith('scrypt$'))
+        self.assertEqual(self.verify('wrong', legacy), (False, None))
+
+    def test_unusable_hashes(self):
+        for hashed in ('-', '', 'md5$abc$def', 'scrypt$x$8$1$c2FsdA==$aGFzaA==',
+                       'pbkdf2_sha256$1000$!!!$aGFzaA=='):
+            with self.subTest(hashed=hashed):
+                self.assertEqual(self.verify('pass1234', hashed), (False, None))
+
+    def test_update_upgrades_stored_hash(self):
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        post = create_post(board, password_hash=hashlib.sha256(b'pass1234').hexdigest())
+        url = f'/api/posts/{post.pk}/'
+        self.assertEqual(self.client.put(url, {'title': '수정', 'content': 'c', 'password': 'wrong'},
+                                         content_type='application/json').status_code, 400)
+        response = self.client.put(url, {'title': '수정', 'content': 'c', 'password': 'pass1234'},
+                                   content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        post.refresh_from_db()
+        self.assertTrue(post.password_hash.startswith('scrypt$16$8$1$'))
+        self.assertTrue(verify_password('pass1234', post.password_hash))
+
+
+@override_settings(FINGERPRINT_MODE='keyed', FINGERPRINT_SECRET='secret-1', FINGERPRINT_WORDS=2)
+class FingerprintTests(TestCase):
+    now = datetime(2024, 5, 1, 12, 30, 15)
+
+    def test_deterministic_per_minute(self):
+        fingerprint = get_user_fingerprint('1.2.3.4', self.now)
+        self.assertEqual(fingerprint, get_user_fingerprint('1.2.3.4', self.now + timedelta(seconds=40)))
+        self.assertNotEqual(fingerprint, get_user_fingerprint('1.2.3.4', self.now + timedelta(minutes=1)))
+        self.assertNotEqual(fingerprint, get_user_fingerprint('1.2.3.5', self.now))
+        words = fingerprint.split('-')
+        self.assertEqual(len(words), 2)
+        self.assertTrue(set(words) <= set(WORDLIST))
+
+    def test_word_count(self):
+        for words in (1, 3):
+            with self.subTest(words=words), override_settings(FINGERPRINT_WORDS=words):
+                self.assertEqual(len(get_user_fingerprint('1.2.3.4', self.now).split('-')), words)
+
+    def test_secret_rotation(self):
+        fingerprint = get_user_fingerprint('1.2.3.4', self.now)
+        limit_key = rate_limit_key('1.2.3.4')
+        with override_settings(FINGERPRINT_SECRET='secret-2'):
+            self.assertNotEqual(get_user_fingerprint('1.2.3.4', self.now), fingerprint)
+            self.assertNotEqual(rate_limit_key('1.2.3.4'), limit_key)
+        # 계산 결과 캐시가 이전 비밀키 값을 돌려주지 않음
+        self.assertEqual(get_user_fingerprint('1.2.3.4', self.now), fingerprint)
+
+    def test_rate_limit_key_ignores_time(self):
+        self.assertEqual(rate_limit_key('1.2.3.4'), rate_limit_key('1.2.3.4'))
+        self.assertNotEqual(rate_limit_key('1.2.3.4'), rate_limit_key('1.2.3.5'))
+        self.assertNotIn('1.2.3.4', rate_limit_key('1.2.3.4'))
+
+    @override_settings(FINGERPRINT_MODE='legacy')
+    def test_legacy_matches_old_values(self):
+        digest = hashlib.sha256(b'1.2.3.4:202405011230').digest()
+        expected = WORDLIST[int.from_bytes(digest[:2], 'big') % 2048]
+        self.assertEqual(get_user_fingerprint('1.2.3.4', self.now), expected)
+        with mock.patch('boards.fingerprints.time.time', return_value=self.now.timestamp()):
+            self.assertEqual(get_user_fingerprint('1.2.3.4'), expected)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PartitionLookupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        partitions._id_ranges.clear()
+        self.addCleanup(partitions._id_ranges.clear)
+        self.board = Board.objects.create(name='자유게시판', board_type='free')
+
+    def test_bounds_from_ranges(self):
+        now = partitions.month_start(timezone.now())
+        months = [partitions.add_months(now, i) for i in (-2, -1, 0, 1)]
+        ranges = [
+            (months[0], months[1], 1, 10),
+            (months[1], months[2], 11, 20),
+            (months[2], months[3], 21, 30),  # 이번 달: 캐시 이후 id도 들어올 수 있음
+        ]
+        loaded_at = timezone.now()
+        bounds = partitions._bounds_from_ranges
+        self.assertEqual(bounds(ranges, loaded_at, 5), (months[0], months[1]))
+        self.assertEqual(bounds(ranges, loaded_at, 20), (months[1], months[2]))
+        self.assertEqual(bounds(ranges, loaded_at, 999), (months[2], months[3]))
+        self.assertIsNone(bounds(ranges, loaded_at, 0))
+        # 기본 파티션에 있을 수 있으면 범위 없이 조회
+        self.assertIsNone(bounds([(None, None, 1, 5)] + ranges, loaded_at, 3))
+        # 빈 파티션은 건너뜀
+        self.assertEqual(bounds([(None, None, None, None)] + ranges, loaded_at, 3),
+                         (months[0], months[1]))
+
+    @skipIf(connection.vendor == 'postgresql', '파티션 없는 DB 전용')
+    def test_no_partitions(self):
+        post = create_post(self.board)
+        self.assertIsNone(partitions.created_at_bounds(Post, post.pk))
+        self.assertEqual(self.client.get(f'/api/posts/{post.pk}/').status_code, 200)
+
+    @skipIf(connection.vendor != 'postgresql', 'PostgreSQL 파티션 전용')
+    def test_detail_uses_id_range(self):
+        this_month = partitions.month_start(timezone.now())
+        past = partitions.add_months(this_month, -2)
+        with connection.cursor() as cursor:
+            partitions.create_partition(cursor, Post._meta.db_table, past)
+        old = set_created_at(create_post(self.board, title='old'), past + timedelta(days=3))
+        new = create_post(self.board, title='new')
+
+        self.assertEqual(partitions.created_at_bounds(Post, old.pk),
+                         (past, partitions.add_months(past, 1)))
+        self.assertEqual(partitions.created_at_bounds(Post, new.pk)[0], this_month)
+        self.assertIsNone(partitions.created_at_bounds(Post, 'abc'))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(f'/api/posts/{old.pk}/').json()['title'], 'old')
+        post_query = next(q['sql'] for q in queries if 'FROM "boards_post"' in q['sql'])
+        self.assertIn('"boards_post"."created_at" >=', post_query)
+
+    @skipIf(connection.vendor != 'postgresql', 'PostgreSQL 파티션 전용')
+    def test_stale_ranges_fall_back(self):
+        past = partitions.add_months(partitions.month_start(timezone.now()), -2)
+        with connection.cursor() as cursor:
+            partitions.create_partition(cursor, Post._meta.db_table, past)
+        set_created_at(create_post(self.board), past + timedelta(days=1))
+        create_post(self.board)
+        partitions.created_at_bounds(Post, 1)  # 범위 캐시
+
+        # 캐시 이후 지난 달 파티션에 들어온 행은 범위 밖이지만 범위 없이 다시 찾음
+        late = set_created_at(create_post(self.board, title='late'), past + timedelta(days=2))
+        start, end = partitions.created_at_bounds(Post, late.pk)
+        self.assertFalse(start <= late.created_at < end)
+        self.assertEqual(self.client.get(f'/api/posts/{late.pk}/').json()['title'], 'late')
+        self.assertEqual(self.client.get(f'/api/posts/{late.pk + 1000}/').status_code, 404)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True, HTTP_CACHE_LIST_S_MAXAGE=5)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.board = Board.objects.create(name='자유게시판', board_type='free')
+        self.post = create_post(self.board)
+
+    def test_list_etag(self):
+        for url in ('/api/posts/?board_type=free', '/api/posts/?board_type=free&pagination=cursor'):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                etag = response['ETag']
+                self.assertEqual(response['Cache-Control'],
+                                 'public, max-age=0, must-revalidate, s-maxage=5')
+                self.assertIn('Accept', response['Vary'])
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+                self.assertEqual(response['ETag'], etag)
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_list_etag_changes_on_write(self):
+        url = '/api/posts/?board_type=free'
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            create_post(self.board, title='new')
+            bump_post_list_generation('free')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_etag(self):
+        url = f'/api/posts/{self.post.pk}/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(response['Cache-Control'], 'public, no-cache')
+        self.assertEqual(parse_http_date(response['Last-Modified']),
+                         int(self.post.updated_at.timestamp()))
+
+        # 조회수는 ETag에 없고, 304여도 기록됨
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(Post.objects.get(pk=self.post.pk).view_count, 2)
+        # Last-Modified는 댓글/추천 수를 담지 못하므로 If-Modified-Since만으로는 304를 주지 않음
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 200
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'{url}comment/',
+                             {'content': 'c', 'author_name': 'a', 'password': 'pass1234'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.json()['comments']), 1)
+
+    def test_data_etag(self):
+        self.assertEqual(data_etag({'a': 1, 'b': [1, 2]}), data_etag({'b': [1, 2], 'a': 1}))
+        self.assertNotEqual(data_etag({'a': 1}), data_etag({'a': 2}))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RESPONSE_COMPRESSION_MIN_BYTES=512)
+class ResponseFormatTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.posts = [create_post(board, title=f'제목 {i}', content='내용 ' * 50) for i in range(10)]
+        self.url = '/api/posts/?board_type=free'
+
+    def test_fast_json_matches_drf(self):
+        data = {'한글': '값', 'n': [1, 2.5, None, True], 'at': timezone.now(),
+                'big': 2 ** 70, 'sep': 'a\u2028b\u2029c', 3: 'int key'}
+        self.assertEqual(dumps_json(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_columnar(self):
+        data = {'next': None, 'results': [
+            {'id': 2, 'board': 1, 'board_name': '자유', 'created_at': '2024-05-01T00:00:00+00:00'},
+            {'id': 1, 'board': 1, 'board_name': '자유', 'created_at': '2024-05-01T00:00:01+00:00'},
+        ]}
+        self.assertEqual(to_columnar(data), {
+            'next': None,
+            'columns': ['id', 'board', 'created_at'],
+            'rows': [[2, 1, 1714521600000], [1, 1, 1714521601000]],
+            'boards': {1: '자유'},
+        })
+        self.assertEqual(to_columnar({'error': 'x'}), {'error': 'x'})
+        self.assertEqual(to_columnar({'results': []})['rows'], [])
+
+    def test_negotiation(self):
+        expected = self.client.get(self.url).json()
+        json_etag = self.client.get(self.url)['ETag']
+        for query, accept, content_type in (
+            ('', MSGPACK, MSGPACK),
+            ('&format=msgpack', '*/*', MSGPACK),
+            ('', COLUMNAR_JSON, COLUMNAR_JSON),
+            ('&format=columnar-msgpack', '*/*', COLUMNAR_MSGPACK),
+        ):
+            with self.subTest(query=query, accept=accept):
+                url = self.url + query
+                response = self.client.get(url, HTTP_ACCEPT=accept)
+                self.assertEqual(response['Content-Type'], content_type)
+                if content_type == COLUMNAR_JSON:
+                    data = json.loads(response.content)
+                else:
+                    data = msgpack.unpackb(response.content, strict_map_key=False)
+                if content_type == MSGPACK:
+                    self.assertEqual(data, expected)
+                else:
+                    self.assertEqual(len(data['rows']), len(expected['results']))
+                    self.assertEqual(data['count'], expected['count'])
+                # 형식마다 바이트가 다르므로 ETag도 다름
+                self.assertNotEqual(response['ETag'], json_etag)
+                self.assertEqual(self.client.get(
+                    url, HTTP_ACCEPT=accept, HTTP_IF_NONE_MATCH=response['ETag']
+                ).status_code, 304)
+        # 상세는 JSON만
+        detail = f'/api/posts/{self.posts[0].pk}/'
+        self.assertEqual(self.client.get(detail, HTTP_ACCEPT=MSGPACK).status_code, 406)
+        self.assertEqual(self.client.get(f'{detail}?format=msgpack').status_code, 404)
+
+    def test_wants_compact(self):
+        factory = RequestFactory()
+        self.assertTrue(wants_compact(factory.get('/', {'format': 'columnar'})))
+        self.assertTrue(wants_compact(factory.get('/', HTTP_ACCEPT=f'{MSGPACK}, */*')))
+        self.assertFalse(wants_compact(factory.get('/', HTTP_ACCEPT='application/json')))
+
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(choose_encoding('gzip, br;q=0'), 'gzip')
+        self.assertEqual(choose_encoding('*'), 'gzip')
+        self.assertIsNone(choose_encoding('identity'))
+        self.assertIsNone(choose_encoding('gzip;q=0'))
+        self.assertIsNone(choose_encoding(None))
+
+    def test_compression(self):
+        plain = self.client.get(self.url)
+        self.assertGreater(len(plain.content), 512)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+        for encoding, decompress in (('br', brotli.decompress), ('gzip', gzip.decompress)):
+            with self.subTest(encoding=encoding):
+                response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=f'{encoding}, identity')
+                self.assertEqual(response['Content-Encoding'], encoding)
+                self.assertEqual(decompress(response.content), plain.content)
+                self.assertEqual(int(response['Content-Length']), len(response.content))
+                # 본문이 바뀌므로 약한 ETag, If-None-Match는 약한 비교라 그대로 304
+                self.assertEqual(response['ETag'], 'W/' + plain['ETag'])
+                self.assertEqual(self.client.get(
+                    self.url, HTTP_IF_NONE_MATCH=response['ETag'], HTTP_ACCEPT_ENCODING=encoding
+                ).status_code, 304)
+
+    def test_small_responses_not_compressed(self):
+        response = self.client.get('/api/boards/', HTTP_ACCEPT_ENCODING='br')
+        self.assertLess(len(response.content), 512)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PostListCountTests(TestCase):
+    """목록 count/페이지는 실제 queryset 기준 (게시판 글 수 반영 전, Redis 없는 top 포함)"""
+    page_size = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for board_type, hours in (('free', (1, 2, 3, 50, 200)), ('notice', (4, 60))):
+            board = Board.objects.create(name=board_type, board_type=board_type)
+            # bulk_create는 신호를 보내지 않으므로 post_count는 0 그대로
+            Post.objects.bulk_create([
+                Post(board=board, title='t', content='c', author_name='a',
+                     password_hash='-', author_fingerprint='f', upvote_count=h % 3)
+                for h in hours
+            ])
+            pks = Post.objects.filter(board=board).order_by('id').values_list('pk', flat=True)
+            for pk, h in zip(pks, hours):
+                Post.objects.filter(pk=pk).update(created_at=now - timedelta(hours=h))
+
+    def setUp(self):
+        cache.clear()
+
+    def expected(self, board_type, sort, window):
+        queryset = Post.objects.all()
+        if board_type:
+            queryset = queryset.filter(board__board_type=board_type)
+        if sort == 'top':
+            queryset = queryset.filter(created_at__gte=timezone.now() - TOP_WINDOWS[window])
+        return queryset.count()
+
+    def test_count_matches_queryset(self):
+        combinations = [
+            (board_type, sort, window)
+            for board_type in (None, 'free', 'notice', 'none')
+            for sort in ('recent', 'popular', 'hot', 'top')
+            for window in (TOP_WINDOWS if sort == 'top' else [None])
+        ]
+        with mock.patch('boards.ranking.get_redis_client', return_value=None):
+            for board_type, sort, window in combinations:
+                with self.subTest(board_type=board_type, sort=sort, window=window):
+                    query = {'sort': sort, 'page_size': self.page_size}
+                    if board_type:
+                        query['board_type'] = board_type
+                    if window:
+                        query['window'] = window
+                    expected = self.expected(board_type, sort, window)
+
+                    response = self.client.get('/api/posts/', query)
+                    self.assertEqual(response.json()['count'], expected)
+                    if not expected:
+                        continue
+                    # 마지막 페이지까지 빠짐없이, 그 다음 페이지는 404
+                    last = -(-expected // self.page_size)
+                    response = self.client.get('/api/posts/', {**query, 'page': last})
+                    self.assertEqual(
+                        len(response.json()['results']), expected - (last - 1) * self.page_size
+                    )
+                    self.assertIsNone(response.json()['next'])
+                    response = self.client.get('/api/posts/', {**query, 'page': last + 1})
+                    self.assertEqual(response.status_code, 404)
+
+
+class CompiledSerializerTests(TestCase):
+    """serializer 빠른 경로(compiled.py)가 DRF serializer와 같은 바이트를 렌더링하는지"""
+    orderings = {
+        'recent': ('-created_at', '-id'),
+        'popular': ('-upvote_count', '-created_at', '-id'),
+        'hot': ('-hot_score', '-id'),
+    }
+    sizes = (20, 50, 100)
+
+    @classmethod
+    def setUpTestData(cls):
+        boards = [
+            Board.objects.create(name='자유게시판', board_type='free'),
+            Board.objects.create(name='공지 "사항"', board_type='notice'),
+        ]
+        Post.objects.bulk_create([
+            Post(board=boards[i % 2], title=f'제목 {i} ✓', content='내용\n' * (i % 3),
+                 author_name=f'작성자{i % 7}', password_hash='-', author_fingerprint=f'f{i % 5}',
+                 view_count=i * 3, comment_count=i % 4, upvote_count=i % 6,
+                 downvote_count=i % 2, hot_score=(i % 9) / 7)
+            for i in range(120)
+        ])
+        # 작성시각 동률과 마이크로초가 0인 시각도 포함
+        now = timezone.now().replace(microsecond=0)
+        for i, pk in enumerate(Post.objects.order_by('id').values_list('pk', flat=True)):
+            created_at = now - timedelta(minutes=i // 3, microseconds=(i % 3) * 1001)
+            Post.objects.filter(pk=pk).update(created_at=created_at, updated_at=created_at)
+
+        cls.big_post = Post.objects.order_by('-id').first()
+        Comment.objects.bulk_create([
+            Comment(post=cls.big_post, content=f'댓글 {i}', author_name='댓글러',
+                    password_hash='-', author_fingerprint='c')
+            for i in range(settings.POST_DETAIL_COMMENTS + 10)
+        ])
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_list_pages(self):
+        for sort, ordering in self.orderings.items():
+            for size in self.sizes:
+                with self.subTest(sort=sort, size=size):
+                    posts = Post.objects.select_related('board').order_by(*ordering)[:size]
+                    rows = post_list_fields.values(Post.objects.order_by(*ordering))[:size]
+                    self.assertEqual(
+                        self.render(post_list_fields.data(rows)),
+                        self.render(PostListSerializer(posts, many=True).data),
+                    )
+
+    def test_instance_list(self):
+        # 검색 결과/Redis 랭킹은 모델 인스턴스 목록
+        posts = list(Post.objects.select_related('board').order_by('-id')[:max(self.sizes)])
+        self.assertEqual(
+            self.render(post_list_fields.data(posts)),
+            self.render(PostListSerializer(posts, many=True).data),
+        )
+
+    def test_detail(self):
+        no_comments = Post.objects.order_by('id').first()
+        for pk in (self.big_post.pk, no_comments.pk):
+            with self.subTest(pk=pk):
+                post = Post.objects.select_related('board').get(pk=pk)
+                data = post_detail_data(post)
+                if pk == self.big_post.pk:
+                    self.assertEqual(len(data['comments']), settings.POST_DETAIL_COMMENTS)
+                    self.assertIsNotNone(data['comments_cursor'])
+                self.assertEqual(self.render(data), self.render(PostDetailSerializer(post).data))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class ActivityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name='자유게시판', board_type='free')
+        other = create_post(cls.board, author_fingerprint='other')
+        base = timezone.now() - timedelta(hours=1)
+        # 글과 댓글이 같은 시각이면 글이 먼저, 같은 종류끼리는 id 내림차순
+        cls.expected = []
+        for minutes, kind in ((0, 'post'), (1, 'comment'), (1, 'post'), (2, 'comment'),
+                              (2, 'comment'), (3, 'post'), (3, 'post'), (4, 'comment')):
+            if kind == 'post':
+                obj = create_post(cls.board, author_fingerprint='writer')
+            else:
+                obj = Comment.objects.create(post=other, content='c', author_name='a',
+                                             password_hash='-', author_fingerprint='writer')
+            set_created_at(obj, base + timedelta(minutes=minutes))
+            cls.expected.append((minutes, kind == 'post', obj.pk, kind))
+        cls.expected = [(kind, pk) for *_, pk, kind in sorted(cls.expected, reverse=True)]
+
+    def test_timeline_pages_in_order(self):
+        url = '/api/fingerprints/writer/activity/?page_size=3'
+        seen = []
+        while url:
+            data = self.client.get(url).json()
+            self.assertLessEqual(len(data['results']), 3)
+            seen += [(item['type'], item['id']) for item in data['results']]
+            url = data['next']
+        self.assertEqual(seen, self.expected)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/fingerprints/writer/activity/?cursor=bad')
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class PurgeFingerprintTests(TestCase):
+    def setUp(self):
+        board = Board.objects.create(name='자유게시판', board_type='free')
+        self.other_post = create_post(board, author_fingerprint='other')
+        self.posts = [create_post(board, author_fingerprint='spam') for _ in range(3)]
+        for post in (self.other_post, self.other_post, self.posts[0]):
+            Comment.objects.create(post=post, content='c', author_name='a',
+                                   password_hash='-', author_fingerprint='spam')
+        # 다른 사람이 스팸 글에 단 댓글은 글과 함께 지워짐
+        Comment.objects.create(post=self.posts[1], content='c', author_name='a',
+                               password_hash='-', author_fingerprint='other')
+        Post.objects.filter(pk=self.other_post.pk).update(comment_count=2)
+        cast_vote(self.other_post.pk, 'spam', 1)
+        cast_vote(self.posts[2].pk, 'spam', -1)
+
+    def test_batches_follow_stage_order(self):
+        steps = []
+        while True:
+            step = purge_fingerprint_batch('spam', batch_size=2)
+            if not any(step.values()):
+                break
+            steps.append(step)
+        self.assertEqual(steps, [
+            {'comments': 2, 'votes': 0, 'posts': 0},
+            {'comments': 1, 'votes': 0, 'posts': 0},
+            {'comments': 0, 'votes': 2, 'posts': 0},
+            {'comments': 0, 'votes': 0, 'posts': 2},
+            {'comments': 0, 'votes': 0, 'posts': 1},
+        ])
+        self.assertEqual(purge_remaining('spam'), {'comments': 0, 'votes': 0, 'posts': 0})
+        self.assertEqual(Post.objects.filter(author_fingerprint='other').count(), 1)
+        self.assertFalse(Comment.objects.filter(author_fingerprint='other').exists())
+        self.assertEqual(Post.objects.get(pk=self.other_post.pk).comment_count, 0)
+
+    def test_purge_fingerprint_runs_all_batches(self):
+        self.assertEqual(
+            purge_fingerprint('spam', batch_size=1), {'comments': 3, 'votes': 2, 'posts': 3}
+        )
+
+    def test_api_deletes_one_batch_per_call(self):
+        url = '/api/admin/fingerprints/spam/'
+        self.assertEqual(self.client.delete(url).status_code, 403)
+
+        data = self.client.delete(url, **ADMIN_HEADERS).json()
+        self.assertEqual(data, {
+            'deleted': {'comments': 3, 'votes': 0, 'posts': 0},
+            'remaining': {'comments': 0, 'votes': 2, 'posts': 3},
+        })
+        self.assertEqual(self.client.delete(url, **ADMIN_HEADERS).json()['remaining'],
+                         {'comments': 0, 'votes': 0, 'posts': 3})
+        self.assertEqual(self.client.delete(url, **ADMIN_HEADERS).json(), {
+            'deleted': {'comments': 0, 'votes': 0, 'posts': 3},
+            'remaining': {'comments': 0, 'votes': 0, 'posts': 0},
+        })
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class RankingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.board = Board.objects.create(name='자유게시판', board_type='free')
+        self.now = timezone.now()
+
+    def post(self, hours_ago, up=0, down=0, comments=0):
+        post = set_created_at(create_post(self.board), self.now - timedelta(hours=hours_ago))
+        Post.objects.filter(pk=post.pk).update(
+            upvote_count=up, downvote_count=down, comment_count=comments
+        )
+        refresh_hot_scores([post.pk])
+        return post
+
+    def ids(self, query):
+        return [item['id'] for item in self.client.get('/api/posts/', query).json()['results']]
+
+    def test_hot_score(self):
+        created_at = self.now
+        self.assertGreater(hot_score(10, 0, 0, created_at), hot_score(5, 0, 0, created_at))
+        self.assertLess(hot_score(0, 5, 0, created_at), hot_score(0, 0, 0, created_at))
+        # 12.5시간 늦게 쓴 글은 순추천이 10배여야 같은 점수
+        later = created_at + timedelta(seconds=HOT_GRAVITY)
+        self.assertAlmostEqual(hot_score(100, 0, 0, created_at), hot_score(10, 0, 0, later), 5)
+        self.assertEqual(hot_score(1, 0, 2, created_at), hot_score(2, 0, 0, created_at))
+
+    def test_hot_order_and_vote_refresh(self):
+        old_popular = self.post(20, up=20)
+        fresh = self.post(1, up=2)
+        older = self.post(21)
+        self.assertEqual(self.ids({'sort': 'hot'}), [fresh.pk, old_popular.pk, older.pk])
+
+        for i in range(100):
+            cast_vote(older.pk, f'v{i}', 1)
+        if connection.vendor == 'postgresql':
+            fold_vote_counts()
+        cache.clear()
+        self.assertEqual(self.ids({'sort': 'hot'})[0], older.pk)
+
+    def test_top_fallback_without_redis(self):
+        best = self.post(2, up=5)
+        tie_old = self.post(3, up=2)
+        tie_new = self.post(1, up=3, down=1)
+        self.post(30, up=100)  # day 기간 밖
+        with mock.patch('boards.ranking.get_redis_client', return_value=None):
+            self.assertEqual(self.ids({'sort': 'top', 'window': 'day'}),
+                             [best.pk, tie_new.pk, tie_old.pk])
+            self.assertEqual(len(self.ids({'sort': 'top', 'window': 'week'})), 4)
+
+    @skipIf(fakeredis is None, 'fakeredis가 설치되어 있지 않음')
+    def test_top_reads_redis_and_prunes_on_update(self):
+        redis = fakeredis.FakeRedis()
+        posts = [self.post(hours, up=up) for hours, up in ((1, 1), (2, 5), (3, 3))]
+        with mock.patch('boards.ranking.get_redis_client', return_value=redis):
+            update_rankings(
+                [('post', 'free', p.pk, p.created_at.timestamp()) for p in posts]
+                + [('vote', 'free', p.pk, p.created_at.timestamp()) for p in posts]
+            )
+            expected = [posts[1].pk, posts[2].pk, posts[0].pk]
+            self.assertEqual(self.ids({'sort': 'top'}), expected)
+            self.assertEqual(self.ids({'sort': 'top', 'board_type': 'free'}), expected)
+
+            # 하루가 지나도 조회만으로는 지우지 않음 (읽기는 ZREVRANGE/ZCARD만)
+            later = self.now + timedelta(hours=22, minutes=30)
+            with mock.patch('boards.ranking.timezone.now', return_value=later):
+                cache.clear()
+                self.assertEqual(len(self.ids({'sort': 'top'})), 3)
+                # 랭킹 반영 작업이 바뀐 게시판과 전체 랭킹에서 기간이 지난 글을 정리
+                update_rankings([('vote', 'free', posts[0].pk, posts[0].created_at.timestamp())])
+                cache.clear()
+                self.assertEqual(self.ids({'sort': 'top'}), [posts[0].pk])
+                self.assertEqual(self.ids({'sort': 'top', 'board_type': 'free'}), [posts[0].pk])
+                self.assertEqual(self.ids({'sort': 'top', 'window': 'week'}), expected)
+
+            later = self.now + timedelta(days=7, minutes=-90)
+            with mock.patch('boards.ranking.timezone.now', return_value=later):
+                # 게시판 + 전체 랭킹에서 day 1개, week 2개
+                self.assertEqual(prune_rankings(redis), 6)
+            self.assertEqual(redis.zrange('rank:top:all:week', 0, -1), [str(posts[0].pk).encode()])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        free = Board.objects.create(name='자유게시판', board_type='free')
+        news = Board.objects.create(name='뉴스', board_type='news')
+        cls.title_hit = create_post(free, title='비트코인 시세', content='오늘 이야기')
+        cls.content_hit = create_post(free, title='잡담', content='비트코인이 떡상했다')
+        cls.news_hit = create_post(news, title='뉴스', content='비트코인 관련 소식')
+        cls.comment_only = create_post(free, title='질문', content='무엇을 살까요')
+        Comment.objects.create(post=cls.comment_only, content='비트코인을 사세요',
+                               author_name='a', password_hash='-', author_fingerprint='f')
+        create_post(free, title='무관한 글', content='비트 코인 따로')
+
+    def search(self, **query):
+        response = self.client.get('/api/posts/search/', query)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def ids(self, **query):
+        return [item['id'] for item in self.search(**query)['results']]
+
+    def test_validation(self):
+        self.assertEqual(self.client.get('/api/posts/search/', {'q': ' '}).status_code, 400)
+        self.assertEqual(self.client.get('/api/posts/search/', {'q': 'x' * 101}).status_code, 400)
+
+    def test_hangul_with_particles_and_scope(self):
+        # 조사가 붙은 "비트코인이"도 찾고, 띄어 쓴 "비트 코인"은 찾지 않음
+        posts = {self.title_hit.pk, self.content_hit.pk, self.news_hit.pk}
+        self.assertEqual(set(self.ids(q='비트코인')), posts)
+        self.assertEqual(set(self.ids(q='비트코인', scope='all')), posts | {self.comment_only.pk})
+        self.assertEqual(self.ids(q='비트코인', board_type='news'), [self.news_hit.pk])
+        self.assertEqual(self.ids(q='떡상'), [self.content_hit.pk])
+
+    def test_cursor_pages(self):
+        seen = []
+        url = '/api/posts/search/?' + urlencode({'q': '비트코인', 'scope': 'all', 'page_size': 1})
+        while url:
+            data = self.client.get(url).json()
+            seen += [item['id'] for item in data['results']]
+            url = data['next']
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(len(set(seen)), 4)
+
+    @skipIf(connection.vendor != 'postgresql', '관련도순은 PostgreSQL 전용')
+    def test_relevance_order(self):
+        # 제목(A) 매칭이 내용(B) 매칭보다, 내용이 댓글(C) 매칭보다 앞
+        ids = self.ids(q='비트코인', scope='all')
+        self.assertEqual(ids[0], self.title_hit.pk)
+        self.assertEqual(ids[-1], self.comment_only.pk)
+        self.assertFalse(self.search(q='비트코인', scope='all')['truncated'])
+
+    @skipIf(connection.vendor != 'postgresql', '관련도순은 PostgreSQL 전용')
+    def test_truncated_candidates(self):
+        # 최신 매칭 2개만 후보 - 가장 관련도 높은 예전 글(제목 매칭)이 빠지고 truncated로 알림
+        with mock.patch('boards.search.SEARCH_MAX_CANDIDATES', 2):
+            data = self.search(q='비트코인')
+            self.assertTrue(data['truncated'])
+            self.assertNotIn(self.title_hit.pk, [item['id'] for item in data['results']])
+            data = self.search(q='떡상')
+            self.assertFalse(data['truncated'])
+            data = self.search(q='비트코인', cursor=encode_cursor([0.0, 1]))
+            self.assertEqual((data['results'], data['truncated']), ([], True))
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL이 아닌 DB의 부분 일치 검색')
+    def test_fallback_is_recent_substring(self):
+        self.assertEqual(self.ids(q='비트코인'),
+                         [self.news_hit.pk, self.content_hit.pk, self.title_hit.pk])
+        self.assertFalse(self.search(q='비트코인')['truncated'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TASKS_SYNC=True)
+class KeysetPaginationTests(TestCase):
+    orderings = {
+        'recent': ('-created_at', '-id'),
+        'popular': ('-upvote_count', '-created_at', '-id'),
+        'hot': ('-hot_score', '-id'),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name='자유게시판', board_type='free')
+        base = timezone.now() - timedelta(hours=1)
+        # 작성시각/추천수/hot 점수 동률이 페이지 경계에 걸치도록
+        for i in range(9):
+            post = create_post(cls.board)
+            Post.objects.filter(pk=post.pk).update(
+                created_at=base + timedelta(minutes=i // 3), upvote_count=i % 2, hot_score=i // 4
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, url):
+        ids, pages = [], 0
+        while url:
+            data = self.client.get(url).json()
+            self.assertLessEqual(len(data['results']), 2)
+            ids += [item['id'] for item in data['results']]
+            url = data['next']
+            pages += 1
+        return ids, pages
+
+    def test_cursor_pages_match_ordering(self):
+        for sort, ordering in self.orderings.items():
+            with self.subTest(sort=sort):
+                ids, pages = self.walk(f'/api/posts/?pagination=cursor&page_size=2&sort={sort}')
+                expected = list(Post.objects.order_by(*ordering).values_list('id', flat=True))
+                self.assertEqual(ids, expected)
+                self.assertEqual(pages, 5)
+
+    def test_cursor_stable_across_new_posts(self):
+        first = self.client.get('/api/posts/?pagination=cursor&page_size=2').json()
+        second = self.client.get(first['next']).json()
+        create_post(self.board)
+        # 새 글이 앞에 들어와도 같은 커서는 같은 페이지
+        self.assertEqual(self.client.get(first['next']).json()['results'], second['results'])
+        previous = self.client.get(second['previous']).json()
+        self.assertEqual([item['id'] for item in previous['results']],
+                         [item['id'] for item in first['results']])
+
+    def test_page_mode_without_count(self):
+        ids, _ = self.walk('/api/posts/?count=false&page_size=2')
+        expected = Post.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        self.assertEqual(ids, list(expected))
+        data = self.client.get('/api/posts/?count=false&page_size=2&page=2').json()
+        self.assertNotIn('count', data)
+        self.assertIsNotNone(data['previous'])
+
+    def test_invalid_cursor(self):
+        for cursor in ('bad', encode_cursor(['x'])):
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/posts/', {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
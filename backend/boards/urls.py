@@ -1,13 +1,33 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import BoardViewSet, PostViewSet, delete_comment, admin_create_news
+from .views import (
+    BoardViewSet, PostViewSet, delete_comment, admin_create_news, metrics, health,
+    board_events, post_events, fingerprint_activity, admin_purge_fingerprint
+)
 
 router = DefaultRouter()
 router.register('boards', BoardViewSet, basename='board')
 router.register('posts', PostViewSet, basename='post')
 
-urlpatterns = [
+urlpatterns = []
+if settings.ASYNC_READ_VIEWS:
+    # ASGI 실행 시 읽기 경로는 async 뷰가 먼저 받고, 쓰기 요청은 DRF 뷰로 넘김
+    from . import async_views
+    urlpatterns += [
+        path('boards/', async_views.board_list, name='board-list-async'),
+        path('posts/', async_views.post_list, name='post-list-async'),
+        path('posts/<int:pk>/', async_views.post_detail, name='post-detail-async'),
+    ]
+
+urlpatterns += [
     path('', include(router.urls)),
     path('comments/<int:pk>/', delete_comment, name='delete-comment'),
     path('admin/news/', admin_create_news, name='admin-news'),
+    path('admin/fingerprints/<str:fingerprint>/', admin_purge_fingerprint, name='admin-purge-fingerprint'),
+    path('fingerprints/<str:fingerprint>/activity/', fingerprint_activity, name='fingerprint-activity'),
+    path('metrics/', metrics, name='metrics'),
+    path('health/', health, name='health'),
+    path('events/boards/<slug:board_type>/', board_events, name='board-events'),
+    path('events/posts/<int:pk>/', post_events, name='post-events'),
 ]
@@ -1,55 +1,206 @@
+import asyncio
+import base64
 import hashlib
-from datetime import datetime, timedelta
-from mnemonic import Mnemonic
+import hmac
+import math
+import secrets
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
-# BIP39 영어 단어 목록 (2048개)
-mnemo = Mnemonic("english")
-WORDLIST = mnemo.wordlist
+
+def get_redis_client():
+    """
+    캐시 백엔드가 django_redis면 raw Redis 클라이언트를 반환
+    (로컬 개발용 locmem 등 다른 백엔드면 None)
+    """
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except (ImportError, NotImplementedError):
+        return None
+
+
+_async_clients = weakref.WeakKeyDictionary()
 
 
-def get_user_fingerprint(ip_address: str, timestamp: datetime = None) -> str:
+def get_async_redis_client():
     """
-    IP 주소와 시간을 조합하여 BIP39 니모닉 단어 하나를 반환
-    같은 시간대(1분 단위)에 같은 IP는 같은 단어를 받음
+    async 뷰용 redis.asyncio 클라이언트 (django_redis와 같은 LOCATION/풀 옵션)
+    연결은 이벤트 루프에 묶이므로 루프마다 하나씩 만든다. django_redis가 아니면 None
     """
-    if timestamp is None:
-        timestamp = datetime.now()
+    from django.conf import settings
+
+    config = settings.CACHES['default']
+    if not config['BACKEND'].startswith('django_redis'):
+        return None
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        from redis.asyncio import BlockingConnectionPool, Redis
+        from .instrumentation import instrument_async_pool
+
+        # 한 루프가 많은 요청을 동시에 처리하므로 max_connections를 넘으면 에러 대신 대기
+        pool_kwargs = config.get('OPTIONS', {}).get('CONNECTION_POOL_KWARGS', {})
+        pool = BlockingConnectionPool.from_url(config['LOCATION'], **pool_kwargs)
+        instrument_async_pool(pool)
+        client = _async_clients[loop] = Redis(connection_pool=pool)
+    return client
+
+
+# 슬라이딩 윈도우 로그: 윈도우 안의 요청 시각을 ZSET에 기록하고
+# 한도를 넘으면 가장 오래된 요청이 윈도우를 벗어날 때까지 남은 ms를 반환
+# 시각은 Redis 서버 시간(TIME)을 써서 앱 서버 간 시계 차이에 영향받지 않음
+RATE_LIMIT_SCRIPT = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now, now .. '-' .. ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return tonumber(oldest[2]) + window - now
+"""
+_rate_limit_script = None
+
+
+def check_rate_limit(subject: str, policy: str = 'post') -> int:
+    """
+    레이트 리밋 체크 (정책은 settings.RATE_LIMITS, subject는 fingerprints.rate_limit_key)
+    허용되면 0, 초과면 다시 시도할 수 있을 때까지 남은 초(Retry-After)를 반환
+    Redis에서는 Lua 스크립트 한 번(왕복 1회)으로 원자적으로 처리
+    """
+    global _rate_limit_script
+    from django.conf import settings
     
-    # 1분 단위로 반올림 (같은 분에는 같은 단어)
-    time_key = timestamp.strftime('%Y%m%d%H%M')
+    limit, window = settings.RATE_LIMITS[policy]
+    cache_key = f"rate_limit:{policy}:{subject}"
     
-    # IP + 시간 조합 해시
-    combined = f"{ip_address}:{time_key}"
-    hash_digest = hashlib.sha256(combined.encode()).digest()
+    client = get_redis_client()
+    if client is None:
+        return _check_rate_limit_fixed_window(cache_key, limit, window)
     
-    # 해시값을 숫자로 변환하여 2048로 나눈 나머지 → 단어 인덱스
-    hash_int = int.from_bytes(hash_digest[:2], byteorder='big')
-    word_index = hash_int % 2048
+    if _rate_limit_script is None:
+        _rate_limit_script = client.register_script(RATE_LIMIT_SCRIPT)
+    wait_ms = _rate_limit_script(
+        keys=[cache_key],
+        args=[window * 1000, limit, secrets.token_hex(4)],
+        client=client,
+    )
+    return math.ceil(wait_ms / 1000) if wait_ms > 0 else 0
+
+
+def _check_rate_limit_fixed_window(cache_key: str, limit: int, window: int) -> int:
+    """Redis가 없을 때(locmem 등) 쓰는 고정 윈도우 방식"""
+    from django.core.cache import cache
     
-    return WORDLIST[word_index]
+    # add는 키가 없을 때만 저장하므로 TTL이 요청마다 늘어나지 않음
+    cache.add(cache_key, 0, window)
+    try:
+        count = cache.incr(cache_key)
+    except ValueError:
+        # add와 incr 사이에 만료됨
+        cache.add(cache_key, 1, window)
+        count = 1
+    return 0 if count <= limit else window
 
 
-def check_rate_limit(fingerprint: str, cache) -> bool:
+# 비밀번호 해시 형식 (알고리즘과 파라미터를 해시마다 저장해 설정을 바꿔도 기존 해시 검증 가능)
+#   scrypt$<n>$<r>$<p>$<salt>$<hash>
+#   pbkdf2_sha256$<iterations>$<salt>$<hash>
+# 솔트 없는 SHA-256 hex(64자)는 예전 형식으로, 검증에 성공하면 새 형식으로 바꿔 저장한다.
+_kdf_executor = None
+_kdf_executor_lock = threading.Lock()
+
+
+def _run_kdf(func, *args):
     """
-    레이트 리밋 체크: 1분에 3개까지만 글 작성 가능
+    KDF 계산을 프로세스 공용 스레드 풀(PASSWORD_HASH_WORKERS개)에서 실행
+    hashlib KDF는 GIL을 풀고 CPU와 메모리(scrypt n=2^14, r=8이면 16MB)를 쓰므로,
+    쓰기 요청이 몰려도 동시에 계산하는 수를 묶어 두어 읽기 요청 스레드가 밀리지 않게 한다.
     """
+    global _kdf_executor
+    if _kdf_executor is None:
+        from django.conf import settings
+
+        with _kdf_executor_lock:
+            if _kdf_executor is None:
+                _kdf_executor = ThreadPoolExecutor(
+                    settings.PASSWORD_HASH_WORKERS, thread_name_prefix='kdf'
+                )
+    return _kdf_executor.submit(func, *args).result()
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _encode_password(password: str, algorithm: str, params: tuple, salt: bytes) -> str:
+    if algorithm == 'scrypt':
+        n, r, p = params
+        digest = hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p,
+            maxmem=256 * n * r * p, dklen=32,
+        )
+    elif algorithm == 'pbkdf2_sha256':
+        iterations, = params
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+    else:
+        raise ValueError(f'지원하지 않는 비밀번호 해시: {algorithm}')
+    return '$'.join([algorithm, *map(str, params), _b64(salt), _b64(digest)])
+
+
+def _current_hasher():
+    """설정의 (알고리즘, 파라미터)"""
     from django.conf import settings
-    
-    cache_key = f"rate_limit:{fingerprint}"
-    count = cache.get(cache_key, 0)
-    
-    if count >= settings.RATE_LIMIT_MAX_POSTS:
-        return False
-    
-    cache.set(cache_key, count + 1, settings.RATE_LIMIT_WINDOW)
-    return True
+
+    config = settings.PASSWORD_HASHER
+    algorithm = config['algorithm']
+    if algorithm == 'scrypt':
+        return algorithm, (config['scrypt_n'], config['scrypt_r'], config['scrypt_p'])
+    return algorithm, (config['pbkdf2_iterations'],)
 
 
 def hash_password(password: str) -> str:
-    """비밀번호 해시"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """비밀번호 해시 (솔트 + settings.PASSWORD_HASHER의 KDF)"""
+    algorithm, params = _current_hasher()
+    return _run_kdf(_encode_password, password, algorithm, params, secrets.token_bytes(16))
 
 
-def verify_password(password: str, hashed: str) -> bool:
-    """비밀번호 검증"""
-    return hash_password(password) == hashed
+def password_needs_rehash(hashed: str) -> bool:
+    """예전 형식이거나 현재 설정과 알고리즘/파라미터가 다른 해시"""
+    algorithm, params = _current_hasher()
+    return hashed.split('$')[:len(params) + 1] != [algorithm, *map(str, params)]
+
+
+def verify_password(password: str, hashed: str, setter=None) -> bool:
+    """
+    비밀번호 검증
+    성공했는데 해시를 새로 만들어야 하면 setter(password)를 호출한다
+    (django.contrib.auth.hashers.check_password와 같은 방식, 저장은 호출한 쪽에서)
+    """
+    algorithm, *fields = hashed.split('$')
+    if not fields:
+        # 예전 형식: 솔트 없는 SHA-256 hex (64자)
+        # '$'도 없고 64자도 아닌 값('-' 같은 사용할 수 없는 해시)은 비교 없이 실패
+        if len(hashed) != 64:
+            return False
+        valid = hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), hashed)
+    else:
+        try:
+            *params, salt, _ = fields
+            expected = _run_kdf(
+                _encode_password, password, algorithm,
+                tuple(map(int, params)), base64.b64decode(salt),
+            )
+        except ValueError:
+            # 알 수 없는 알고리즘이거나 파라미터/솔트가 잘못된 해시
+            return False
+        valid = hmac.compare_digest(expected, hashed)
+    if valid and setter is not None and password_needs_rehash(hashed):
+        setter(password)
+    return valid
@@ -1,20 +1,50 @@
+import secrets
+from contextlib import ExitStack
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.permissions import AllowAny, SAFE_METHODS
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404
-from django.core.cache import cache
-from django.db import transaction
-from django.db.models import F
+from django.views.decorators.http import require_GET
+from django.db import connection, transaction
 
-from .models import Board, Post, Comment, Vote
+from .models import Board, Post, Comment
 from .serializers import (
     BoardSerializer, PostListSerializer, PostDetailSerializer,
     PostCreateSerializer, PostUpdateSerializer,
     CommentSerializer, CommentCreateSerializer,
-    VoteSerializer, AdminPostCreateSerializer
+    VoteSerializer, AdminPostCreateSerializer, COMMENT_ORDERING,
+    comment_fields, post_detail_data, post_list_fields
+)
+from .activity import activity_page, purge_fingerprint_batch, purge_remaining
+from .caching import (
+    get_cached_board_list, set_cached_board_list,
+    is_cacheable_post_list, post_list_cache_key,
+    get_cached_post_list, set_cached_post_list, bump_post_list_generation
+)
+from .conditional import (
+    DETAIL_CACHE_CONTROL, data_etag, list_cache_control, not_modified, post_etag,
+    representation_etag, set_validators
 )
-from .utils import get_user_fingerprint, check_rate_limit, verify_password
+from .counters import record_comment, record_view
+from .db_router import can_read_replica, mark_primary_sticky, replica_reads
+from .events import (
+    BOARD_TYPES, board_channel, event_stream_response, events_available,
+    post_channel, publish_event
+)
+from .fingerprints import get_user_fingerprint, rate_limit_key
+from .instrumentation import InstrumentedViewMixin, render_prometheus
+from .pagination import PostPagination, CommentPagination
+from .partitions import comments_since, created_at_bounds
+from .ranking import TOP_WINDOWS, top_posts
+from .renderers import COMPACT_RENDERERS
+from .search import SEARCH_QUERY_MAX_LENGTH, SEARCH_SCOPES, search_posts
+from .utils import get_redis_client, check_rate_limit, verify_password
+from .votes import cast_vote
 
 
 def get_client_ip(request):
@@ -27,16 +57,65 @@ def get_client_ip(request):
     return ip
 
 
-class BoardViewSet(viewsets.ReadOnlyModelViewSet):
+def too_many_requests(message, retry_after):
+    """레이트 리밋 초과 응답 (Retry-After 헤더 포함)"""
+    return Response(
+        {'error': message},
+        status=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={'Retry-After': str(retry_after)}
+    )
+
+
+class ReplicaReadMixin:
+    """
+    replica_actions 요청의 읽기 쿼리를 복제본으로 보냄 (DATABASES['replica']가 있을 때)
+    쓰기 요청이 성공하면 그 클라이언트의 읽기를 잠시 primary로 고정 (boards/db_router.py)
+    """
+    replica_actions = ('list', 'retrieve')
+    
+    def dispatch(self, request, *args, **kwargs):
+        with ExitStack() as self._replica_scope:
+            return super().dispatch(request, *args, **kwargs)
+    
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.action in self.replica_actions and can_read_replica(get_client_ip(request)):
+            self._replica_scope.enter_context(replica_reads())
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            mark_primary_sticky(get_client_ip(request))
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class BoardViewSet(ReplicaReadMixin, InstrumentedViewMixin, viewsets.ReadOnlyModelViewSet):
     """게시판 목록/상세"""
     queryset = Board.objects.all()
     serializer_class = BoardSerializer
     permission_classes = [AllowAny]
+    pagination_class = None
+    
+    def list(self, request, *args, **kwargs):
+        """게시판 목록 (Redis 캐시, 글 작성/삭제 시 무효화)"""
+        data = get_cached_board_list()
+        if data is None:
+            data = self.get_serializer(self.get_queryset(), many=True).data
+            set_cached_board_list(data)
+        return Response(data)
 
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(ReplicaReadMixin, InstrumentedViewMixin, viewsets.ModelViewSet):
     """게시글 CRUD"""
     permission_classes = [AllowAny]
+    pagination_class = PostPagination
+    # Accept로 MessagePack/columnar 형식을 고를 수 있는 목록 액션
+    compact_actions = ('list', 'search', 'comments')
+    
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if self.action in self.compact_actions:
+            renderers += [renderer() for renderer in COMPACT_RENDERERS]
+        return renderers
     
     def get_queryset(self):
         queryset = Post.objects.select_related('board').all()
@@ -46,49 +125,114 @@ class PostViewSet(viewsets.ModelViewSet):
         if board_type:
             queryset = queryset.filter(board__board_type=board_type)
         
-        # 정렬 옵션
+        # 정렬 옵션 (id는 동률 처리 및 keyset 커서용)
         sort = self.request.query_params.get('sort', 'recent')
         if sort == 'popular':
-            queryset = queryset.order_by('-upvote_count', '-created_at')
+            queryset = queryset.order_by('-upvote_count', '-created_at', '-id')
+        elif sort == 'hot':
+            queryset = queryset.order_by('-hot_score', '-id')
+        elif sort == 'top' and self.action == 'list':
+            # 기간별 추천 랭킹 (Redis ZSET)
+            window = self.request.query_params.get('window', 'day')
+            if window not in TOP_WINDOWS:
+                window = 'day'
+            queryset = top_posts(queryset, board_type, window)
         else:  # recent
-            queryset = queryset.order_by('-created_at')
+            queryset = queryset.order_by('-created_at', '-id')
+        
+        # 상세 조회는 id가 속한 월 파티션만 보도록 created_at 범위를 함께 검
+        created_range = getattr(self, 'created_range', None)
+        if created_range:
+            queryset = queryset.filter(
+                created_at__gte=created_range[0], created_at__lt=created_range[1]
+            )
         
         return queryset
     
+    def get_object(self):
+        self.created_range = created_at_bounds(Post, self.kwargs.get('pk'))
+        if self.created_range:
+            try:
+                return super().get_object()
+            except Http404:
+                # 범위 캐시 이후 지난 달 파티션에 들어온 행일 수 있으므로 범위 없이 다시 조회
+                pass
+            finally:
+                self.created_range = None
+        return super().get_object()
+    
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in ('list', 'search'):
             return PostListSerializer
         elif self.action == 'create':
             return PostCreateSerializer
         elif self.action in ['update', 'partial_update']:
             return PostUpdateSerializer
+        elif self.action == 'comments':
+            return CommentSerializer
         return PostDetailSerializer
     
+    def list(self, request, *args, **kwargs):
+        """게시글 목록 (앞쪽 페이지는 게시판 세대별로 캐시, ETag로 조건부 GET)"""
+        if not is_cacheable_post_list(request.query_params):
+            data = self.list_data()
+            entry = {'etag': data_etag(data), 'data': data}
+        else:
+            cache_key = post_list_cache_key(request.query_params)
+            entry = get_cached_post_list(cache_key)
+            if entry is None:
+                entry = set_cached_post_list(cache_key, self.list_data())
+        
+        # 클라이언트/CDN이 가진 것과 같으면 렌더링 없이 304
+        etag = representation_etag(entry['etag'], request)
+        cache_control = list_cache_control()
+        return (
+            not_modified(request, etag, cache_control)
+            or set_validators(Response(entry['data']), etag, cache_control)
+        )
+    
+    def list_data(self):
+        """
+        ListModelMixin.list와 같은 응답 데이터를 serializer 없이 만듦
+        필요한 컬럼만 values()로 읽고 (Redis 랭킹은 인스턴스 목록) post_list_fields로 변환
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if hasattr(queryset, 'query'):
+            queryset = post_list_fields.values(queryset)
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(self.serialize(post_list_fields.data, page)).data
+    
     def create(self, request, *args, **kwargs):
         """게시글 작성"""
         ip = get_client_ip(request)
         fingerprint = get_user_fingerprint(ip)
         
         # 레이트 리밋 체크
-        if not check_rate_limit(fingerprint, cache):
-            return Response(
-                {'error': '너무 자주 글을 작성하고 있습니다. 잠시 후 다시 시도해주세요.'},
-                status=status.HTTP_429_TOO_MANY_REQUESTS
+        retry_after = check_rate_limit(rate_limit_key(ip), 'post')
+        if retry_after:
+            return too_many_requests(
+                '너무 자주 글을 작성하고 있습니다. 잠시 후 다시 시도해주세요.',
+                retry_after
             )
         
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         # 뉴스 게시판은 일반 사용자가 작성 불가
-        board_id = serializer.validated_data.get('board').id
-        board = Board.objects.get(id=board_id)
+        board = serializer.validated_data['board']
         if board.board_type == 'news':
             return Response(
                 {'error': '뉴스 게시판에는 관리자만 글을 작성할 수 있습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
+        # 요청 안에서는 글 INSERT와 목록 캐시 세대 증가(작성자가 바로 보도록)만 하고
+        # 게시판 글 수, 랭킹 등록, 이벤트 발행은 후속 작업 큐로 (signals, tasks.py)
         post = serializer.save(author_fingerprint=fingerprint)
+        bump_post_list_generation(board.board_type)
+        publish_event(
+            [board_channel(board.board_type)], 'post_created', PostListSerializer(post).data
+        )
         
         return Response(
             PostDetailSerializer(post).data,
@@ -96,15 +240,25 @@ class PostViewSet(viewsets.ModelViewSet):
         )
     
     def retrieve(self, request, *args, **kwargs):
-        """게시글 조회 (조회수 증가)"""
+        """게시글 조회 (조회수 증가, ETag/Last-Modified로 조건부 GET)"""
         instance = self.get_object()
         
-        # 조회수 증가 (F() 사용으로 race condition 방지)
-        Post.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
-        instance.refresh_from_db()
+        # 조회수 증가는 Redis에 버퍼링 (flush_view_counts 커맨드가 DB에 일괄 반영)
+        # 아직 반영되지 않은 댓글 수 증감도 함께 더해서 보여줌
+        view_delta, comment_delta = record_view(instance.pk)
+        instance.view_count += view_delta
+        instance.comment_count += comment_delta
         
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # 조회수는 위에서 기록했으므로 304여도 빠지지 않음 (직렬화와 댓글 조회만 생략)
+        etag = post_etag(instance)
+        response = not_modified(request, etag, DETAIL_CACHE_CONTROL, instance.updated_at)
+        if response is not None:
+            return response
+        
+        return set_validators(
+            Response(self.serialize(post_detail_data, instance)),
+            etag, DETAIL_CACHE_CONTROL, instance.updated_at
+        )
     
     def update(self, request, *args, **kwargs):
         """게시글 수정"""
@@ -114,6 +268,7 @@ class PostViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        bump_post_list_generation(instance.board.board_type)
         
         return Response(PostDetailSerializer(instance).data)
     
@@ -134,71 +289,48 @@ class PostViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
+        post_id = instance.pk
         self.perform_destroy(instance)
+        bump_post_list_generation(instance.board.board_type)
+        publish_event(
+            [board_channel(instance.board.board_type), post_channel(post_id)],
+            'post_deleted', {'id': post_id}
+        )
         return Response(status=status.HTTP_204_NO_CONTENT)
     
     @action(detail=True, methods=['post'])
     def vote(self, request, pk=None):
         """추천/비추천"""
-        post = self.get_object()
         ip = get_client_ip(request)
         fingerprint = get_user_fingerprint(ip)
         
+        retry_after = check_rate_limit(rate_limit_key(ip), 'vote')
+        if retry_after:
+            return too_many_requests(
+                '너무 자주 투표하고 있습니다. 잠시 후 다시 시도해주세요.',
+                retry_after
+            )
+        
         serializer = VoteSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         vote_type = serializer.validated_data['vote_type']
         
-        with transaction.atomic():
-            # 기존 투표 확인
-            existing_vote = Vote.objects.filter(
-                post=post,
-                voter_fingerprint=fingerprint
-            ).first()
-            
-            if existing_vote:
-                # 이미 투표한 경우
-                if existing_vote.vote_type == vote_type:
-                    # 같은 투표 취소
-                    existing_vote.delete()
-                    if vote_type == 1:
-                        post.upvote_count = F('upvote_count') - 1
-                    else:
-                        post.downvote_count = F('downvote_count') - 1
-                    post.save(update_fields=['upvote_count', 'downvote_count'])
-                    action_taken = 'cancelled'
-                else:
-                    # 다른 투표로 변경
-                    existing_vote.vote_type = vote_type
-                    existing_vote.save()
-                    if vote_type == 1:
-                        post.upvote_count = F('upvote_count') + 1
-                        post.downvote_count = F('downvote_count') - 1
-                    else:
-                        post.upvote_count = F('upvote_count') - 1
-                        post.downvote_count = F('downvote_count') + 1
-                    post.save(update_fields=['upvote_count', 'downvote_count'])
-                    action_taken = 'changed'
-            else:
-                # 새로운 투표
-                Vote.objects.create(
-                    post=post,
-                    voter_fingerprint=fingerprint,
-                    vote_type=vote_type
-                )
-                if vote_type == 1:
-                    post.upvote_count = F('upvote_count') + 1
-                else:
-                    post.downvote_count = F('downvote_count') + 1
-                post.save(update_fields=['upvote_count', 'downvote_count'])
-                action_taken = 'voted'
-            
-            post.refresh_from_db()
+        # 투표 추가/변경/취소와 카운트 반영을 단일 upsert 문장으로 처리
+        try:
+            action_taken, upvote_count, downvote_count = cast_vote(
+                int(pk), fingerprint, vote_type
+            )
+        except (ValueError, Post.DoesNotExist):
+            raise Http404
         
+        publish_event([post_channel(pk)], 'vote', {
+            'id': int(pk), 'upvote_count': upvote_count, 'downvote_count': downvote_count
+        })
         return Response({
             'action': action_taken,
-            'upvote_count': post.upvote_count,
-            'downvote_count': post.downvote_count
+            'upvote_count': upvote_count,
+            'downvote_count': downvote_count
         })
     
     @action(detail=True, methods=['post'])
@@ -209,10 +341,11 @@ class PostViewSet(viewsets.ModelViewSet):
         fingerprint = get_user_fingerprint(ip)
         
         # 레이트 리밋 체크
-        if not check_rate_limit(f"comment_{fingerprint}", cache):
-            return Response(
-                {'error': '너무 자주 댓글을 작성하고 있습니다. 잠시 후 다시 시도해주세요.'},
-                status=status.HTTP_429_TOO_MANY_REQUESTS
+        retry_after = check_rate_limit(rate_limit_key(ip), 'comment')
+        if retry_after:
+            return too_many_requests(
+                '너무 자주 댓글을 작성하고 있습니다. 잠시 후 다시 시도해주세요.',
+                retry_after
             )
         
         serializer = CommentCreateSerializer(data=request.data)
@@ -224,21 +357,74 @@ class PostViewSet(viewsets.ModelViewSet):
                 author_fingerprint=fingerprint
             )
             
-            # 댓글 수 업데이트
-            post.comment_count = F('comment_count') + 1
-            post.save(update_fields=['comment_count'])
+            # 댓글 수는 Redis에 버퍼링 (flush_comment_counts 커맨드가 hot 점수와 함께 반영)
+            comment_count = record_comment(post, 1)
         
-        return Response(
-            CommentSerializer(comment).data,
-            status=status.HTTP_201_CREATED
+        data = CommentSerializer(comment).data
+        publish_event([post_channel(post.pk)], 'comment_created', {
+            'post_id': post.pk, 'comment': data, 'comment_count': comment_count
+        })
+        publish_event([board_channel(post.board.board_type)], 'post_counts', {
+            'id': post.pk, 'comment_count': comment_count
+        })
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """게시글 검색 (최신 매칭 후보 안에서 관련도순, 커서 페이지네이션)"""
+        q = request.query_params.get('q', '').strip()
+        if not q:
+            return Response(
+                {'error': '검색어를 입력해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(q) > SEARCH_QUERY_MAX_LENGTH:
+            return Response(
+                {'error': f'검색어는 {SEARCH_QUERY_MAX_LENGTH}자 이하로 입력해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        scope = request.query_params.get('scope', 'post')
+        if scope not in SEARCH_SCOPES:
+            scope = 'post'
+        
+        posts, next_cursor, truncated = search_posts(
+            q,
+            board_type=request.query_params.get('board_type'),
+            scope=scope,
+            cursor=request.query_params.get('cursor'),
+            page_size=self.paginator.get_page_size(request),
         )
+        next_url = None
+        if next_cursor:
+            next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+        return Response({
+            'next': next_url,
+            'previous': None,
+            'results': self.serialize(post_list_fields.data, posts),
+            'truncated': truncated,
+        })
+    
+    @action(detail=True, methods=['get'], pagination_class=CommentPagination)
+    def comments(self, request, pk=None):
+        """댓글 목록 (커서 페이지네이션)"""
+        try:
+            queryset = Comment.objects.filter(post_id=int(pk)).order_by(*COMMENT_ORDERING)
+        except ValueError:
+            raise Http404
+        # 글이 속한 달 이전의 댓글 파티션은 제외
+        created_range = created_at_bounds(Post, pk)
+        if created_range:
+            queryset = queryset.filter(created_at__gte=comments_since(created_range[0]))
+        page = self.paginate_queryset(comment_fields.values(queryset))
+        return self.get_paginated_response(self.serialize(comment_fields.data, page))
 
 
 @api_view(['DELETE'])
 @permission_classes([AllowAny])
 def delete_comment(request, pk):
     """댓글 삭제"""
-    comment = get_object_or_404(Comment, pk=pk)
+    comment = get_object_or_404(Comment.objects.select_related('post__board'), pk=pk)
     password = request.data.get('password')
     
     if not password:
@@ -255,19 +441,24 @@ def delete_comment(request, pk):
     
     with transaction.atomic():
         post = comment.post
+        comment_id = comment.pk
         comment.delete()
         
-        # 댓글 수 업데이트
-        post.comment_count = F('comment_count') - 1
-        post.save(update_fields=['comment_count'])
+        # 댓글 수는 Redis에 버퍼링 (flush_comment_counts 커맨드가 hot 점수와 함께 반영)
+        comment_count = record_comment(post, -1)
+        publish_event([post_channel(post.pk)], 'comment_deleted', {
+            'post_id': post.pk, 'id': comment_id, 'comment_count': comment_count
+        })
+        publish_event([board_channel(post.board.board_type)], 'post_counts', {
+            'id': post.pk, 'comment_count': comment_count
+        })
+    mark_primary_sticky(get_client_ip(request))
     
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def admin_create_news(request):
-    """관리자용 뉴스 게시글 작성"""
+def admin_forbidden(request):
+    """관리자 토큰이 없으면 403 응답"""
     # 간단한 토큰 인증 (실제로는 더 강력한 인증 사용)
     admin_token = request.headers.get('X-Admin-Token')
     if admin_token != 'biback_admin_2024':  # 환경변수로 관리 권장
@@ -275,12 +466,111 @@ def admin_create_news(request):
             {'error': '관리자 권한이 필요합니다.'},
             status=status.HTTP_403_FORBIDDEN
         )
+    return None
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def fingerprint_activity(request, fingerprint):
+    """fingerprint가 쓴 글/댓글 타임라인 (최신순, 커서 페이지네이션)"""
+    results, next_cursor = activity_page(
+        fingerprint,
+        cursor=request.query_params.get('cursor'),
+        page_size=PostPagination().get_page_size(request),
+    )
+    next_url = None
+    if next_cursor:
+        next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+    return Response({'next': next_url, 'previous': None, 'results': results})
+
+
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def admin_purge_fingerprint(request, fingerprint):
+    """
+    관리자용: fingerprint의 글/댓글/투표를 한 배치만 삭제하고 남은 수를 응답
+    요청 시간이 삭제량에 비례하지 않도록 remaining이 모두 0이 될 때까지 다시 호출 (중간에 끊겨도 이어서 진행)
+    """
+    forbidden = admin_forbidden(request)
+    if forbidden:
+        return forbidden
+    return Response({
+        'deleted': purge_fingerprint_batch(fingerprint),
+        'remaining': purge_remaining(fingerprint),
+    })
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def admin_create_news(request):
+    """관리자용 뉴스 게시글 작성"""
+    forbidden = admin_forbidden(request)
+    if forbidden:
+        return forbidden
     
     serializer = AdminPostCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     post = serializer.save()
+    bump_post_list_generation(post.board.board_type)
+    publish_event([board_channel(post.board.board_type)], 'post_created', PostListSerializer(post).data)
+    mark_primary_sticky(get_client_ip(request))
     
     return Response(
         PostDetailSerializer(post).data,
         status=status.HTTP_201_CREATED
     )
+
+
+@require_GET
+def board_events(request, board_type):
+    """
+    게시판 이벤트 스트림 (SSE) - 새 글, 글 삭제, 댓글 수 변경
+    ASGI에서는 boards.events.EventStreamMiddleware가 먼저 처리하고, 여기는 WSGI용
+    """
+    if board_type not in BOARD_TYPES:
+        raise Http404
+    if not events_available():
+        return JsonResponse({'error': '실시간 알림을 사용할 수 없습니다.'}, status=503)
+    return event_stream_response(board_channel(board_type))
+
+
+@require_GET
+def post_events(request, pk):
+    """
+    게시글 이벤트 스트림 (SSE) - 새 댓글, 댓글 삭제, 추천 수 변경, 글 삭제
+    ASGI 경로와 같게 글 존재 여부는 확인하지 않음 (없는 글이면 이벤트가 오지 않을 뿐)
+    """
+    if not events_available():
+        return JsonResponse({'error': '실시간 알림을 사용할 수 없습니다.'}, status=503)
+    return event_stream_response(post_channel(pk))
+
+
+def metrics(request):
+    """Prometheus 메트릭 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)"""
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get('Authorization', ''), f'Bearer {settings.METRICS_TOKEN}'
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+
+def health(request):
+    """로드밸런서/컨테이너 헬스체크 (DB, Redis 연결 확인)"""
+    checks = {}
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        checks['db'] = 'ok'
+    except Exception:
+        checks['db'] = 'error'
+    client = get_redis_client()
+    if client is not None:
+        try:
+            client.ping()
+            checks['redis'] = 'ok'
+        except Exception:
+            checks['redis'] = 'error'
+    healthy = all(value == 'ok' for value in checks.values())
+    return JsonResponse(checks, status=200 if healthy else 503)
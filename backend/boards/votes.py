@@ -0,0 +1,307 @@
+import zlib
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+from .caching import bump_post_list_generation
+from .models import Board, Post, Vote, VoteCounterShard
+from .ranking import hot_score, queue_vote, refresh_hot_scores
+
+
+# 투표 추가/취소/변경과 샤드 카운트 반영을 한 문장으로 처리
+# - del: 같은 투표가 이미 있으면 삭제 (취소)
+# - ups: 없으면 INSERT, 반대 투표가 있으면 UPDATE (xmax = 0이면 새로 INSERT된 행)
+# - shard: 카운트 증가분을 투표자 샤드 행에 누적 (Post 행은 건드리지 않음)
+# 데이터 변경 CTE는 같은 스냅샷을 보므로 마지막 SELECT에서 이번 증가분을 직접 더한다.
+VOTE_UPSERT_SQL = """
+WITH del AS (
+    DELETE FROM {vote} v
+    WHERE v.post_id = %(post_id)s AND v.voter_fingerprint = %(fingerprint)s
+      AND v.vote_type = %(vote_type)s
+    RETURNING v.vote_type
+), ups AS (
+    INSERT INTO {vote} (post_id, voter_fingerprint, vote_type, created_at)
+    SELECT %(post_id)s, %(fingerprint)s, %(vote_type)s, now()
+    WHERE NOT EXISTS (SELECT 1 FROM del)
+      -- 게시글 FK 제약이 없으므로 (파티션 테이블) 직접 확인하고 삭제되지 않게 잠금
+      AND EXISTS (SELECT 1 FROM {post} WHERE id = %(post_id)s FOR KEY SHARE)
+    ON CONFLICT (post_id, voter_fingerprint) DO UPDATE
+        SET vote_type = EXCLUDED.vote_type
+        WHERE {vote}.vote_type <> EXCLUDED.vote_type
+    RETURNING (xmax = 0) AS inserted
+), result AS (
+    SELECT CASE
+        WHEN EXISTS (SELECT 1 FROM del) THEN 'cancelled'
+        WHEN EXISTS (SELECT 1 FROM ups WHERE inserted) THEN 'voted'
+        WHEN EXISTS (SELECT 1 FROM ups) THEN 'changed'
+    END AS action
+), delta AS (
+    SELECT
+        COALESCE(action, 'voted') AS action,
+        CASE action
+            WHEN 'cancelled' THEN %(cancel_up)s
+            WHEN 'voted' THEN %(vote_up)s
+            WHEN 'changed' THEN %(change_up)s
+            ELSE 0
+        END AS up,
+        CASE action
+            WHEN 'cancelled' THEN %(cancel_down)s
+            WHEN 'voted' THEN %(vote_down)s
+            WHEN 'changed' THEN %(change_down)s
+            ELSE 0
+        END AS down
+    FROM result
+), shard AS (
+    INSERT INTO {shard} (post_id, shard, upvote_delta, downvote_delta)
+    SELECT %(post_id)s, %(shard)s, up, down FROM delta WHERE up <> 0 OR down <> 0
+    ON CONFLICT (post_id, shard) DO UPDATE
+        SET upvote_delta = {shard}.upvote_delta + EXCLUDED.upvote_delta,
+            downvote_delta = {shard}.downvote_delta + EXCLUDED.downvote_delta
+)
+SELECT
+    d.action,
+    p.upvote_count + COALESCE(s.up, 0) + d.up,
+    p.downvote_count + COALESCE(s.down, 0) + d.down,
+    d.up - d.down,
+    b.board_type,
+    p.created_at
+FROM delta d
+CROSS JOIN {post} p
+JOIN {board} b ON b.id = p.board_id
+LEFT JOIN LATERAL (
+    SELECT SUM(upvote_delta) AS up, SUM(downvote_delta) AS down
+    FROM {shard} WHERE post_id = p.id
+) s ON TRUE
+WHERE p.id = %(post_id)s
+"""
+
+# 샤드를 batch_size개씩 떼어내 Post 카운트에 합산 (다른 fold가 잡은 샤드는 건너뜀)
+FOLD_SQL = """
+WITH folded AS (
+    DELETE FROM {shard}
+    WHERE id IN (
+        SELECT id FROM {shard} ORDER BY id LIMIT %(batch_size)s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING post_id, upvote_delta, downvote_delta
+)
+UPDATE {post} p
+SET upvote_count = p.upvote_count + f.up,
+    downvote_count = p.downvote_count + f.down
+FROM (
+    SELECT post_id, SUM(upvote_delta) AS up, SUM(downvote_delta) AS down
+    FROM folded GROUP BY post_id
+) f
+WHERE p.id = f.post_id
+RETURNING p.id
+"""
+
+# 한 투표자의 투표를 batch_size개 삭제하고 감소분을 투표자 샤드에 누적 (모더레이션 일괄 삭제용)
+# 결과: 게시글별 (post_id, 순추천 증감, 삭제한 투표 수, board_type, created_at)
+REMOVE_VOTES_SQL = """
+WITH del AS (
+    DELETE FROM {vote}
+    WHERE id IN (
+        SELECT id FROM {vote} WHERE voter_fingerprint = %(fingerprint)s
+        ORDER BY id LIMIT %(batch_size)s
+    )
+    RETURNING post_id, vote_type
+), delta AS (
+    SELECT
+        post_id,
+        -COUNT(*) FILTER (WHERE vote_type = 1) AS up,
+        -COUNT(*) FILTER (WHERE vote_type = -1) AS down,
+        COUNT(*) AS removed
+    FROM del GROUP BY post_id
+), shard AS (
+    INSERT INTO {shard} (post_id, shard, upvote_delta, downvote_delta)
+    SELECT post_id, %(shard)s, up, down FROM delta
+    ON CONFLICT (post_id, shard) DO UPDATE
+        SET upvote_delta = {shard}.upvote_delta + EXCLUDED.upvote_delta,
+            downvote_delta = {shard}.downvote_delta + EXCLUDED.downvote_delta
+)
+SELECT d.post_id, d.up - d.down, d.removed, b.board_type, p.created_at
+FROM delta d
+JOIN {post} p ON p.id = d.post_id
+JOIN {board} b ON b.id = p.board_id
+"""
+
+
+# 새 투표 시 (upvote 증가분, downvote 증가분)
+_VOTE_DELTAS = {1: (1, 0), -1: (0, 1)}
+
+
+def _tables():
+    return {
+        'vote': Vote._meta.db_table,
+        'shard': VoteCounterShard._meta.db_table,
+        'post': Post._meta.db_table,
+        'board': Board._meta.db_table,
+    }
+
+
+def get_shard(fingerprint: str) -> int:
+    """투표자 fingerprint로 카운트 샤드 번호 결정"""
+    return zlib.crc32(fingerprint.encode()) % settings.VOTE_COUNTER_SHARDS
+
+
+def cast_vote(post_id: int, fingerprint: str, vote_type: int):
+    """
+    추천/비추천 처리
+    반환값: (action, upvote_count, downvote_count)
+    action은 'voted'(새 투표) / 'changed'(반대로 변경) / 'cancelled'(같은 투표 취소)
+    게시글이 없으면 Post.DoesNotExist
+    """
+    if connection.vendor != 'postgresql':
+        return _cast_vote_orm(post_id, fingerprint, vote_type)
+
+    up, down = _VOTE_DELTAS[vote_type]
+    params = {
+        'post_id': post_id,
+        'fingerprint': fingerprint,
+        'vote_type': vote_type,
+        'shard': get_shard(fingerprint),
+        'vote_up': up,
+        'vote_down': down,
+        'cancel_up': -up,
+        'cancel_down': -down,
+        'change_up': vote_type,
+        'change_down': -vote_type,
+    }
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(VOTE_UPSERT_SQL.format(**_tables()), params)
+        row = cursor.fetchone()
+    if row is None:
+        # 존재하지 않는 게시글 (ups의 EXISTS 조건 때문에 아무것도 쓰지 않음)
+        raise Post.DoesNotExist
+
+    action_taken, upvote_count, downvote_count, net_delta, board_type, created_at = row
+    queue_vote(board_type, post_id, created_at, net_delta)
+    return action_taken, upvote_count, downvote_count
+
+
+def _cast_vote_orm(post_id, fingerprint, vote_type):
+    """PostgreSQL이 아닌 DB(로컬 개발용 SQLite 등)에서 쓰는 ORM 버전"""
+    with transaction.atomic():
+        post = (
+            Post.objects.select_related('board')
+            .select_for_update(of=('self',)).get(pk=post_id)
+        )
+        existing_vote = Vote.objects.filter(
+            post=post,
+            voter_fingerprint=fingerprint
+        ).first()
+
+        up, down = _VOTE_DELTAS[vote_type]
+        if existing_vote and existing_vote.vote_type == vote_type:
+            # 같은 투표 취소
+            existing_vote.delete()
+            up, down = -up, -down
+            action_taken = 'cancelled'
+        elif existing_vote:
+            # 다른 투표로 변경
+            existing_vote.vote_type = vote_type
+            existing_vote.save(update_fields=['vote_type'])
+            up, down = vote_type, -vote_type
+            action_taken = 'changed'
+        else:
+            Vote.objects.create(
+                post=post,
+                voter_fingerprint=fingerprint,
+                vote_type=vote_type
+            )
+            action_taken = 'voted'
+
+        upvote_count = post.upvote_count + up
+        downvote_count = post.downvote_count + down
+        Post.objects.filter(pk=post.pk).update(
+            upvote_count=F('upvote_count') + up,
+            downvote_count=F('downvote_count') + down,
+            hot_score=hot_score(
+                upvote_count, downvote_count, post.comment_count, post.created_at
+            )
+        )
+        bump_post_list_generation(post.board.board_type)
+        queue_vote(post.board.board_type, post.pk, post.created_at, up - down)
+    return action_taken, upvote_count, downvote_count
+
+
+def fold_vote_counts(batch_size: int = 1000):
+    """
+    샤드에 쌓인 증가분을 Post.upvote_count/downvote_count에 합산
+    반환값: 갱신된 게시글 id 목록
+    """
+    if connection.vendor != 'postgresql':
+        return []
+
+    post_ids = []
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(FOLD_SQL.format(**_tables()), {'batch_size': batch_size})
+            folded = [row[0] for row in cursor.fetchall()]
+        if not folded:
+            break
+        post_ids.extend(folded)
+
+    if post_ids:
+        refresh_hot_scores(post_ids)
+        # 추천수가 바뀐 게시판의 목록 캐시 무효화 (추천순/인기순 정렬 반영)
+        board_types = (
+            Post.objects.filter(pk__in=set(post_ids))
+            .order_by().values_list('board__board_type', flat=True).distinct()
+        )
+        bump_post_list_generation(*board_types)
+    return post_ids
+
+
+def remove_votes(fingerprint: str, batch_size: int = 500) -> int:
+    """
+    fingerprint의 투표를 최대 batch_size개 삭제하고 카운트/랭킹에서 빼기 (트랜잭션 하나)
+    PostgreSQL은 감소분을 샤드에 누적(fold_vote_counts가 반영)하므로 Post 행을 잠그지 않음
+    반환값: 삭제한 투표 수 (0이면 더 없음)
+    """
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(REMOVE_VOTES_SQL.format(**_tables()), {
+                'fingerprint': fingerprint,
+                'batch_size': batch_size,
+                'shard': get_shard(fingerprint),
+            })
+            rows = cursor.fetchall()
+    else:
+        rows = _remove_votes_orm(fingerprint, batch_size)
+    removed = 0
+    for post_id, net_delta, count, board_type, created_at in rows:
+        queue_vote(board_type, post_id, created_at, net_delta)
+        removed += count
+    return removed
+
+
+def _remove_votes_orm(fingerprint, batch_size):
+    """PostgreSQL이 아닌 DB용 - Post 카운트를 바로 갱신"""
+    with transaction.atomic():
+        votes = list(
+            Vote.objects.filter(voter_fingerprint=fingerprint)
+            .order_by('id').values_list('id', 'post_id', 'vote_type')[:batch_size]
+        )
+        if not votes:
+            return []
+        Vote.objects.filter(pk__in=[vote_id for vote_id, _, _ in votes]).delete()
+        deltas = {}
+        for _, post_id, vote_type in votes:
+            up, down, count = deltas.get(post_id, (0, 0, 0))
+            vote_up, vote_down = _VOTE_DELTAS[vote_type]
+            deltas[post_id] = (up - vote_up, down - vote_down, count + 1)
+        for post_id, (up, down, _) in deltas.items():
+            Post.objects.filter(pk=post_id).update(
+                upvote_count=F('upvote_count') + up,
+                downvote_count=F('downvote_count') + down,
+            )
+        posts = Post.objects.select_related('board').in_bulk(deltas)
+    refresh_hot_scores(deltas)
+    bump_post_list_generation(*{post.board.board_type for post in posts.values()})
+    return [
+        (post_id, up - down, count, posts[post_id].board.board_type, posts[post_id].created_at)
+        for post_id, (up, down, count) in deltas.items()
+    ]
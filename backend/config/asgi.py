@@ -0,0 +1,11 @@
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+django_application = get_asgi_application()
+
+# SSE 구독(/api/events/)은 Django 핸들러 밖에서 처리 (앱 로딩 이후 import)
+from boards.events import EventStreamMiddleware  # noqa: E402
+
+application = EventStreamMiddleware(django_application)
@@ -23,14 +23,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'boards.instrumentation.RequestMetricsMiddleware',
+    'boards.compression.ResponseCompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
+# 세션/메시지 미들웨어는 쓰지 않아 제외 (ASGI에서는 Django 미들웨어마다 스레드 전환이 생김)
 
 ROOT_URLCONF = 'config.urls'
 
@@ -60,20 +61,56 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'biback2024'),
         'HOST': os.getenv('DB_HOST', 'db'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # 요청마다 새로 연결하지 않고 스레드별 연결을 재사용 (끊긴 연결은 요청 시작 시 점검)
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+        # pgbouncer transaction 모드에서는 서버 사이드 커서(.iterator())를 쓸 수 없음
+        'DISABLE_SERVER_SIDE_CURSORS': os.getenv('DB_PGBOUNCER', 'False') == 'True',
+        'OPTIONS': {
+            'connect_timeout': 5,
+        },
     }
 }
 
+# 읽기 복제본 (DB_REPLICA_HOST 설정 시 목록/상세 조회를 복제본으로, boards/db_router.py)
+if os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('DB_REPLICA_HOST'),
+        'PORT': os.getenv('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['boards.db_router.ReplicaRouter']
+# 쓰기 후 이 시간(초) 동안은 같은 클라이언트의 읽기를 primary로 (복제 지연보다 길게)
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', '10'))
+
 # Redis
+# 연결 풀은 프로세스별로 하나 (gunicorn.conf.py의 WEB_THREADS 기준으로 크기 결정)
+WEB_THREADS = int(os.getenv('WEB_THREADS', '4'))
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', str(max(WEB_THREADS * 2, 10))))
+
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': os.getenv('REDIS_URL', 'redis://redis:6379/0'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Redis 명령 시간을 요청 메트릭에 기록
+            'CONNECTION_POOL_CLASS': 'boards.instrumentation.InstrumentedConnectionPool',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': REDIS_MAX_CONNECTIONS,
+                'health_check_interval': 30,
+                'socket_connect_timeout': 2,
+                'socket_timeout': 2,
+            },
         }
     }
 }
 
+# ASGI(uvicorn 워커)로 실행할 때 읽기 엔드포인트를 async 뷰로 처리 (boards/async_views.py)
+# WSGI에서는 요청마다 이벤트 루프를 새로 만들어 오히려 느려지므로 끔
+ASYNC_READ_VIEWS = os.getenv('ASYNC_READ_VIEWS', 'False') == 'True'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -100,11 +137,75 @@ CORS_ALLOW_CREDENTIALS = True
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # orjson 기반 JSON (DRF JSONRenderer와 같은 바이트), 목록 액션은 MessagePack/columnar 추가 (boards/renderers.py)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'boards.renderers.FastJSONRenderer',
     ],
+    # 비회원제라 인증을 쓰지 않음 (django.contrib.auth 미설치)
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
 }
 
 # Custom settings
 RATE_LIMIT_WINDOW = 60  # 1분
 RATE_LIMIT_MAX_POSTS = 3  # 1분에 최대 3개 글
+
+# 레이트 리밋 정책: (최대 횟수, 윈도우 초)
+RATE_LIMITS = {
+    'post': (RATE_LIMIT_MAX_POSTS, RATE_LIMIT_WINDOW),
+    'comment': (int(os.getenv('RATE_LIMIT_MAX_COMMENTS', '10')), RATE_LIMIT_WINDOW),
+    'vote': (int(os.getenv('RATE_LIMIT_MAX_VOTES', '30')), RATE_LIMIT_WINDOW),
+}
+# 글/댓글 비밀번호 해시 (boards.utils.hash_password, 기존 해시는 저장된 파라미터로 검증)
+PASSWORD_HASHER = {
+    'algorithm': os.getenv('PASSWORD_HASH_ALGORITHM', 'scrypt'),  # scrypt | pbkdf2_sha256
+    'scrypt_n': int(os.getenv('PASSWORD_SCRYPT_N', str(2 ** 14))),
+    'scrypt_r': 8,
+    'scrypt_p': 1,
+    'pbkdf2_iterations': int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', '600000')),
+}
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))  # 프로세스당 동시 KDF 계산 수
+# 작성자/투표자 fingerprint (boards/fingerprints.py)
+FINGERPRINT_MODE = os.getenv('FINGERPRINT_MODE', 'keyed')  # keyed | legacy(예전 SHA-256 단어 1개)
+FINGERPRINT_WORDS = min(max(int(os.getenv('FINGERPRINT_WORDS', '2')), 1), 3)  # keyed 모드 단어 수
+FINGERPRINT_SECRET = os.getenv('FINGERPRINT_SECRET') or SECRET_KEY
+VOTE_COUNTER_SHARDS = 16  # 게시글당 투표 카운트 샤드 수
+# CDN 등 공유 캐시가 게시글 목록을 재검증 없이 쓸 수 있는 시간(초), 상세는 항상 재검증 (boards/conditional.py)
+HTTP_CACHE_LIST_S_MAXAGE = int(os.getenv('HTTP_CACHE_LIST_S_MAXAGE', '5'))
+# 응답 압축 (boards/compression.py): 이보다 작은 본문은 압축하지 않음, 수준은 CPU와 크기의 절충
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '512'))
+RESPONSE_GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', '6'))
+RESPONSE_BROTLI_QUALITY = int(os.getenv('RESPONSE_BROTLI_QUALITY', '4'))
+COMMENT_PAGE_SIZE = 50  # 댓글 목록 한 페이지 크기
+POST_DETAIL_COMMENTS = 50  # 게시글 상세에 포함할 첫 댓글 수
+
+# 요청 메트릭 (/api/metrics/)
+METRICS_SAMPLE_RATE = float(os.getenv('METRICS_SAMPLE_RATE', '1.0' if DEBUG else '0.1'))  # 쿼리/캐시 계측 비율
+METRICS_FLUSH_INTERVAL = 5  # 프로세스 집계값을 Redis에 합산하는 주기(초)
+METRICS_N_PLUS_ONE_THRESHOLD = 5  # 한 요청에서 같은 쿼리가 이 횟수 이상이면 N+1 경고
+METRICS_SLOW_REQUEST_MS = int(os.getenv('METRICS_SLOW_REQUEST_MS', '500'))
+METRICS_SERVER_TIMING = os.getenv('METRICS_SERVER_TIMING', str(DEBUG)) == 'True'
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')  # 설정 시 Authorization: Bearer <토큰> 필요
+
+# 실시간 이벤트 스트림 (/api/events/, boards/events.py)
+EVENTS_HEARTBEAT_INTERVAL = 15  # 이벤트가 없을 때 하트비트 주기(초) - 끊긴 연결도 이 주기로 정리
+EVENTS_STREAM_MAX_AGE = 300  # 스트림 최대 유지 시간(초), 지나면 닫아서 클라이언트가 재연결
+EVENTS_RETRY_MS = 3000  # EventSource 재연결 대기 시간
+EVENTS_QUEUE_SIZE = 100  # 구독자별 대기 이벤트 한도 (넘치면 느린 클라이언트로 보고 연결 종료)
+
+# 쓰기 후속 작업 큐 (boards/tasks.py, 워커: run_tasks)
+TASKS_SYNC = os.getenv('TASKS_SYNC', 'False') == 'True'  # True면 큐 없이 커밋 직후 바로 실행 (테스트용)
+TASKS_MAX_RETRIES = int(os.getenv('TASKS_MAX_RETRIES', '5'))
+TASKS_RETRY_DELAY = float(os.getenv('TASKS_RETRY_DELAY', '1'))  # 첫 재시도 대기(초), 이후 2배씩
+TASKS_IDEMPOTENCY_TTL = 86400  # 멱등 키 보관 시간(초)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'boards': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
@@ -0,0 +1,30 @@
+"""
+프로덕션 서빙 설정 (gunicorn -c gunicorn.conf.py config.wsgi)
+
+워커/스레드 모델
+- 기본은 gthread: CPU 코어당 프로세스 2개 + 1, 프로세스당 스레드 WEB_THREADS개
+  요청 하나가 스레드 하나를 점유하며 DB 연결도 스레드마다 하나씩 유지된다.
+  → 최대 DB 연결 수 = WEB_WORKERS × WEB_THREADS (PostgreSQL max_connections 안에서)
+- WEB_WORKER_CLASS=uvicorn.workers.UvicornWorker + config.asgi:application 으로 ASGI 실행
+  (ASGI에서는 DB_CONN_MAX_AGE=0으로 두고 pgbouncer 등 외부 풀 사용 권장,
+   ASYNC_READ_VIEWS=True로 읽기 엔드포인트를 async 뷰로 처리)
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('WEB_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('WEB_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('WEB_THREADS', '4'))
+
+# 느린 클라이언트/요청이 워커를 오래 잡지 않도록
+timeout = int(os.getenv('WEB_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+# 메모리 누수 대비 주기적 재시작 (동시에 재시작하지 않도록 jitter)
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', '5000'))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.getenv('WEB_ACCESS_LOG', '-') or None
+errorlog = '-'
@@ -62,6 +62,14 @@ export const useApi = () => {
       })
     },
 
+    // 댓글 목록 (커서 페이지네이션)
+    async getComments(postId: number, cursor: string) {
+      const params = new URLSearchParams()
+      params.append('cursor', cursor)
+
+      return await api(`/posts/${postId}/comments/?${params.toString()}`)
+    },
+
     // 댓글 작성
     async createComment(postId: number, data: any) {
       return await api(`/posts/${postId}/comment/`, {